@@ -0,0 +1,119 @@
+"""
+Memory held by a full judgement index load, with and without string interning.
+
+Builds a rii-toc.xml shaped like the real one (a few dozen court panels,
+decision dates spread over two decades, modified timestamps from a few hundred
+export runs), streams it through TocItemParser in network-sized chunks and keeps
+every RIIIndexItem, as iter_judgement_index_items() callers that collect the
+index do. The "not interned" run replaces intern_value with the identity, which
+is how the parsers behaved before. A second pass does the same for parsed
+judgements.
+
+Usage:
+    python benchmarks/bench_interning.py [--items N] [--judgements N]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from unittest.mock import patch
+
+from germanlegaltexts.BaseDownloader import TocItemParser
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.model.Rechtsprechung import Rechtsprechung
+
+COURTS = [f"{court} {senat}. {kind}" for court, kind in [
+    ("BGH", "Zivilsenat"), ("BGH", "Strafsenat"), ("BAG", "Senat"), ("BFH", "Senat"),
+    ("BSG", "Senat"), ("BVerwG", "Senat"), ("BVerfG", "Senat"),
+] for senat in range(1, 13)]
+
+JUDGEMENT_XML = """<dokument>
+  <doknr>JURE{n:09d}</doknr><gertyp>{gertyp}</gertyp><spruchkoerper>{spruchkoerper}</spruchkoerper>
+  <entsch-datum>{datum}</entsch-datum><aktenzeichen>IX ZB {n}/08</aktenzeichen><doktyp>{doktyp}</doktyp>
+  <norm>§ 4 InsO</norm><region><abk>DEU</abk><long>Bundesrepublik Deutschland</long></region>
+  <language>deu</language><publisher>BMJ</publisher><accessRights>public</accessRights>
+  <leitsatz><p>Leitsatz</p></leitsatz><gruende><p>Gründe {n}</p></gruende>
+</dokument>"""
+
+
+def random_date(rng: random.Random) -> str:
+    return f"{rng.randint(2005, 2025)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+
+
+def make_toc(items: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    exports = [f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00.000Z"
+               for _ in range(300)]
+    body = "".join(
+        f"<item><gericht>{rng.choice(COURTS)}</gericht><entsch-datum>{random_date(rng)}</entsch-datum>"
+        f"<aktenzeichen>{rng.randint(1, 12)} AZR {n}/{rng.randint(5, 25):02d}</aktenzeichen>"
+        f"<link>http://www.rechtsprechung-im-internet.de/jportal/docs/bsjrs/jb-JURE{n:09d}.zip</link>"
+        f"<modified>{rng.choice(exports)}</modified></item>"
+        for n in range(items)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><items>{body}</items>'.encode('utf-8')
+
+
+def make_judgements(count: int, seed: int = 0) -> list[bytes]:
+    rng = random.Random(seed)
+    judgements = []
+    for n in range(count):
+        gertyp, spruchkoerper = rng.choice(COURTS).split(" ", 1)
+        judgements.append(JUDGEMENT_XML.format(
+            n=n, gertyp=gertyp, spruchkoerper=spruchkoerper, datum=random_date(rng),
+            doktyp=rng.choice(["Urteil", "Beschluss"])).encode('utf-8'))
+    return judgements
+
+
+def load_index(toc: bytes, chunk_size: int = 64 * 1024) -> list:
+    downloader = GermanJudgementDownloader()
+    parser = TocItemParser()
+    items = []
+    for start in range(0, len(toc), chunk_size):
+        for elem in parser.feed(toc[start:start + chunk_size]):
+            items.append(downloader._index_item_from_element(elem))
+    for elem in parser.close():
+        items.append(downloader._index_item_from_element(elem))
+    return items
+
+
+def retained(build) -> int:
+    """Bytes still allocated by build() once it has returned, i.e. held by its result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def report(label: str, unit: str, count: int, build, target: str) -> None:
+    with patch(target, lambda value: value):
+        before = retained(build)
+    after = retained(build)
+    print(f"{label}: {count} {unit}s")
+    print(f"  not interned  {before / 2**20:8.1f} MiB  {before / count:7.1f} bytes per {unit}")
+    print(f"  interned      {after / 2**20:8.1f} MiB  {after / count:7.1f} bytes per {unit}"
+          f"  ({1 - after / before:.0%} less)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=80_000)
+    parser.add_argument('--judgements', type=int, default=20_000)
+    args = parser.parse_args()
+
+    toc = make_toc(args.items)
+    report("Judgement index", "item", args.items, lambda: load_index(toc),
+           'germanlegaltexts.GermanJudgementDownloader.intern_value')
+
+    judgements = make_judgements(args.judgements)
+    report("Judgements", "judgement", args.judgements,
+           lambda: [Rechtsprechung.from_xml(xml) for xml in judgements],
+           'germanlegaltexts.model.Rechtsprechung.intern_value')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Peak memory of parsing a law book with from_xml() vs. streaming it with iter_norms().
+
+Parses generated law books of growing size from an in-memory zip member, as
+the downloaders do, and consumes each norm without keeping it. The peak
+(tracemalloc) of from_xml() grows with the law book; that of iter_norms()
+stays flat, and its first norm arrives after a fraction of the input.
+
+Usage:
+    python benchmarks/bench_iter_norms.py [--sizes N,N,...]
+"""
+import argparse
+import gc
+import io
+import time
+import tracemalloc
+import zipfile
+
+from bench_lazy_parse import make_law
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
+
+
+def zipped(xml: bytes) -> zipfile.ZipFile:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr("law.xml", xml)
+    return zipfile.ZipFile(archive)
+
+
+def peak(consume, archive: zipfile.ZipFile) -> tuple[int, float]:
+    """Returns the peak memory of consume(member) and the time until it got its first norm."""
+    first = []
+
+    def on_norm(_norm) -> None:
+        if not first:
+            first.append(time.perf_counter())
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with archive.open("law.xml") as member:
+        consume(member, on_norm)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size, first[0] - start
+
+
+def parse_whole(member, on_norm) -> None:
+    for norm in Gesetzbuch.from_xml(member).norms:
+        on_norm(norm)
+
+
+def stream(member, on_norm) -> None:
+    for norm in Gesetzbuch.iter_norms(member):
+        on_norm(norm)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default="500,2000,8000")
+    args = parser.parse_args()
+
+    print(f"{'norms':>7} {'XML':>9}  {'from_xml peak':>14} {'first norm':>11}  {'iter_norms peak':>16} {'first norm':>11}")
+    for norms in map(int, args.sizes.split(',')):
+        xml = make_law(0, norms)
+        archive = zipped(xml)
+        whole, whole_first = peak(parse_whole, archive)
+        streamed, streamed_first = peak(stream, archive)
+        print(f"{norms:>7} {len(xml) / 2**20:>5.1f} MiB  {whole / 2**20:>10.1f} MiB {whole_first * 1e3:>8.0f} ms"
+              f"  {streamed / 2**20:>12.2f} MiB {streamed_first * 1e3:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
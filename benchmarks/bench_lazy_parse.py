@@ -0,0 +1,97 @@
+"""
+Load time and memory of a law book corpus, eager vs. lazy Content parsing.
+
+Uses the law books in data/*.xml if present, otherwise generated ones whose
+norms carry a few paragraphs of text, a list and a footnote, as the real ones
+do. Each variant parses the whole corpus from bytes and keeps the Gesetzbuch
+objects; memory is what they still hold afterwards, including the retained
+<Content> sources in lazy mode. "lazy + 10 lookups" then reads the text of ten
+paragraphs per law book.
+
+Usage:
+    python benchmarks/bench_lazy_parse.py [--data DIR] [--documents N] [--norms N] [--repeat N]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
+
+NORM = (
+    '<norm builddate="20240101" doknr="BJNR{doknr:04d}{i:05d}"><metadaten><jurabk>BenchG</jurabk>'
+    '<enbez>§ {i}</enbez><titel format="parat">Vorschrift {i}</titel></metadaten>'
+    '<textdaten><text format="XML"><Content>{paragraphs}'
+    '<DL Font="normal" Type="arabic"><DT>1.</DT><DD Font="normal"><LA Size="normal">erstens,</LA></DD>'
+    '<DT>2.</DT><DD Font="normal"><LA Size="normal">zweitens.</LA></DD></DL></Content></text>'
+    '<fussnoten><Content><P>(+++ Textnachweis ab: 1.1.2024 +++)</P></Content></fussnoten></textdaten></norm>'
+)
+PARAGRAPH = ('<P>({n}) Wer vorsätzlich oder fahrlässig das Leben, den Körper, die Gesundheit, die Freiheit, '
+             'das Eigentum oder ein sonstiges Recht eines anderen widerrechtlich verletzt, ist dem anderen '
+             'zum Ersatz des daraus entstehenden Schadens verpflichtet.</P>')
+
+
+def make_law(doknr: int, norms: int) -> bytes:
+    paragraphs = "".join(PARAGRAPH.format(n=n) for n in range(1, 4))
+    body = "".join(NORM.format(doknr=doknr, i=i, paragraphs=paragraphs) for i in range(norms))
+    return f'<?xml version="1.0" encoding="UTF-8"?><dokumente builddate="20240101" doknr="BJNR{doknr:04d}">{body}</dokumente>'.encode('utf-8')
+
+
+def measure(build, repeat: int) -> tuple[float, int]:
+    """Returns the best time of build() and the memory its result holds, measured in separate runs."""
+    elapsed = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = build()
+        elapsed = min(elapsed, time.perf_counter() - start)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def lookups(books: list[Gesetzbuch]) -> list[Gesetzbuch]:
+    for book in books:
+        for paragraph in book.get_all_paragraphs()[:10]:
+            norm = book.get_paragraph(paragraph)
+            if norm.textdaten.text and norm.textdaten.text.content:
+                norm.textdaten.text.content.text
+    return books
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', type=Path, default=Path(__file__).parent.parent / 'data')
+    parser.add_argument('--documents', type=int, default=50)
+    parser.add_argument('--norms', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    paths = sorted(args.data.glob('*.xml'))
+    if paths:
+        print(f"Corpus: {len(paths)} law books from {args.data}")
+        sources = [path.read_bytes() for path in paths]
+    else:
+        print(f"Corpus: {args.documents} generated law books with {args.norms} norms each")
+        sources = [make_law(i, args.norms) for i in range(args.documents)]
+    print(f"  {sum(map(len, sources)) / 2**20:.1f} MiB of XML")
+
+    variants = {
+        'eager': lambda: [Gesetzbuch.from_xml(source) for source in sources],
+        'lazy': lambda: [Gesetzbuch.from_xml(source, lazy=True) for source in sources],
+        'lazy + 10 lookups': lambda: lookups([Gesetzbuch.from_xml(source, lazy=True) for source in sources]),
+    }
+    for name, build in variants.items():
+        elapsed, size = measure(build, args.repeat)
+        print(f"  {name:<18} {elapsed * 1e3:8.0f} ms {size / 2**20:8.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
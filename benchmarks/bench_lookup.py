@@ -0,0 +1,52 @@
+"""
+Paragraph lookups per second, linear scan vs. the Gesetzbuch index.
+
+Uses a generated law book about the size of the BGB. The "linear scan" is the
+loop get_paragraph() ran before the index; lookups are spread uniformly over
+all paragraphs and use the unnormalized "§242" spelling half of the time.
+
+Usage:
+    python benchmarks/bench_lookup.py [--norms N] [--lookups N]
+"""
+import argparse
+import random
+import time
+
+from bench_serialization import make_law
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
+
+
+def linear_scan(gesetz: Gesetzbuch, paragraph_number: str):
+    for norm in gesetz.norms:
+        if norm.metadaten.enbez == paragraph_number:
+            return norm
+    return None
+
+
+def rate(lookup, gesetz: Gesetzbuch, queries: list[str]) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        lookup(gesetz, query)
+    return len(queries) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--norms', type=int, default=2500)
+    parser.add_argument('--lookups', type=int, default=20_000)
+    args = parser.parse_args()
+
+    gesetz = Gesetzbuch.from_xml(make_law(0, args.norms))
+    rng = random.Random(0)
+    queries = [rng.choice(["§ {}", "§{}"]).format(rng.randrange(args.norms)) for _ in range(args.lookups)]
+    exact = [query if query.startswith("§ ") else query.replace("§", "§ ") for query in queries]
+
+    start = time.perf_counter()
+    gesetz._index()
+    print(f"Law book with {args.norms} norms, index built in {(time.perf_counter() - start) * 1e3:.2f} ms")
+    print(f"  linear scan      {rate(linear_scan, gesetz, exact):12,.0f} lookups/s")
+    print(f"  get_paragraph    {rate(Gesetzbuch.get_paragraph, gesetz, queries):12,.0f} lookups/s")
+
+
+if __name__ == '__main__':
+    main()
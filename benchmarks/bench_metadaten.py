@@ -0,0 +1,120 @@
+"""
+Norms per second parsed with the single-pass Metadaten parser vs. the find()-based one.
+
+The "find()" variant is the metadata extraction Gesetzbuch.from_xml used
+before Metadaten.from_element: a find() and a findtext() per field. Reports
+the metadata extraction alone, over already parsed <metadaten> elements, and
+the whole from_xml(), eager and lazy. Uses the law books in data/*.xml if
+present, otherwise generated ones.
+
+Usage:
+    python benchmarks/bench_metadaten.py [--data DIR] [--documents N] [--norms N] [--repeat N]
+"""
+import argparse
+import statistics
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import patch
+
+from bench_serialization import make_law
+from germanlegaltexts.model.Gesetzbuch import Fundstelle, Gesetzbuch, Metadaten, Standangabe
+from germanlegaltexts.model.Interning import intern_value
+
+
+def legacy_metadaten(metadaten_elem: ET.Element) -> Metadaten:
+    """The find()-based metadata extraction that Metadaten.from_element replaced."""
+    metadaten = Metadaten(jurabk=intern_value(metadaten_elem.findtext('jurabk') or ""))
+    if metadaten_elem.find('amtabk') is not None:
+        metadaten.amtabk = intern_value(metadaten_elem.findtext('amtabk'))
+
+    if metadaten_elem.find('ausfertigung-datum') is not None:
+        metadaten.ausfertigung_datum = metadaten_elem.findtext('ausfertigung-datum')
+
+    if metadaten_elem.find('kurzue') is not None:
+        metadaten.kurzue = metadaten_elem.findtext('kurzue')
+
+    if metadaten_elem.find('langue') is not None:
+        metadaten.langue = metadaten_elem.findtext('langue')
+
+    if metadaten_elem.find('enbez') is not None:
+        metadaten.enbez = metadaten_elem.findtext('enbez')
+
+    if metadaten_elem.find('titel') is not None:
+        metadaten.titel = metadaten_elem.findtext('titel')
+        titel_elem = metadaten_elem.find('titel')
+        if titel_elem is not None and 'format' in titel_elem.attrib:
+            metadaten.titel_format = intern_value(titel_elem.get('format'))
+
+    fundstelle_elem = metadaten_elem.find('fundstelle')
+    if fundstelle_elem is not None:
+        fundstelle = Fundstelle(
+            typ=intern_value(fundstelle_elem.get('typ', "")),
+            periodikum=intern_value(fundstelle_elem.findtext('periodikum')),
+            zitstelle=fundstelle_elem.findtext('zitstelle')
+        )
+        metadaten.fundstelle = fundstelle
+
+    standangabe_elem = metadaten_elem.find('standangabe')
+    if standangabe_elem is not None:
+        standangabe = Standangabe(
+            checked=intern_value(standangabe_elem.get('checked', "")),
+            standtyp=intern_value(standangabe_elem.findtext('standtyp') or ""),
+            standkommentar=standangabe_elem.findtext('standkommentar')
+        )
+        metadaten.standangabe = standangabe
+    gliederungseinheit_elem = metadaten_elem.find('gliederungseinheit')
+    if gliederungseinheit_elem is not None:
+        gliederungseinheit = {}
+        for child in gliederungseinheit_elem:
+            gliederungseinheit[intern_value(child.tag)] = child.text
+        metadaten.gliederungseinheit = gliederungseinheit
+    return metadaten
+
+
+def rate(function, inputs: list, count: int, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in inputs:
+            function(value)
+        runs.append(time.perf_counter() - start)
+    return count / statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', type=Path, default=Path(__file__).parent.parent / 'data')
+    parser.add_argument('--documents', type=int, default=50)
+    parser.add_argument('--norms', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    paths = sorted(args.data.glob('*.xml'))
+    if paths:
+        print(f"Corpus: {len(paths)} law books from {args.data}")
+        sources = [path.read_bytes() for path in paths]
+    else:
+        print(f"Corpus: {args.documents} generated law books with {args.norms} norms each")
+        sources = [make_law(i, args.norms).encode('utf-8') for i in range(args.documents)]
+    elements = [element for source in sources for element in ET.fromstring(source).iter('metadaten')]
+    count = len(elements)
+
+    print("\nMetadata extraction")
+    before = rate(legacy_metadaten, elements, count, args.repeat)
+    after = rate(Metadaten.from_element, elements, count, args.repeat)
+    print(f"  find()         {before:12,.0f} norms/s")
+    print(f"  single pass    {after:12,.0f} norms/s  ({after / before:.2f}x)")
+
+    for label, parse in [("Gesetzbuch.from_xml", Gesetzbuch.from_xml),
+                         ("Gesetzbuch.from_xml(lazy=True)", lambda source: Gesetzbuch.from_xml(source, lazy=True))]:
+        print(f"\n{label}")
+        with patch.object(Metadaten, 'from_element', staticmethod(legacy_metadaten)):
+            before = rate(parse, sources, count, args.repeat)
+        after = rate(parse, sources, count, args.repeat)
+        print(f"  find()         {before:12,.0f} norms/s")
+        print(f"  single pass    {after:12,.0f} norms/s  ({after / before:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
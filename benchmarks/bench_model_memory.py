@@ -0,0 +1,84 @@
+"""
+Memory held by the parsed model objects, slotted vs. with a per-instance __dict__.
+
+The "dict" variant rebuilds the same object tree from plain dataclasses with
+the same fields but without __slots__, i.e. the model classes as they were
+before they were slotted. Strings are shared between both trees, so the
+numbers are the overhead of the objects themselves: instances, lists and
+dicts. Uses the law books in data/*.xml if present, otherwise generated ones.
+
+Usage:
+    python benchmarks/bench_model_memory.py [--data DIR] [--documents N] [--norms N] [--judgements N]
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import fields, is_dataclass, make_dataclass
+from pathlib import Path
+
+from bench_serialization import load_corpus
+from germanlegaltexts.model.Rechtsprechung import Rechtsprechung
+
+JUDGEMENT_XML = """<dokument>
+  <doknr>JURE{n:09d}</doknr><gertyp>BGH</gertyp><spruchkoerper>9. Zivilsenat</spruchkoerper>
+  <entsch-datum>20100114</entsch-datum><aktenzeichen>IX ZB {n}/08</aktenzeichen><doktyp>Beschluss</doktyp>
+  <norm>§ 4 InsO, § 13 ZPO</norm><region><abk>DEU</abk><long>Bundesrepublik Deutschland</long></region>
+  <titelzeile><p>Titel</p></titelzeile><leitsatz><p>Leitsatz</p></leitsatz><tenor><p>Tenor</p></tenor>
+  <gruende><p>Gründe {n}</p></gruende>
+</dokument>"""
+
+_plain_classes: dict[type, type] = {}
+
+
+def plain_class(cls: type) -> type:
+    if cls not in _plain_classes:
+        _plain_classes[cls] = make_dataclass(cls.__name__, [f.name for f in fields(cls)])
+    return _plain_classes[cls]
+
+
+def rebuild(obj, slotted: bool):
+    """Copies the object tree, sharing the leaf values."""
+    if is_dataclass(obj):
+        cls = type(obj) if slotted else plain_class(type(obj))
+        return cls(*[rebuild(getattr(obj, f.name), slotted) for f in fields(obj)])
+    if isinstance(obj, list):
+        return [rebuild(value, slotted) for value in obj]
+    if isinstance(obj, dict):
+        return dict(obj)
+    return obj
+
+
+def allocated(build) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def report(label: str, unit: str, count: int, objects: list) -> None:
+    before, _ = allocated(lambda: [rebuild(obj, slotted=False) for obj in objects])
+    after, _ = allocated(lambda: [rebuild(obj, slotted=True) for obj in objects])
+    print(f"{label}: {count} {unit}s")
+    print(f"  with __dict__  {before / count:8.1f} bytes per {unit}")
+    print(f"  slotted        {after / count:8.1f} bytes per {unit}  ({1 - after / before:.0%} less)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', type=Path, default=Path(__file__).parent.parent / 'data')
+    parser.add_argument('--documents', type=int, default=50)
+    parser.add_argument('--norms', type=int, default=300)
+    parser.add_argument('--judgements', type=int, default=5000)
+    args = parser.parse_args()
+
+    books = load_corpus(args.data, args.documents, args.norms)
+    report("Law books", "norm", sum(len(book.norms) for book in books), books)
+
+    judgements = [Rechtsprechung.from_xml(JUDGEMENT_XML.format(n=n)) for n in range(args.judgements)]
+    report("Judgements", "judgement", len(judgements), judgements)
+
+
+if __name__ == '__main__':
+    main()
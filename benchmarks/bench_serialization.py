@@ -0,0 +1,94 @@
+"""
+Encode/decode cost of the model codecs compared with dataclasses.asdict and pickle.
+
+Uses the law books in data/*.xml (the test corpus) if present, otherwise
+generated law books. Reports time per law book and the pickled size of each
+representation.
+
+Usage:
+    python benchmarks/bench_serialization.py [--data DIR] [--documents N] [--norms N] [--repeat N]
+"""
+import argparse
+import pickle
+import statistics
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
+
+
+def make_law(doknr: int, norms: int) -> str:
+    body = "".join(
+        f'<norm builddate="20240101" doknr="BJNR{doknr:04d}{i:05d}"><metadaten><jurabk>BenchG</jurabk>'
+        f'<enbez>§ {i}</enbez><titel format="parat">Vorschrift {i}</titel>'
+        f'<gliederungseinheit><gliederungskennzahl>{i // 10:03d}</gliederungskennzahl>'
+        f'<gliederungsbez>Abschnitt {i // 10}</gliederungsbez></gliederungseinheit></metadaten>'
+        f'<textdaten><text format="XML"><Content><P>Absatz {i} mit etwas Text, der ungefähr die Länge '
+        f'einer Vorschrift hat.</P></Content></text></textdaten></norm>'
+        for i in range(norms)
+    )
+    return f'<dokumente builddate="20240101" doknr="BJNR{doknr:04d}">{body}</dokumente>'
+
+
+def load_corpus(data_dir: Path, documents: int, norms: int) -> list[Gesetzbuch]:
+    paths = sorted(data_dir.glob('*.xml'))
+    if paths:
+        print(f"Corpus: {len(paths)} law books from {data_dir}")
+        return [Gesetzbuch.from_xml(path.read_bytes()) for path in paths]
+    print(f"Corpus: {documents} generated law books with {norms} norms each")
+    return [Gesetzbuch.from_xml(make_law(i, norms)) for i in range(documents)]
+
+
+def per_document(books: list, function, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for book in books:
+            function(book)
+        runs.append((time.perf_counter() - start) / len(books))
+    return statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', type=Path, default=Path(__file__).parent.parent / 'data')
+    parser.add_argument('--documents', type=int, default=50)
+    parser.add_argument('--norms', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    books = load_corpus(args.data, args.documents, args.norms)
+    dicts = [book.to_dict() for book in books]
+    tuples = [book.to_tuple() for book in books]
+    pickled_objects = [pickle.dumps(book, protocol=pickle.HIGHEST_PROTOCOL) for book in books]
+    pickled_tuples = [pickle.dumps(t, protocol=pickle.HIGHEST_PROTOCOL) for t in tuples]
+
+    encode = {
+        'dataclasses.asdict': asdict,
+        'to_dict': Gesetzbuch.to_dict,
+        'to_tuple': Gesetzbuch.to_tuple,
+        'pickle.dumps(book)': lambda book: pickle.dumps(book, protocol=pickle.HIGHEST_PROTOCOL),
+        'pickle.dumps(to_tuple)': lambda book: pickle.dumps(book.to_tuple(), protocol=pickle.HIGHEST_PROTOCOL),
+    }
+    print("\nEncode, per law book")
+    for name, function in encode.items():
+        print(f"  {name:<26} {per_document(books, function, args.repeat) * 1e6:9.1f} µs")
+
+    decode = {
+        'from_dict': (dicts, Gesetzbuch.from_dict),
+        'from_tuple': (tuples, Gesetzbuch.from_tuple),
+        'pickle.loads(book)': (pickled_objects, pickle.loads),
+        'from_tuple(pickle.loads)': (pickled_tuples, lambda data: Gesetzbuch.from_tuple(pickle.loads(data))),
+    }
+    print("\nDecode, per law book")
+    for name, (inputs, function) in decode.items():
+        print(f"  {name:<26} {per_document(inputs, function, args.repeat) * 1e6:9.1f} µs")
+
+    print("\nPickled size, per law book")
+    print(f"  {'book':<26} {statistics.mean(map(len, pickled_objects)) / 1024:9.1f} KiB")
+    print(f"  {'to_tuple()':<26} {statistics.mean(map(len, pickled_tuples)) / 1024:9.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Per-document overhead of reading the XML out of a downloaded xml.zip.
+
+Compares the former approach of the synchronous downloaders (extract the archive
+into a TemporaryDirectory, glob for *.xml and read the file back) with the
+in-memory zip handling shared by all download paths now. No network access is
+involved; the archives are generated locally.
+
+Usage:
+    python benchmarks/bench_zip_extraction.py [--documents N] [--norms N] [--tmpdir PATH]
+
+Pass --tmpdir to place the temporary directories on a specific file system,
+e.g. network storage, where the difference is largest.
+"""
+import argparse
+import io
+import statistics
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from germanlegaltexts.BaseDownloader import open_zipped_xml
+
+
+def make_archive(norms: int) -> bytes:
+    body = "".join(
+        f'<norm builddate="20240101" doknr="BJNR{i:09d}"><metadaten><jurabk>BenchG</jurabk>'
+        f'<enbez>§ {i}</enbez></metadaten><textdaten><text format="XML"><Content>'
+        f'<P>Absatz {i} mit etwas Text, der ungefähr die Länge einer Vorschrift hat.</P>'
+        f'</Content></text></textdaten></norm>'
+        for i in range(norms)
+    )
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><dokumente builddate="20240101" doknr="BJNR0">{body}</dokumente>'
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr("BJNR0.xml", xml)
+    return buf.getvalue()
+
+
+def read_via_tempdir(content: bytes, tmp_root: str | None) -> str:
+    """The extraction code the sync downloaders used before."""
+    with tempfile.TemporaryDirectory(dir=tmp_root) as tmpdir:
+        with zipfile.ZipFile(io.BytesIO(content)) as z:
+            z.extractall(tmpdir)
+        xml_files = [*Path(tmpdir).glob('*.xml')]
+        if len(xml_files) != 1:
+            raise RuntimeError(f"Expected 1 XML file, found {len(xml_files)}")
+        with open(Path(tmpdir) / xml_files[0], 'rb') as xml_file:
+            return xml_file.read().decode('utf-8')
+
+
+def read_in_memory(content: bytes) -> str:
+    with open_zipped_xml(content) as xml_file:
+        return xml_file.read().decode('utf-8')
+
+
+def measure(read, archive: bytes, documents: int) -> list[float]:
+    timings = []
+    for _ in range(documents):
+        start = time.perf_counter()
+        read(archive)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=500, help="Archives to read per variant")
+    parser.add_argument('--norms', type=int, default=50, help="Norms per generated law book")
+    parser.add_argument('--tmpdir', default=None, help="Directory for the temporary extraction")
+    args = parser.parse_args()
+
+    archive = make_archive(args.norms)
+    assert read_via_tempdir(archive, args.tmpdir) == read_in_memory(archive)
+    print(f"{args.documents} documents, archive {len(archive) / 1024:.1f} KiB")
+
+    results = {
+        'tempdir + extractall': measure(lambda c: read_via_tempdir(c, args.tmpdir), archive, args.documents),
+        'in-memory zip': measure(read_in_memory, archive, args.documents),
+    }
+    for name, timings in results.items():
+        print(f"{name:>22}: median {statistics.median(timings) * 1e6:8.1f} µs/doc, "
+              f"total {sum(timings):.3f} s")
+    before, after = (statistics.median(t) for t in results.values())
+    print(f"{'speedup':>22}: {before / after:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
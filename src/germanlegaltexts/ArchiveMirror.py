@@ -0,0 +1,143 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class ArchiveMirror:
+    """
+    Content-addressed local copy of the raw xml.zip archives and TOC files.
+
+    Every body is stored once under objects/ by its SHA-256; refs/ maps each URL
+    to the hash of its latest body. A URL whose content changes upstream gets a
+    new object and its ref is moved, so an identical body fetched under several
+    URLs or re-downloaded unchanged is not stored twice. All files are written
+    to a temporary file first and renamed into place, so readers never see a
+    partial object and concurrent writers don't corrupt each other.
+    """
+
+    def __init__(self, directory: str | Path):
+        """
+        Args:
+            directory: Directory of the mirror. Created if missing.
+        """
+        self.directory = Path(directory).expanduser()
+        self._objects = self.directory / 'objects'
+        self._refs = self.directory / 'refs'
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._refs.mkdir(parents=True, exist_ok=True)
+
+    def _ref_path(self, url: str) -> Path:
+        return self._refs / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _object_path(self, sha256: str) -> Path:
+        return self._objects / sha256[:2] / sha256
+
+    def __contains__(self, url: str) -> bool:
+        return self.sha256(url) is not None
+
+    def sha256(self, url: str) -> str | None:
+        """Returns the hash of the mirrored body of a URL, or None if the URL is not mirrored."""
+        try:
+            with open(self._ref_path(url), 'r', encoding='utf-8') as f:
+                sha256 = json.load(f)['sha256']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+        return sha256 if self._object_path(sha256).exists() else None
+
+    def urls(self) -> list[str]:
+        """Returns all mirrored URLs."""
+        urls = []
+        for ref_path in self._refs.glob('*.json'):
+            try:
+                with open(ref_path, 'r', encoding='utf-8') as f:
+                    urls.append(json.load(f)['url'])
+            except (json.JSONDecodeError, KeyError):
+                continue
+        return urls
+
+    def open(self, url: str) -> BinaryIO:
+        """
+        Opens the mirrored body of a URL.
+
+        Raises:
+            LookupError: If the URL is not mirrored
+        """
+        sha256 = self.sha256(url)
+        if sha256 is None:
+            raise LookupError(f"{url} is not in the mirror at {self.directory}")
+        return open(self._object_path(sha256), 'rb')
+
+    def read(self, url: str) -> bytes:
+        """
+        Returns the mirrored body of a URL.
+
+        Raises:
+            LookupError: If the URL is not mirrored
+        """
+        with self.open(url) as f:
+            return f.read()
+
+    def store(self, url: str, content: bytes) -> str:
+        """
+        Mirrors a downloaded body.
+
+        Args:
+            url: The URL the body was downloaded from
+            content: The body
+
+        Returns:
+            The SHA-256 of the body
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(sha256)
+        if not object_path.exists():
+            object_path.parent.mkdir(exist_ok=True)
+            self._write_atomic(object_path, lambda f: f.write(content))
+        self._update_ref(url, sha256)
+        return sha256
+
+    def store_file(self, url: str, file: BinaryIO) -> str:
+        """
+        Mirrors a downloaded body from a seekable file, e.g. a spooled archive.
+        The whole file is copied and rewound afterwards.
+
+        Args:
+            url: The URL the body was downloaded from
+            file: The body
+
+        Returns:
+            The SHA-256 of the body
+        """
+        file.seek(0)
+        sha256 = hashlib.file_digest(file, 'sha256').hexdigest()
+        object_path = self._object_path(sha256)
+        if not object_path.exists():
+            object_path.parent.mkdir(exist_ok=True)
+            file.seek(0)
+            self._write_atomic(object_path, lambda f: shutil.copyfileobj(file, f))
+        file.seek(0)
+        self._update_ref(url, sha256)
+        return sha256
+
+    def _update_ref(self, url: str, sha256: str) -> None:
+        ref = json.dumps({'url': url, 'sha256': sha256}).encode('utf-8')
+        self._write_atomic(self._ref_path(url), lambda f: f.write(ref))
+        logger.debug(f"Mirrored {url} as {sha256}")
+
+    def _write_atomic(self, path: Path, write) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
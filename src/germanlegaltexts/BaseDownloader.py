@@ -0,0 +1,686 @@
+import asyncio
+import hashlib
+import io
+import logging
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import aclosing, asynccontextmanager, contextmanager, nullcontext
+from functools import partial
+from itertools import count
+from typing import IO, BinaryIO, TypeVar
+
+import httpx
+
+from .ArchiveMirror import ArchiveMirror
+from .CrawlJournal import CrawlJournal
+from .DownloadPipeline import DownloadPipeline, _aiterate, parse_in_executor
+from .DownloadReport import DownloadReport
+from .HttpCache import HttpCache
+from .ParsedCache import ParsedCache, root_cache_key
+from .RateLimiter import RateLimiter, parse_retry_after
+from .RetryPolicy import RetryPolicy
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+DEFAULT_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0)
+
+
+@contextmanager
+def open_zipped_xml(archive: bytes | BinaryIO) -> Iterator[IO[bytes]]:
+    """
+    Opens the single XML file of an xml.zip archive as a binary stream.
+
+    The member is decompressed while it is read, so it can be handed straight to
+    Gesetzbuch.from_xml() or Rechtsprechung.from_xml() without extracting it.
+
+    Args:
+        archive: The zip archive as bytes or a seekable binary file object
+
+    Yields:
+        The open XML member
+
+    Raises:
+        RuntimeError: If the archive does not contain exactly one XML file
+    """
+    if isinstance(archive, (bytes, bytearray, memoryview)):
+        archive = io.BytesIO(archive)
+    with zipfile.ZipFile(archive) as z:
+        xml_files = [f for f in z.namelist() if f.endswith('.xml')]
+        if len(xml_files) != 1:
+            raise RuntimeError(f"Expected 1 XML file, found {len(xml_files)}")
+        with z.open(xml_files[0]) as member:
+            yield member
+
+
+def archive_sha256(archive: bytes | BinaryIO) -> str:
+    """Returns the SHA-256 of a downloaded archive. A file is rewound afterwards."""
+    if isinstance(archive, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(archive).hexdigest()
+    digest = hashlib.file_digest(archive, 'sha256').hexdigest()
+    archive.seek(0)
+    return digest
+
+
+def parse_zipped_xml(parse: Callable[[IO[bytes]], R], archive: bytes | BinaryIO) -> R:
+    """Parses the single XML file of an xml.zip archive from its decompressing stream."""
+    with open_zipped_xml(archive) as member:
+        return parse(member)
+
+
+def parse_zipped_xml_cached(cache: ParsedCache, cache_key: tuple[str, str] | None,
+                            parse: Callable[[IO[bytes]], R], archive: bytes | BinaryIO) -> R:
+    """
+    parse_zipped_xml() through a ParsedCache. Without a cache_key, the doknr and
+    builddate are read from the root of the zipped XML.
+    """
+    if cache_key is None:
+        with open_zipped_xml(archive) as member:
+            cache_key = root_cache_key(member)
+        if cache_key is None:
+            return parse_zipped_xml(parse, archive)
+    return cache.load_or_parse(*cache_key, lambda: parse_zipped_xml(parse, archive))
+
+
+class TocItemParser:
+    """
+    Incremental parser for the gii-toc.xml and rii-toc.xml indexes.
+
+    Bytes are fed in as they arrive and every completed <item> element is handed
+    out once. Items are cleared and detached from the root after the caller has
+    moved on, so memory stays bounded by a single item instead of the whole index.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._root: ET.Element | None = None
+
+    def feed(self, data: bytes) -> Iterator[ET.Element]:
+        self._parser.feed(data)
+        return self._read_items()
+
+    def close(self) -> Iterator[ET.Element]:
+        self._parser.close()
+        return self._read_items()
+
+    def _read_items(self) -> Iterator[ET.Element]:
+        for event, elem in self._parser.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._root = elem
+            elif elem.tag == 'item':
+                yield elem
+                elem.clear()
+                self._root.clear()
+
+
+class BaseDownloader:
+    """HTTP handling shared by GermanLawDownloader and GermanJudgementDownloader."""
+
+    base_url: str
+
+    def __init__(self, cache: HttpCache | None = None, spool_threshold: int | None = None,
+                 limits: httpx.Limits | None = None, http2: bool = False,
+                 timeout: httpx.Timeout = DEFAULT_TIMEOUT, rate_limiter: RateLimiter | None = None,
+                 retry: RetryPolicy | None = None, mirror: ArchiveMirror | None = None,
+                 offline: bool = False, parsed_cache: ParsedCache | None = None):
+        """
+        Args:
+            cache: Optional on-disk HTTP cache. Cached responses are revalidated
+                   with conditional requests and served from disk on 304.
+            spool_threshold: If set, the async downloaders stream each archive into a
+                   SpooledTemporaryFile instead of buffering the whole response: up to
+                   this many bytes are kept in memory, larger archives roll over to
+                   disk. Ignored when a cache is configured, since the cache needs the
+                   complete body anyway.
+            limits: Connection pool limits (max connections, keep-alive connections
+                   and keep-alive expiry) of the clients. Defaults to httpx's limits.
+            http2: Negotiate HTTP/2 where the server supports it. Requires the
+                   http2 extra (pip install germanlegaltexts[http2]).
+            timeout: Timeouts of the clients.
+            rate_limiter: Optional RateLimiter that paces the batch downloads. It can
+                   be shared between downloaders and threads; every response is fed
+                   back into it so it adapts to 429/5xx answers, Retry-After and latency.
+                   When set, it replaces the max_per_second option of the batch methods.
+            retry: Optional RetryPolicy for transient failures (retryable status codes
+                   and transport errors) of individual requests. Without it every
+                   request is tried once.
+            mirror: Optional ArchiveMirror that keeps a copy of every downloaded
+                   archive and TOC file.
+            offline: Read everything from the mirror instead of the network. Batch
+                   methods then ignore rate limits, so re-parsing a mirrored corpus
+                   is bound by disk and CPU only.
+            parsed_cache: Optional ParsedCache of parsed law books and judgements.
+                   A law book whose doknr and builddate are unchanged, or a judgement
+                   whose index entry has the same modified timestamp, is loaded from
+                   it instead of being parsed again.
+
+        Raises:
+            ValueError: If offline is set without a mirror
+            ImportError: If http2 is requested but the h2 package is not installed
+        """
+        if spool_threshold is not None and spool_threshold < 0:
+            raise ValueError("spool_threshold must not be negative")
+        if offline and mirror is None:
+            raise ValueError("offline mode requires a mirror")
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError("HTTP/2 support requires the http2 extra: pip install germanlegaltexts[http2]")
+        self.cache = cache
+        self.spool_threshold = spool_threshold
+        self.limits = limits if limits is not None else httpx.Limits()
+        self.http2 = http2
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.mirror = mirror
+        self.offline = offline
+        self.parsed_cache = parsed_cache
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._owns_sync_client = False
+
+    def __enter__(self):
+        """
+        Opens a session: all sync methods share one pooled httpx.Client with
+        keep-alive connections until the block exits.
+        """
+        if self._client is not None:
+            raise RuntimeError("The downloader session is already open")
+        self._client = httpx.Client(limits=self.limits, http2=self.http2, timeout=self.timeout,
+                                    follow_redirects=True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        client, self._client = self._client, None
+        client.close()
+
+    async def __aenter__(self):
+        """
+        Opens an async session: all async iterators share one pooled
+        httpx.AsyncClient until the block exits. The sync methods share a pooled
+        httpx.Client for the same duration.
+        """
+        if self._async_client is not None:
+            raise RuntimeError("The downloader session is already open")
+        self._async_client = self._new_async_client()
+        await self._async_client.__aenter__()
+        self._owns_sync_client = self._client is None
+        if self._owns_sync_client:
+            self.__enter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        client, self._async_client = self._async_client, None
+        try:
+            await client.__aexit__(exc_type, exc_value, traceback)
+        finally:
+            if self._owns_sync_client:
+                self.__exit__(exc_type, exc_value, traceback)
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(limits=self.limits, http2=self.http2, timeout=self.timeout,
+                                 follow_redirects=True)
+
+    @asynccontextmanager
+    async def _async_session(self) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """
+        Yields the session's AsyncClient, or a client for this call only if no
+        async session is open.
+        """
+        if self._async_client is not None:
+            yield self._async_client
+            return
+        async with self._new_async_client() as client:
+            yield client
+
+    def _worker_session(self, workers: int | None):
+        """
+        Opens a session for a download run with workers unless one is already open,
+        so the index request and all worker threads share one connection pool.
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if workers is None or self._client is not None:
+            return nullcontext()
+        return self
+
+    def _download_each(self, items: Iterable[T], download: Callable[[T], R], describe: Callable[[T], str],
+                       workers: int | None = None,
+                       max_per_second: float | None = None,
+                       report: DownloadReport[T] | None = None) -> Generator[tuple[T, R | None], None, None]:
+        """
+        Runs download(item) for every item and yields (item, result) in index order.
+
+        A failed download is logged, recorded in the report and yields None as its result. With workers,
+        downloads and parsing run on a thread pool of that size; the threads share
+        one rate limit (the downloader's rate_limiter, or max_per_second started
+        downloads) and, inside _worker_session(), one connection pool.
+        """
+        limiter = self.rate_limiter
+        if self.offline:
+            limiter = None
+        elif limiter is None and max_per_second is not None:
+            limiter = RateLimiter(max_per_second, adaptive=False)
+
+        def run(item: T) -> R:
+            if limiter is not None:
+                limiter.acquire()
+            return download(item)
+
+        if workers is None:
+            for item in items:
+                yield item, self._download_result(item, lambda: run(item), describe, report)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='germanlegaltexts-download') as pool:
+            # Submit a bounded window ahead of the consumer so results don't pile up
+            pending: deque[tuple[T, Future]] = deque()
+            try:
+                for item in items:
+                    pending.append((item, pool.submit(run, item)))
+                    if len(pending) >= 2 * workers:
+                        item, future = pending.popleft()
+                        yield item, self._download_result(item, future.result, describe, report)
+                while pending:
+                    item, future = pending.popleft()
+                    yield item, self._download_result(item, future.result, describe, report)
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _download_result(self, item: T, result: Callable[[], R], describe: Callable[[T], str],
+                         report: DownloadReport[T] | None) -> R | None:
+        try:
+            value = result()
+        except Exception as e:
+            logger.warning(f"Failed to download {describe(item)}: {str(e)}")
+            if report is not None:
+                report.record_failure(item, e)
+            return None
+        if report is not None:
+            report.record_success()
+        return value
+
+    def _send_get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        for attempt in count(1):
+            started = time.monotonic()
+            try:
+                if self._client is not None:
+                    response = self._client.get(url, headers=headers)
+                else:
+                    response = httpx.get(url, follow_redirects=True, headers=headers)
+            except Exception as e:
+                delay = self._retry_delay(url, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                self._record_response(response, started)
+                delay = self._retry_delay(url, attempt, response=response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+    async def _send_get_async(self, client: httpx.AsyncClient, url: str,
+                              headers: dict[str, str] | None = None) -> httpx.Response:
+        for attempt in count(1):
+            started = time.monotonic()
+            try:
+                response = await client.get(url, headers=headers)
+            except Exception as e:
+                delay = self._retry_delay(url, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                self._record_response(response, started)
+                delay = self._retry_delay(url, attempt, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await self._wait_for_retry_async(delay)
+
+    def _retry_delay(self, url: str, attempt: int, response: httpx.Response | None = None,
+                     error: Exception | None = None) -> float | None:
+        """
+        Decides whether a failed attempt is retried.
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+            (or, for a response, to accept it)
+        """
+        if self.retry is None:
+            return None
+        status_code = response.status_code if response is not None else None
+        if not self.retry.should_retry(attempt, status_code, error):
+            return None
+        retry_after = parse_retry_after(response.headers.get('retry-after')) if response is not None else None
+        delay = self.retry.delay(attempt, retry_after)
+        reason = f"HTTP {status_code}" if response is not None else f"{type(error).__name__}: {str(error)}"
+        logger.info(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 1}/{self.retry.max_attempts}) after {reason}")
+        return delay
+
+    async def _wait_for_retry_async(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
+    def _record_response(self, response: httpx.Response, started: float) -> None:
+        """Feeds the status, latency and Retry-After of a response back into the rate limiter."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_response(response.status_code, time.monotonic() - started,
+                                          response.headers.get('retry-after'))
+
+    def _pipeline(self, max_per_second: float | None, max_in_flight: int,
+                  buffer_size: int | None) -> DownloadPipeline:
+        """Builds the pipeline of an async batch method. Offline, downloads are not paced."""
+        if self.offline:
+            return DownloadPipeline(None, max_in_flight, buffer_size)
+        return DownloadPipeline(max_per_second, max_in_flight, buffer_size, self.rate_limiter)
+
+    def _mirrored_response(self, url: str, content: bytes) -> httpx.Response:
+        return httpx.Response(200, content=content, request=httpx.Request('GET', url))
+
+    def _get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """
+        GET a URL from the mirror when offline, otherwise from the network and,
+        if a mirror is configured, store a successful response in it.
+
+        Raises:
+            LookupError: If offline and the URL is not mirrored
+        """
+        if self.offline:
+            return self._mirrored_response(url, self.mirror.read(url))
+        response = self._get_cached(url, headers)
+        if self.mirror is not None and response.status_code == 200:
+            self.mirror.store(url, response.content)
+        return response
+
+    def _get_cached(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """
+        GET a URL, going through the HTTP cache if one is configured.
+
+        Extra headers may carry the caller's own validators. If the cache has no
+        entry for the URL, a 304 answer to those validators is returned as is.
+        """
+        if self.cache is None:
+            return self._send_get(url, headers)
+        cache_headers = self.cache.request_headers(url)
+        response = self._send_get(url, (headers or {}) | cache_headers)
+        if response.status_code == 304 and not cache_headers:
+            return response
+        cached = self.cache.update(url, response)
+        if cached is None:
+            return self.cache.update(url, self._send_get(url))
+        return cached
+
+    async def _get_async(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """Async counterpart of _get(); file access runs in a worker thread."""
+        if self.offline:
+            return self._mirrored_response(url, await asyncio.to_thread(self.mirror.read, url))
+        response = await self._get_cached_async(client, url)
+        if self.mirror is not None and response.status_code == 200:
+            await asyncio.to_thread(self.mirror.store, url, response.content)
+        return response
+
+    async def _get_cached_async(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        if self.cache is None:
+            return await self._send_get_async(client, url)
+        headers = await asyncio.to_thread(self.cache.request_headers, url)
+        response = await self._send_get_async(client, url, headers)
+        cached = await asyncio.to_thread(self.cache.update, url, response)
+        if cached is None:
+            response = await self._send_get_async(client, url)
+            return await asyncio.to_thread(self.cache.update, url, response)
+        return cached
+
+    def _iter_toc_items(self, toc_url: str) -> Generator[ET.Element, None, None]:
+        """
+        Streams the <item> elements of a TOC file while it downloads.
+
+        With an HTTP cache or a mirror the body is fetched through them first and
+        then parsed incrementally from memory. A streamed request is retried
+        according to the retry policy until the first item has been yielded;
+        after that, a failure would repeat items, so it is raised.
+
+        Raises:
+            ValueError: If the TOC cannot be downloaded
+            ET.ParseError: If the TOC is not well-formed XML
+        """
+        if self.cache is not None or self.mirror is not None:
+            parser = TocItemParser()
+            response = self._get(toc_url)
+            self._check_toc_response(toc_url, response)
+            yield from parser.feed(response.content)
+            yield from parser.close()
+            return
+
+        yielded = False
+        for attempt in count(1):
+            parser = TocItemParser()
+            try:
+                if self._client is not None:
+                    stream = self._client.stream('GET', toc_url)
+                else:
+                    stream = httpx.stream('GET', toc_url, follow_redirects=True)
+                started = time.monotonic()
+                with stream as response:
+                    self._record_response(response, started)
+                    delay = self._retry_delay(toc_url, attempt, response=response)
+                    if delay is None:
+                        self._check_toc_response(toc_url, response)
+                        for chunk in response.iter_bytes():
+                            for item in parser.feed(chunk):
+                                yielded = True
+                                yield item
+                        break
+            except Exception as e:
+                delay = None if yielded else self._retry_delay(toc_url, attempt, error=e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+        yield from parser.close()
+
+    async def _aiter_toc_items(self, client: httpx.AsyncClient, toc_url: str) -> AsyncGenerator[ET.Element, None]:
+        """Async counterpart of _iter_toc_items()."""
+        if self.cache is not None or self.mirror is not None:
+            parser = TocItemParser()
+            response = await self._get_async(client, toc_url)
+            self._check_toc_response(toc_url, response)
+            for item in parser.feed(response.content):
+                yield item
+            for item in parser.close():
+                yield item
+            return
+
+        yielded = False
+        for attempt in count(1):
+            parser = TocItemParser()
+            try:
+                started = time.monotonic()
+                async with client.stream('GET', toc_url) as response:
+                    self._record_response(response, started)
+                    delay = self._retry_delay(toc_url, attempt, response=response)
+                    if delay is None:
+                        self._check_toc_response(toc_url, response)
+                        async for chunk in response.aiter_bytes():
+                            for item in parser.feed(chunk):
+                                yielded = True
+                                yield item
+                        break
+            except Exception as e:
+                delay = None if yielded else self._retry_delay(toc_url, attempt, error=e)
+                if delay is None:
+                    raise
+            await self._wait_for_retry_async(delay)
+        for item in parser.close():
+            yield item
+
+    def _download_xml(self, url: str) -> str:
+        """
+        Downloads an xml.zip archive and returns the single XML file it contains.
+
+        The archive is read in memory; nothing is extracted to disk.
+
+        Raises:
+            ValueError: If the download fails or the archive doesn't contain exactly one XML file
+        """
+        try:
+            response = self._get(url)
+            self._check_archive_response(url, response)
+            with open_zipped_xml(response.content) as xml_file:
+                return xml_file.read().decode('utf-8')
+        except Exception as e:
+            logger.error(f"Error processing {url}: {str(e)}")
+            raise ValueError(f"An error occurred while processing {url}: {str(e)}")
+
+    def _download_parsed(self, url: str, parse: Callable[[IO[bytes]], R],
+                         cache_key: tuple[str, str] | None = None) -> R:
+        """
+        Downloads an xml.zip archive and parses its XML straight from the
+        decompressing stream, without decoding it to a str first.
+
+        With a parsed_cache the cache is consulted first; cache_key is the
+        (key, stamp) of a document whose root doesn't carry its doknr and builddate.
+
+        Raises:
+            ValueError: If the download fails, the archive doesn't contain exactly
+                        one XML file or the XML cannot be parsed
+        """
+        try:
+            response = self._get(url)
+            self._check_archive_response(url, response)
+            if self.parsed_cache is not None:
+                return parse_zipped_xml_cached(self.parsed_cache, cache_key, parse, response.content)
+            return parse_zipped_xml(parse, response.content)
+        except Exception as e:
+            logger.error(f"Error processing {url}: {str(e)}")
+            raise ValueError(f"An error occurred while processing {url}: {str(e)}")
+
+    async def _download_archive_async(self, client: httpx.AsyncClient, url: str) -> bytes | BinaryIO:
+        """
+        Downloads an xml.zip archive.
+
+        Returns:
+            The archive as bytes, or as an open file positioned at the start if
+            spool_threshold is set or the archive is read from the mirror.
+            _parse_archive_async() closes the file.
+        """
+        logger.debug(f"Downloading archive async from {url}")
+        try:
+            if self.offline:
+                return await asyncio.to_thread(self.mirror.open, url)
+            if self.spool_threshold is not None and self.cache is None:
+                return await self._spool_archive_async(client, url)
+            response = await self._get_async(client, url)
+            self._check_archive_response(url, response)
+            return response.content
+        except Exception as e:
+            logger.error(f"Error processing {url}: {str(e)}")
+            raise ValueError(f"An error occurred while processing {url}: {str(e)}")
+
+    async def _spool_archive_async(self, client: httpx.AsyncClient, url: str) -> BinaryIO:
+        for attempt in count(1):
+            spool = tempfile.SpooledTemporaryFile(max_size=self.spool_threshold)
+            try:
+                started = time.monotonic()
+                async with client.stream('GET', url) as response:
+                    self._record_response(response, started)
+                    delay = self._retry_delay(url, attempt, response=response)
+                    if delay is None:
+                        self._check_archive_response(url, response)
+                        async for chunk in response.aiter_bytes():
+                            spool.write(chunk)
+                        if self.mirror is not None:
+                            await asyncio.to_thread(self.mirror.store_file, url, spool)
+                        spool.seek(0)
+                        return spool
+            except Exception as e:
+                spool.close()
+                delay = self._retry_delay(url, attempt, error=e)
+                if delay is None:
+                    raise
+            except BaseException:
+                spool.close()
+                raise
+            else:
+                spool.close()
+            await self._wait_for_retry_async(delay)
+
+    def _check_archive_response(self, url: str, response: httpx.Response) -> None:
+        if response.status_code != 200:
+            logger.error(f"Download failed: HTTP {response.status_code} for {url}")
+            raise ValueError(f"Failed to download the file: {url} - HTTP {response.status_code}")
+
+    async def _parse_archive_async(self, archive: bytes | BinaryIO, url: str, parse: Callable[[IO[bytes]], R],
+                                   executor: Executor | None = None,
+                                   cache_key: tuple[str, str] | None = None) -> R:
+        """
+        Parses the XML inside a downloaded xml.zip without building an intermediate str.
+
+        The archive itself is passed to the executor, so a process pool receives the
+        compressed bytes and decompresses them while parsing. A spooled archive is
+        closed afterwards. With a parsed_cache, the cache lookup runs in the executor
+        too; cache_key is the (key, stamp) of a document whose root doesn't carry
+        its doknr and builddate.
+        """
+        parse_archive = partial(parse_zipped_xml, parse)
+        if self.parsed_cache is not None:
+            parse_archive = partial(parse_zipped_xml_cached, self.parsed_cache, cache_key, parse)
+        try:
+            if isinstance(archive, (bytes, bytearray, memoryview)):
+                return await parse_in_executor(executor, parse_archive, archive)
+            with archive:
+                if isinstance(executor, ProcessPoolExecutor):
+                    # Open files cannot cross the process boundary
+                    archive = archive.read()
+                return await parse_in_executor(executor, parse_archive, archive)
+        except Exception as e:
+            logger.error(f"Error processing {url}: {str(e)}")
+            raise ValueError(f"An error occurred while processing {url}: {str(e)}")
+
+    async def _download_hashed_async(self, client: httpx.AsyncClient, url: str, parse: Callable[[IO[bytes]], R],
+                                     executor: Executor | None = None,
+                                     cache_key: tuple[str, str] | None = None) -> tuple[R, str]:
+        """Downloads and parses an xml.zip archive and returns the result with the archive's SHA-256."""
+        archive = await self._download_archive_async(client, url)
+        if isinstance(archive, (bytes, bytearray, memoryview)):
+            sha256 = archive_sha256(archive)
+        else:
+            sha256 = await asyncio.to_thread(archive_sha256, archive)
+        return await self._parse_archive_async(archive, url, parse, executor, cache_key), sha256
+
+    async def _skip_completed(self, items: Iterable[T] | AsyncIterable[T], journal: CrawlJournal,
+                              key: Callable[[T], str]) -> AsyncGenerator[T, None]:
+        """Yields the items whose key is not yet recorded in the journal."""
+        skipped = 0
+        async with aclosing(_aiterate(items)) as source:
+            async for item in source:
+                if key(item) in journal:
+                    skipped += 1
+                    continue
+                yield item
+        if skipped:
+            logger.info(f"Skipped {skipped} items already completed according to {journal.path}")
+
+    def _check_toc_response(self, toc_url: str, response: httpx.Response) -> None:
+        if response.status_code != 200:
+            logger.error(f"Failed to download TOC: HTTP {response.status_code}")
+            raise ValueError(f"Failed to download the TOC XML file: {toc_url} - HTTP {response.status_code}")
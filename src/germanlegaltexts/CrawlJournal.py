@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class CrawlJournal:
+    """
+    Append-only checkpoint journal of a long-running crawl.
+
+    Every completed download is appended as one JSON line holding its key (the
+    judgement link or law book URL) and the SHA-256 of the downloaded xml.zip.
+    Lines are written whole and flushed immediately, so a crashed crawl leaves at
+    most a truncated last line, which is dropped when the journal is reopened.
+    A restarted crawl skips every key already in the journal. Appends are
+    serialised by a lock, so concurrent downloads can share one journal.
+    """
+
+    def __init__(self, path: str | Path, fsync: bool = False):
+        """
+        Args:
+            path: The JSONL file to append to. Created if missing; existing
+                  entries are loaded.
+            fsync: Also fsync every entry, so the journal survives a power loss
+                   and not just a crash of the process. Much slower.
+        """
+        self.path = Path(path).expanduser()
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._completed: dict[str, str] = {}
+        self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        complete = data.rfind(b'\n') + 1
+        if complete < len(data):
+            logger.warning(f"Dropping truncated last entry of crawl journal {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(complete)
+        for line in data[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+                self._completed[entry['key']] = entry['sha256']
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Skipping malformed entry in crawl journal {self.path}: {line[:80]!r}")
+        logger.info(f"Loaded {len(self._completed)} completed items from crawl journal {self.path}")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._completed
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def sha256(self, key: str) -> str | None:
+        """Returns the recorded archive hash of a completed item, or None if it isn't completed."""
+        return self._completed.get(key)
+
+    def record(self, key: str, sha256: str) -> None:
+        """
+        Appends a completed item to the journal.
+
+        Args:
+            key: The judgement link or law book URL
+            sha256: The SHA-256 of the downloaded xml.zip
+        """
+        line = json.dumps({'key': key, 'sha256': sha256, 'completed': time.time()}, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line.encode('utf-8'))
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._completed[key] = sha256
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+@contextmanager
+def open_journal(journal: CrawlJournal | str | Path | None) -> Iterator[CrawlJournal | None]:
+    """
+    Resolves the journal option of the async iterators.
+
+    A path is opened as a CrawlJournal and closed on exit; a CrawlJournal is used
+    as is and left open, and None disables checkpointing.
+    """
+    if journal is None or isinstance(journal, CrawlJournal):
+        yield journal
+        return
+    with CrawlJournal(journal) as opened:
+        yield opened
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import aclosing, contextmanager
+from typing import Generic, Literal, TypeVar
+
+from .DownloadReport import DownloadReport
+from .RateLimiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+S = TypeVar('S')
+T = TypeVar('T')
+R = TypeVar('R')
+
+ParseExecutor = Executor | Literal['process', 'thread'] | None
+
+
+@contextmanager
+def open_parse_executor(executor: ParseExecutor) -> Iterator[Executor | None]:
+    """
+    Resolves the parse executor option of the async iterators.
+
+    'process' and 'thread' create a ProcessPoolExecutor or ThreadPoolExecutor that
+    is shut down on exit. An Executor instance is used as is and left running, and
+    None means parsing happens inline on the event loop.
+
+    Args:
+        executor: 'process', 'thread', an Executor instance or None
+
+    Yields:
+        The executor to parse in, or None
+
+    Raises:
+        ValueError: If executor is an unknown string
+    """
+    if executor is None or isinstance(executor, Executor):
+        yield executor
+        return
+    if executor == 'process':
+        pool = ProcessPoolExecutor()
+    elif executor == 'thread':
+        pool = ThreadPoolExecutor(thread_name_prefix='germanlegaltexts-parse')
+    else:
+        raise ValueError(f"Unknown parse executor: {executor!r} (expected 'process', 'thread' or an Executor)")
+    try:
+        yield pool
+    finally:
+        # Pending parses are abandoned when iteration stops early; don't block the loop on them.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def parse_in_executor(executor: Executor | None, parse: Callable[[S], R], xml_content: S) -> R:
+    """
+    Runs parse(xml_content) in the executor, or inline if executor is None.
+    """
+    if executor is None:
+        return parse(xml_content)
+    return await asyncio.get_running_loop().run_in_executor(executor, parse, xml_content)
+
+
+async def _aiterate(items: Iterable[T] | AsyncIterable[T]) -> AsyncGenerator[T, None]:
+    if isinstance(items, AsyncIterable):
+        try:
+            async for item in items:
+                yield item
+        finally:
+            aclose = getattr(items, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+    else:
+        for item in items:
+            yield item
+
+
+class _Finished:
+    """Marks the end of the result stream, optionally carrying the producer's error."""
+
+    def __init__(self, error: Exception | None):
+        self.error = error
+
+
+class DownloadPipeline(Generic[T, R]):
+    """
+    Runs a download coroutine for many items concurrently and yields the results
+    as they complete.
+
+    The number of downloads in flight and the number of finished results waiting
+    for the consumer are both capped. When the result buffer is full, workers block
+    on handing over their result and keep their in-flight slot, so a slow consumer
+    throttles the producer instead of letting parsed documents pile up in memory.
+    """
+
+    def __init__(self,
+                 max_per_second: float | None = 1.0,
+                 max_in_flight: int = 16,
+                 buffer_size: int | None = None,
+                 rate_limiter: RateLimiter | None = None):
+        """
+        Args:
+            max_per_second: Maximum number of new downloads to start per second.
+                            Set to None to disable the rate limit.
+            max_in_flight: Maximum number of downloads running at the same time.
+            buffer_size: Maximum number of finished results buffered for the consumer.
+                         Defaults to max_in_flight.
+            rate_limiter: Shared RateLimiter that paces the download starts instead
+                          of max_per_second.
+
+        Raises:
+            ValueError: If max_in_flight or buffer_size is less than 1
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.max_per_second = max_per_second
+        if rate_limiter is None and max_per_second is not None:
+            rate_limiter = RateLimiter(max_per_second, adaptive=False)
+        self.rate_limiter = rate_limiter
+        self.max_in_flight = max_in_flight
+        self.buffer_size = buffer_size if buffer_size is not None else max_in_flight
+
+    async def run(self,
+                  items: Iterable[T] | AsyncIterable[T],
+                  download: Callable[[T], Awaitable[R]],
+                  describe: Callable[[T], str],
+                  report: DownloadReport[T] | None = None) -> AsyncGenerator[R, None]:
+        """
+        Downloads all items and yields the results in completion order.
+
+        Failed downloads are logged and skipped. The producer and all workers are
+        owned by this generator: closing it (aclose(), breaking out of the loop,
+        cancellation or an exception in the consumer) cancels every pending
+        download and waits for the cancellation to finish.
+
+        Args:
+            items: The items to download. An async iterable is consumed lazily, so
+                   downloads start while it is still producing items.
+            download: Coroutine function that downloads and parses a single item
+            describe: Returns a short description of an item for log messages
+            report: Optional DownloadReport that records every success and failure
+
+        Yields:
+            The result of each successful download.
+        """
+        queue: asyncio.Queue[R | _Finished | None] = asyncio.Queue(maxsize=self.buffer_size)
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        async def _worker(item: T) -> None:
+            try:
+                try:
+                    result = await download(item)
+                except Exception as e:
+                    logger.warning(f"Failed to download {describe(item)}: {str(e)}")
+                    if report is not None:
+                        report.record_failure(item, e)
+                    result = None
+                else:
+                    if report is not None:
+                        report.record_success()
+                await queue.put(result)
+            finally:
+                in_flight.release()
+
+        async def _producer() -> None:
+            try:
+                async with asyncio.TaskGroup() as workers, aclosing(_aiterate(items)) as source:
+                    async for item in source:
+                        await in_flight.acquire()
+                        if self.rate_limiter is not None:
+                            await self.rate_limiter.acquire_async()
+                        workers.create_task(_worker(item))
+            except Exception as e:
+                if isinstance(e, ExceptionGroup) and len(e.exceptions) == 1:
+                    e = e.exceptions[0]
+                await queue.put(_Finished(e))
+                return
+            await queue.put(_Finished(None))
+
+        producer = asyncio.create_task(_producer())
+        try:
+            while True:
+                result = await queue.get()
+                if isinstance(result, _Finished):
+                    if result.error is not None:
+                        raise result.error
+                    break
+                if result is not None:
+                    yield result
+        finally:
+            if not producer.done():
+                producer.cancel()
+                logger.debug("Download pipeline closed early, cancelling pending downloads")
+            await asyncio.gather(producer, return_exceptions=True)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class FailedDownload(Generic[T]):
+    """An item that could not be downloaded, even after retries."""
+    item: T
+    error: str
+
+
+@dataclass
+class DownloadReport(Generic[T]):
+    """
+    Outcome of a batch download.
+
+    Pass an empty report to one of the batch methods and it is filled in as the
+    downloads finish. The items of failed downloads (law book URLs or judgement
+    RIIIndexItems) can be fed to a follow-up run.
+    """
+    succeeded: int = 0
+    failed: list[FailedDownload[T]] = field(default_factory=list)
+
+    @property
+    def failed_items(self) -> list[T]:
+        return [failure.item for failure in self.failed]
+
+    def record_success(self) -> None:
+        self.succeeded += 1
+
+    def record_failure(self, item: T, error: BaseException) -> None:
+        self.failed.append(FailedDownload(item, str(error)))
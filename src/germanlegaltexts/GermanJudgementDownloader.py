@@ -1,21 +1,36 @@
-import asyncio
-import io
-import tempfile
 import xml.etree.ElementTree as ET
-import zipfile
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable, Generator, Iterable
+from concurrent.futures import Executor
+from contextlib import aclosing
 from pathlib import Path
 
 import httpx
 import logging
 
+from .BaseDownloader import BaseDownloader
+from .CrawlJournal import CrawlJournal, open_journal
+from .DownloadPipeline import DownloadPipeline, ParseExecutor, open_parse_executor
+from .DownloadReport import DownloadReport
+from .SyncState import JudgementChange, JudgementSyncState
+from .model.Interning import intern_value
 from .model.Rechtsprechung import Rechtsprechung, RIIIndexItem
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
-class GermanJudgementDownloader:
+async def _take(items: AsyncGenerator[RIIIndexItem, None], n: int) -> AsyncGenerator[RIIIndexItem, None]:
+    """Yields the first n items and closes the source, which stops streaming the index."""
+    async with aclosing(items):
+        taken = 0
+        async for item in items:
+            yield item
+            taken += 1
+            if taken >= n:
+                return
+
+
+class GermanJudgementDownloader(BaseDownloader):
     """Downloader for German court judgements from rechtsprechung-im-internet.de"""
 
     base_url = 'https://www.rechtsprechung-im-internet.de'
@@ -34,34 +49,17 @@ class GermanJudgementDownloader:
             ValueError: If the download fails or the ZIP doesn't contain exactly one XML file
         """
         logger.debug(f"Downloading judgement XML from {url}")
-        with tempfile.TemporaryDirectory() as tmpdir:
-            try:
-                response = httpx.get(url, follow_redirects=True)
-                if response.status_code != 200:
-                    logger.error(f"Download failed: HTTP {response.status_code} for {url}")
-                    raise ValueError(f"Failed to download the file: {url} - HTTP {response.status_code}")
-
-                with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                    z.extractall(tmpdir)
-
-                xml_files = [*Path(tmpdir).glob('*.xml')]
-                if len(xml_files) != 1:
-                    logger.error(f"Expected 1 XML file, found {len(xml_files)} in {url}")
-                    raise RuntimeError(f"Expected 1 XML file, found {len(xml_files)}")
-                else:
-                    with open(Path(tmpdir) / xml_files[0], 'rb') as xml_file:
-                        logger.debug(f"Successfully extracted XML: {xml_files[0].name}")
-                        return xml_file.read().decode('utf-8')
-            except Exception as e:
-                logger.error(f"Error processing {url}: {str(e)}")
-                raise ValueError(f"An error occurred while processing {url}: {str(e)}")
-
-    def download_judgement(self, url: str) -> Rechtsprechung:
+        return self._download_xml(url)
+
+    def download_judgement(self, url: str, modified: str | None = None) -> Rechtsprechung:
         """
         Downloads a judgement and returns it as a Rechtsprechung object.
 
         Args:
             url: The URL to the ZIP file containing the judgement XML
+            modified: The judgement's modified timestamp from the index. With a
+                      parsed_cache, an unchanged judgement is loaded from the cache
+                      instead of being parsed.
 
         Returns:
             A Rechtsprechung object representing the downloaded judgement
@@ -69,8 +67,8 @@ class GermanJudgementDownloader:
         Raises:
             ValueError: If the download fails or the XML cannot be parsed
         """
-        xml_content = self.download_judgement_xml(url)
-        return Rechtsprechung.from_xml(xml_content)
+        logger.debug(f"Downloading judgement from {url}")
+        return self._download_parsed(url, Rechtsprechung.from_xml, (url, modified) if modified else None)
 
     def get_all_judgement_index_items(self) -> list[RIIIndexItem]:
         """
@@ -87,7 +85,7 @@ class GermanJudgementDownloader:
         logger.debug(f"Fetching judgement index from {toc_url}")
 
         try:
-            response = httpx.get(toc_url, follow_redirects=True)
+            response = self._get(toc_url)
             if response.status_code != 200:
                 logger.error(f"Failed to download TOC: HTTP {response.status_code}")
                 raise ValueError(f"Failed to download the TOC XML file: {toc_url} - HTTP {response.status_code}")
@@ -98,21 +96,9 @@ class GermanJudgementDownloader:
             index_items = []
 
             for item in root.findall('.//item'):
-                gericht = item.findtext('gericht')
-                entsch_datum = item.findtext('entsch-datum')
-                aktenzeichen = item.findtext('aktenzeichen')
-                link_element = item.find('link')
-                modified = item.findtext('modified')
-
-                if gericht and entsch_datum and aktenzeichen and link_element is not None and link_element.text:
-                    link = link_element.text.strip().replace('http://', 'https://', 1)
-                    index_items.append(RIIIndexItem(
-                        gericht=gericht,
-                        entsch_datum=entsch_datum,
-                        aktenzeichen=aktenzeichen,
-                        link=link,
-                        modified=modified or ""
-                    ))
+                index_item = self._index_item_from_element(item)
+                if index_item is not None:
+                    index_items.append(index_item)
 
             logger.info(f"Retrieved {len(index_items)} judgement entries from index")
             return index_items
@@ -124,47 +110,104 @@ class GermanJudgementDownloader:
             logger.error(f"Error processing TOC: {str(e)}")
             raise ValueError(f"An error occurred while processing {toc_url}: {str(e)}")
 
-    def download_all_judgements(self) -> list[Rechtsprechung]:
+    def iter_judgement_index_items(self) -> Generator[RIIIndexItem, None, None]:
+        """
+        Streams the judgement index items from the rii-toc.xml file.
+
+        Unlike get_all_judgement_index_items(), the index is parsed incrementally
+        while it downloads, each item is yielded as soon as it is complete, and
+        processed elements are discarded, so memory does not grow with the index.
+
+        Yields:
+            RIIIndexItem objects in index order
+
+        Raises:
+            ValueError: If the TOC XML file cannot be downloaded or parsed
+        """
+        toc_url = f"{self.base_url}/rii-toc.xml"
+        logger.debug(f"Streaming judgement index from {toc_url}")
+        try:
+            for item in self._iter_toc_items(toc_url):
+                index_item = self._index_item_from_element(item)
+                if index_item is not None:
+                    yield index_item
+        except ET.ParseError as e:
+            logger.error(f"Failed to parse TOC XML: {str(e)}")
+            raise ValueError(f"Failed to parse the TOC XML file: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error processing TOC: {str(e)}")
+            raise ValueError(f"An error occurred while processing {toc_url}: {str(e)}")
+
+    def _index_item_from_element(self, item: ET.Element) -> RIIIndexItem | None:
+        gericht = item.findtext('gericht')
+        entsch_datum = item.findtext('entsch-datum')
+        aktenzeichen = item.findtext('aktenzeichen')
+        link = item.findtext('link')
+        modified = item.findtext('modified')
+
+        if not (gericht and entsch_datum and aktenzeichen and link):
+            return None
+        return RIIIndexItem(
+            gericht=intern_value(gericht),
+            entsch_datum=intern_value(entsch_datum),
+            aktenzeichen=aktenzeichen,
+            link=link.strip().replace('http://', 'https://', 1),
+            modified=intern_value(modified or "")
+        )
+
+    def download_all_judgements(self, workers: int | None = None,
+                                max_per_second: float | None = None,
+                                report: DownloadReport[RIIIndexItem] | None = None) -> list[Rechtsprechung]:
         """
         Downloads all available judgements from rechtsprechung-im-internet.de.
 
         WARNING: This will download a very large number of judgements and may take
         a significant amount of time and bandwidth.
 
+        Args:
+            workers: Optional number of threads that download and parse in parallel.
+                     The threads share one connection pool and one rate limit.
+            max_per_second: Optional limit on the number of downloads started per second.
+                            Ignored if the downloader has a rate_limiter.
+            report: Optional DownloadReport that collects the failed index items.
+
         Returns:
-            A list of Rechtsprechung objects for all available judgements
+            A list of Rechtsprechung objects for all available judgements in index order
 
         Raises:
             ValueError: If any download fails
         """
-        index_items = self.get_all_judgement_index_items()
-        logger.info(f"Starting download of {len(index_items)} judgements")
-        judgements = []
+        with self._worker_session(workers):
+            index_items = self.get_all_judgement_index_items()
+            logger.info(f"Starting download of {len(index_items)} judgements")
+            judgements = []
 
-        for i, item in enumerate(index_items, 1):
-            try:
-                judgement = self.download_judgement(item.link)
-                judgements.append(judgement)
+            for i, (_, judgement) in enumerate(self._download_judgements(index_items, workers, max_per_second, report), 1):
+                if judgement is not None:
+                    judgements.append(judgement)
 
                 if i % 100 == 0:
                     logger.info(f"Progress: {i}/{len(index_items)} judgements downloaded")
 
-            except Exception as e:
-                logger.warning(f"Failed to download judgement {item.aktenzeichen}: {str(e)}")
-                continue
-
         logger.info(f"Completed: {len(judgements)}/{len(index_items)} judgements downloaded successfully")
         return judgements
 
-    def download_first_n_judgements(self, n: int) -> list[Rechtsprechung]:
+    def download_first_n_judgements(self, n: int, workers: int | None = None,
+                                    max_per_second: float | None = None,
+                                    report: DownloadReport[RIIIndexItem] | None = None) -> list[Rechtsprechung]:
         """
         Downloads the first n judgements from the index.
 
         Args:
             n: The number of judgements to download
+            workers: Optional number of threads that download and parse in parallel.
+                     The threads share one connection pool and one rate limit.
+            max_per_second: Optional limit on the number of downloads started per second.
+                            Ignored if the downloader has a rate_limiter.
+            report: Optional DownloadReport that collects the failed index items.
 
         Returns:
-            A list of up to n Rechtsprechung objects
+            A list of up to n Rechtsprechung objects in index order
 
         Raises:
             ValueError: If n is less than 1 or if the index cannot be retrieved
@@ -172,25 +215,27 @@ class GermanJudgementDownloader:
         if n < 1:
             raise ValueError("n must be at least 1")
 
-        index_items = self.get_all_judgement_index_items()
-        items_to_download = index_items[:n]
-        logger.info(f"Starting download of first {len(items_to_download)} judgements")
-
-        judgements = []
+        with self._worker_session(workers):
+            index_items = self.get_all_judgement_index_items()
+            items_to_download = index_items[:n]
+            logger.info(f"Starting download of first {len(items_to_download)} judgements")
 
-        for i, item in enumerate(items_to_download, 1):
-            try:
-                judgement = self.download_judgement(item.link)
-                judgements.append(judgement)
-                logger.info(f"Progress: {i}/{len(items_to_download)} judgements downloaded")
+            judgements = []
 
-            except Exception as e:
-                logger.warning(f"Failed to download judgement {item.aktenzeichen}: {str(e)}")
-                continue
+            for i, (_, judgement) in enumerate(self._download_judgements(items_to_download, workers, max_per_second, report), 1):
+                if judgement is not None:
+                    judgements.append(judgement)
+                    logger.info(f"Progress: {i}/{len(items_to_download)} judgements downloaded")
 
         logger.info(f"Completed: {len(judgements)}/{len(items_to_download)} judgements downloaded successfully")
         return judgements
 
+    def _download_judgements(self, items: Iterable[RIIIndexItem], workers: int | None, max_per_second: float | None,
+                             report: DownloadReport[RIIIndexItem] | None) -> Generator[tuple[RIIIndexItem, Rechtsprechung | None], None, None]:
+        return self._download_each(items, lambda item: self.download_judgement(item.link, modified=item.modified),
+                                   lambda item: f"judgement {item.aktenzeichen}",
+                                   workers=workers, max_per_second=max_per_second, report=report)
+
     def get_judgement_count(self) -> int:
         """
         Returns the total number of available judgements in the index.
@@ -201,7 +246,7 @@ class GermanJudgementDownloader:
         Raises:
             ValueError: If the index cannot be retrieved
         """
-        count = len(self.get_all_judgement_index_items())
+        count = sum(1 for _ in self.iter_judgement_index_items())
         logger.debug(f"Judgement count: {count}")
         return count
 
@@ -209,26 +254,16 @@ class GermanJudgementDownloader:
         toc_url = f"{self.base_url}/rii-toc.xml"
         logger.debug(f"Fetching judgement index async from {toc_url}")
         try:
-            response = await client.get(toc_url)
+            response = await self._get_async(client, toc_url)
             if response.status_code != 200:
                 logger.error(f"Failed to download TOC: HTTP {response.status_code}")
                 raise ValueError(f"Failed to download the TOC XML file: {toc_url} - HTTP {response.status_code}")
             root = ET.fromstring(response.text)
             index_items = []
             for item in root.findall('.//item'):
-                gericht = item.findtext('gericht')
-                entsch_datum = item.findtext('entsch-datum')
-                aktenzeichen = item.findtext('aktenzeichen')
-                link_element = item.find('link')
-                modified = item.findtext('modified')
-                if gericht and entsch_datum and aktenzeichen and link_element is not None and link_element.text:
-                    index_items.append(RIIIndexItem(
-                        gericht=gericht,
-                        entsch_datum=entsch_datum,
-                        aktenzeichen=aktenzeichen,
-                        link=link_element.text.strip().replace('http://', 'https://', 1),
-                        modified=modified or ""
-                    ))
+                index_item = self._index_item_from_element(item)
+                if index_item is not None:
+                    index_items.append(index_item)
             logger.info(f"Retrieved {len(index_items)} judgement entries from index")
             return index_items
         except ET.ParseError as e:
@@ -238,59 +273,109 @@ class GermanJudgementDownloader:
             logger.error(f"Error processing TOC: {str(e)}")
             raise ValueError(f"An error occurred while processing {toc_url}: {str(e)}")
 
-    async def _download_judgement_xml_async(self, client: httpx.AsyncClient, url: str) -> str:
-        logger.debug(f"Downloading judgement XML async from {url}")
+    async def _aiter_judgement_index_items_async(self, client: httpx.AsyncClient) -> AsyncGenerator[RIIIndexItem, None]:
+        toc_url = f"{self.base_url}/rii-toc.xml"
+        logger.debug(f"Streaming judgement index async from {toc_url}")
         try:
-            response = await client.get(url)
-            if response.status_code != 200:
-                logger.error(f"Download failed: HTTP {response.status_code} for {url}")
-                raise ValueError(f"Failed to download the file: {url} - HTTP {response.status_code}")
-            with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                xml_files = [f for f in z.namelist() if f.endswith('.xml')]
-                if len(xml_files) != 1:
-                    logger.error(f"Expected 1 XML file, found {len(xml_files)} in {url}")
-                    raise RuntimeError(f"Expected 1 XML file, found {len(xml_files)}")
-                return z.read(xml_files[0]).decode('utf-8')
+            async with aclosing(self._aiter_toc_items(client, toc_url)) as items:
+                async for item in items:
+                    index_item = self._index_item_from_element(item)
+                    if index_item is not None:
+                        yield index_item
+        except ET.ParseError as e:
+            logger.error(f"Failed to parse TOC XML: {str(e)}")
+            raise ValueError(f"Failed to parse the TOC XML file: {str(e)}")
         except Exception as e:
-            logger.error(f"Error processing {url}: {str(e)}")
-            raise ValueError(f"An error occurred while processing {url}: {str(e)}")
-
-    async def _download_judgement_async(self, client: httpx.AsyncClient, url: str) -> Rechtsprechung:
-        xml_content = await self._download_judgement_xml_async(client, url)
-        return Rechtsprechung.from_xml(xml_content)
+            logger.error(f"Error processing TOC: {str(e)}")
+            raise ValueError(f"An error occurred while processing {toc_url}: {str(e)}")
 
-    async def iter_all_judgements(self, max_per_second: float | None = 1.0) -> AsyncGenerator[Rechtsprechung, None]:
+    async def _download_judgement_async(self, client: httpx.AsyncClient, url: str,
+                                        executor: Executor | None = None,
+                                        modified: str | None = None) -> Rechtsprechung:
+        archive = await self._download_archive_async(client, url)
+        return await self._parse_archive_async(archive, url, Rechtsprechung.from_xml, executor,
+                                               self._judgement_cache_key(url, modified))
+
+    def _judgement_cache_key(self, url: str, modified: str | None) -> tuple[str, str] | None:
+        # Judgement roots carry no builddate; the link and the index timestamp identify a version
+        return (url, modified) if modified else None
+
+    async def iter_all_judgements(self,
+                                  max_per_second: float | None = 1.0,
+                                  max_in_flight: int = 16,
+                                  buffer_size: int | None = None,
+                                  parse_executor: ParseExecutor = None,
+                                  report: DownloadReport[RIIIndexItem] | None = None,
+                                  journal: CrawlJournal | str | Path | None = None) -> AsyncGenerator[Rechtsprechung, None]:
         """
         Asynchronously downloads all judgements and yields them as they complete.
 
         Downloads are started at a controlled rate and run in parallel — multiple
         downloads can be in-flight simultaneously while new ones are started at
-        most max_per_second times per second.
+        most max_per_second times per second. At most max_in_flight downloads run
+        at once and at most buffer_size finished judgements wait for the consumer,
+        so a slow consumer throttles the downloads. The index is streamed, so the
+        first downloads start before rii-toc.xml has fully arrived.
 
         Args:
             max_per_second: Maximum number of new downloads to start per second.
-                            Set to None to start all downloads immediately with no throttle.
+                            Set to None to start downloads as fast as max_in_flight allows.
+                            Ignored if the downloader has a rate_limiter.
+            max_in_flight: Maximum number of downloads running at the same time.
+            buffer_size: Maximum number of finished judgements buffered for the consumer.
+                         Defaults to max_in_flight.
+            parse_executor: Where to parse the XML: 'process' for a process pool,
+                            'thread' for a thread pool, an Executor instance, or
+                            None to parse inline on the event loop.
+            report: Optional DownloadReport that collects the failed index items,
+                    e.g. for a follow-up run with iter_judgements().
+            journal: Optional CrawlJournal, or the path of its file, that makes the
+                     crawl resumable. Judgements already recorded in it are skipped,
+                     and each judgement is recorded once the consumer asks for the
+                     next one, so one still being processed when the crawl died is
+                     delivered again after the restart.
 
         Yields:
             Rechtsprechung objects in completion order (not index order).
         """
-        async with httpx.AsyncClient(timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0)) as client:
-            items = await self._get_all_judgement_index_items_async(client)
-            async for judgement in self._iter_judgements(client, items, max_per_second):
-                yield judgement
-
-    def iter_first_n_judgements(self, n: int, max_per_second: float | None = 1.0) -> AsyncGenerator[Rechtsprechung, None]:
+        pipeline = self._pipeline(max_per_second, max_in_flight, buffer_size)
+        async with self._async_session() as client:
+            with open_journal(journal) as journal:
+                items = self._aiter_judgement_index_items_async(client)
+                async with aclosing(self._iter_judgements(client, items, pipeline, parse_executor, report,
+                                                          journal)) as judgements:
+                    async for judgement in judgements:
+                        yield judgement
+
+    def iter_first_n_judgements(self,
+                                n: int,
+                                max_per_second: float | None = 1.0,
+                                max_in_flight: int = 16,
+                                buffer_size: int | None = None,
+                                parse_executor: ParseExecutor = None,
+                                report: DownloadReport[RIIIndexItem] | None = None) -> AsyncGenerator[Rechtsprechung, None]:
         """
         Asynchronously downloads the first n judgements and yields them as they complete.
 
         Downloads are started at a controlled rate and run in parallel — multiple
         downloads can be in-flight simultaneously while new ones are started at
-        most max_per_second times per second.
+        most max_per_second times per second. At most max_in_flight downloads run
+        at once and at most buffer_size finished judgements wait for the consumer.
+        Streaming the index stops once n items have been read.
 
         Args:
             n: The number of judgements to download (must be >= 1).
             max_per_second: Maximum number of new downloads to start per second.
-                            Set to None to start all downloads immediately with no throttle.
+                            Set to None to start downloads as fast as max_in_flight allows.
+                            Ignored if the downloader has a rate_limiter.
+            max_in_flight: Maximum number of downloads running at the same time.
+            buffer_size: Maximum number of finished judgements buffered for the consumer.
+                         Defaults to max_in_flight.
+            parse_executor: Where to parse the XML: 'process' for a process pool,
+                            'thread' for a thread pool, an Executor instance, or
+                            None to parse inline on the event loop.
+            report: Optional DownloadReport that collects the failed index items,
+                    e.g. for a follow-up run with iter_judgements().
 
         Yields:
             Rechtsprechung objects in completion order (not index order).
@@ -300,41 +385,191 @@ class GermanJudgementDownloader:
         """
         if n < 1:
             raise ValueError("n must be at least 1")
-        return self._iter_first_n_judgements(n, max_per_second)
+        pipeline = self._pipeline(max_per_second, max_in_flight, buffer_size)
+        return self._iter_first_n_judgements(n, pipeline, parse_executor, report)
+
+    async def _iter_first_n_judgements(self, n: int, pipeline: DownloadPipeline, parse_executor: ParseExecutor,
+                                       report: DownloadReport[RIIIndexItem] | None) -> AsyncGenerator[Rechtsprechung, None]:
+        async with self._async_session() as client:
+            items = _take(self._aiter_judgement_index_items_async(client), n)
+            async with aclosing(self._iter_judgements(client, items, pipeline, parse_executor, report)) as judgements:
+                async for judgement in judgements:
+                    yield judgement
+
+    def iter_judgements(self,
+                        items: Iterable[RIIIndexItem],
+                        max_per_second: float | None = 1.0,
+                        max_in_flight: int = 16,
+                        buffer_size: int | None = None,
+                        parse_executor: ParseExecutor = None,
+                        report: DownloadReport[RIIIndexItem] | None = None,
+                        journal: CrawlJournal | str | Path | None = None) -> AsyncGenerator[Rechtsprechung, None]:
+        """
+        Asynchronously downloads the given judgements and yields them as they complete.
 
-    async def _iter_first_n_judgements(self, n: int, max_per_second: float | None) -> AsyncGenerator[Rechtsprechung, None]:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0)) as client:
-            items = await self._get_all_judgement_index_items_async(client)
-            async for judgement in self._iter_judgements(client, items[:n], max_per_second):
+        Takes the same options as iter_all_judgements() but downloads only the given
+        index items, e.g. the failed_items of a previous run's DownloadReport.
+        With a journal, items already recorded in it are skipped.
+
+        Args:
+            items: The index items of the judgements to download
+
+        Yields:
+            Rechtsprechung objects in completion order (not index order).
+        """
+        pipeline = self._pipeline(max_per_second, max_in_flight, buffer_size)
+        return self._iter_given_judgements(list(items), pipeline, parse_executor, report, journal)
+
+    async def _iter_given_judgements(self, items: list[RIIIndexItem], pipeline: DownloadPipeline,
+                                     parse_executor: ParseExecutor,
+                                     report: DownloadReport[RIIIndexItem] | None,
+                                     journal: CrawlJournal | str | Path | None) -> AsyncGenerator[Rechtsprechung, None]:
+        async with self._async_session() as client:
+            with open_journal(journal) as journal:
+                async with aclosing(self._iter_judgements(client, items, pipeline, parse_executor, report,
+                                                          journal)) as judgements:
+                    async for judgement in judgements:
+                        yield judgement
+
+    async def _iter_judgements(self, client: httpx.AsyncClient, items: Iterable[RIIIndexItem] | AsyncIterable[RIIIndexItem],
+                               pipeline: DownloadPipeline, parse_executor: ParseExecutor,
+                               report: DownloadReport[RIIIndexItem] | None = None,
+                               journal: CrawlJournal | None = None) -> AsyncGenerator[Rechtsprechung, None]:
+        async with aclosing(self._iter_downloaded(client, items, pipeline, parse_executor, report, journal)) as downloaded:
+            async for _, judgement in downloaded:
                 yield judgement
 
-    async def _iter_judgements(self, client: httpx.AsyncClient, items: list[RIIIndexItem], max_per_second: float | None) -> AsyncGenerator[Rechtsprechung, None]:
-        total = len(items)
-        logger.info(f"Starting async download of {total} judgements")
-        queue: asyncio.Queue[Rechtsprechung | None] = asyncio.Queue()
+    async def _iter_downloaded(self, client: httpx.AsyncClient, items: Iterable[RIIIndexItem] | AsyncIterable[RIIIndexItem],
+                               pipeline: DownloadPipeline, parse_executor: ParseExecutor,
+                               report: DownloadReport[RIIIndexItem] | None = None,
+                               journal: CrawlJournal | None = None) -> AsyncGenerator[tuple[RIIIndexItem, Rechtsprechung], None]:
+        logger.info("Starting async download of judgements")
+        downloaded = 0
+        if journal is not None:
+            items = self._skip_completed(items, journal, key=lambda item: item.link)
+
+        with open_parse_executor(parse_executor) as executor:
+            async def _download(item: RIIIndexItem) -> tuple[RIIIndexItem, Rechtsprechung, str | None]:
+                if journal is None:
+                    return item, await self._download_judgement_async(client, item.link, executor, item.modified), None
+                judgement, sha256 = await self._download_hashed_async(client, item.link, Rechtsprechung.from_xml,
+                                                                      executor,
+                                                                      self._judgement_cache_key(item.link, item.modified))
+                return item, judgement, sha256
+
+            results = pipeline.run(items, download=_download, describe=lambda item: f"judgement {item.aktenzeichen}",
+                                   report=report)
+            async with aclosing(results):
+                async for item, judgement, sha256 in results:
+                    downloaded += 1
+                    yield item, judgement
+                    if journal is not None:
+                        journal.record(item.link, sha256)
+
+        logger.info(f"Async download of judgements complete: {downloaded} downloaded")
+
+    def sync_judgements(self, previous: JudgementSyncState | Iterable[RIIIndexItem] | str | Path,
+                        workers: int | None = None,
+                        max_per_second: float | None = None,
+                        report: DownloadReport[RIIIndexItem] | None = None) -> list[JudgementChange]:
+        """
+        Downloads only the judgements that are new or changed since a previous index snapshot.
+
+        The current index is compared with the previous one by link; an item counts as
+        changed when its modified timestamp differs. Entries missing from the current
+        index are reported as deleted. If previous is a path or a JudgementSyncState
+        with a path, the state is updated and saved afterwards; judgements whose
+        download failed stay out of date and are retried by the next sync.
 
-        async def _worker(item: RIIIndexItem) -> None:
+        Args:
+            previous: The previous index as a list of RIIIndexItem, a JudgementSyncState,
+                      or the path of a JSON state file (a missing file means a full sync)
+            workers: Optional number of threads that download and parse in parallel.
+                     The threads share one connection pool and one rate limit.
+            max_per_second: Optional limit on the number of downloads started per second.
+                            Ignored if the downloader has a rate_limiter.
+            report: Optional DownloadReport that collects the RIIIndexItems of failed downloads
+
+        Returns:
+            A JudgementChange for every new, changed or deleted judgement; deleted
+            entries come first and carry no judgement
+
+        Raises:
+            ValueError: If the index cannot be retrieved
+        """
+        state = JudgementSyncState.coerce(previous)
+        with self._worker_session(workers):
+            diff = state.diff(self.get_all_judgement_index_items())
+            logger.info(f"Judgement sync: {len(diff.new)} new, {len(diff.changed)} changed, "
+                        f"{len(diff.deleted)} deleted, {len(diff.unchanged)} unchanged")
+
+            changes = []
+            for item in diff.deleted:
+                state.mark_deleted(item)
+                changes.append(JudgementChange('deleted', item))
+
+            to_download = diff.new + diff.changed
+            results = self._download_judgements(to_download, workers, max_per_second, report)
+            for i, (item, judgement) in enumerate(results):
+                if judgement is None:
+                    continue
+                state.mark_synced(item)
+                changes.append(JudgementChange('new' if i < len(diff.new) else 'changed', item, judgement))
+
+        state.save()
+        logger.info(f"Judgement sync completed: {len(changes) - len(diff.deleted)}/{len(to_download)} judgements downloaded")
+        return changes
+
+    async def iter_judgement_changes(self,
+                                     previous: JudgementSyncState | Iterable[RIIIndexItem] | str | Path,
+                                     max_per_second: float | None = 1.0,
+                                     max_in_flight: int = 16,
+                                     buffer_size: int | None = None,
+                                     parse_executor: ParseExecutor = None,
+                                     report: DownloadReport[RIIIndexItem] | None = None) -> AsyncGenerator[JudgementChange, None]:
+        """
+        Asynchronously downloads the judgements that are new or changed since a
+        previous index snapshot and yields them as they complete.
+
+        Works like sync_judgements(), but downloads in parallel like iter_all_judgements().
+        Deleted entries are yielded first. The state is saved when iteration ends, also
+        when it stops early, so an interrupted sync only repeats the missing downloads.
+
+        Args:
+            previous: The previous index as a list of RIIIndexItem, a JudgementSyncState,
+                      or the path of a JSON state file (a missing file means a full sync)
+            max_per_second: Maximum number of new downloads to start per second.
+                            Set to None to start downloads as fast as max_in_flight allows.
+                            Ignored if the downloader has a rate_limiter.
+            max_in_flight: Maximum number of downloads running at the same time.
+            buffer_size: Maximum number of finished judgements buffered for the consumer.
+                         Defaults to max_in_flight.
+            parse_executor: Where to parse the XML: 'process' for a process pool,
+                            'thread' for a thread pool, an Executor instance, or
+                            None to parse inline on the event loop.
+            report: Optional DownloadReport that collects the failed index items.
+                    They stay out of date in the state and are retried by the next sync.
+
+        Yields:
+            JudgementChange objects: deleted entries first, then new and changed
+            judgements in completion order.
+        """
+        state = JudgementSyncState.coerce(previous)
+        pipeline = self._pipeline(max_per_second, max_in_flight, buffer_size)
+        async with self._async_session() as client:
+            diff = state.diff(await self._get_all_judgement_index_items_async(client))
+            logger.info(f"Judgement sync: {len(diff.new)} new, {len(diff.changed)} changed, "
+                        f"{len(diff.deleted)} deleted, {len(diff.unchanged)} unchanged")
+            statuses = {item.link: 'new' for item in diff.new} | {item.link: 'changed' for item in diff.changed}
             try:
-                result = await self._download_judgement_async(client, item.link)
-                await queue.put(result)
-            except Exception as e:
-                logger.warning(f"Failed to download judgement {item.aktenzeichen}: {str(e)}")
-                await queue.put(None)
-
-        async def _producer() -> None:
-            delay = 1.0 / max_per_second if max_per_second is not None else 0.0
-            for item in items:
-                asyncio.create_task(_worker(item))
-                if delay > 0:
-                    await asyncio.sleep(delay)
-
-        asyncio.create_task(_producer())
-
-        received = 0
-        while received < total:
-            result = await queue.get()
-            received += 1
-            if result is not None:
-                yield result
-
-        logger.info(f"Async download of {total} judgements complete")
+                for item in diff.deleted:
+                    state.mark_deleted(item)
+                    yield JudgementChange('deleted', item)
+
+                downloaded = self._iter_downloaded(client, diff.new + diff.changed, pipeline, parse_executor, report)
+                async with aclosing(downloaded) as results:
+                    async for item, judgement in results:
+                        state.mark_synced(item)
+                        yield JudgementChange(statuses[item.link], item, judgement)
+            finally:
+                state.save()
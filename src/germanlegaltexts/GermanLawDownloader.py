@@ -1,80 +1,67 @@
-import asyncio
-import io
-import tempfile
+import hashlib
 import xml.etree.ElementTree as ET
-import zipfile
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable, Generator, Iterable
+from concurrent.futures import Executor
+from contextlib import aclosing
+from dataclasses import replace
 from pathlib import Path
 
 import httpx
 import logging
 
+from .BaseDownloader import BaseDownloader, open_zipped_xml
+from .CrawlJournal import CrawlJournal, open_journal
+from .DownloadPipeline import DownloadPipeline, ParseExecutor, open_parse_executor
+from .DownloadReport import DownloadReport
+from .SyncState import LawManifest, LawManifestEntry, LawSyncResult
 from .model.Gesetzbuch import Gesetzbuch
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
-class GermanLawDownloader:
+class GermanLawDownloader(BaseDownloader):
     base_url = 'https://www.gesetze-im-internet.de'
 
-    def download_law_xml(self, abbreviation: str) -> str:
-        url = f"{self.base_url}/{abbreviation.lower()}/xml.zip"
-        logger.debug(f"Downloading law XML for abbreviation '{abbreviation}' from {url}")
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            try:
-                response = httpx.get(url, follow_redirects=True)
-                if response.status_code != 200:
-                    logger.error(f"Download failed: HTTP {response.status_code} for {url}")
-                    raise ValueError(f"Failed to download the file: {url} - HTTP {response.status_code}")
+    def download_law_xml(self, url: str) -> str:
+        """
+        Downloads the XML content of a law book from a given URL.
 
-                with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                    z.extractall(tmpdir)
+        Args:
+            url: The URL to the xml.zip file of the law book
 
-                xml_files = [*Path(tmpdir).glob('*.xml')]
-                if len(xml_files) != 1:
-                    logger.error(f"Expected 1 XML file, found {len(xml_files)} for {abbreviation}")
-                    raise RuntimeError(f"Expected 1 XML file, found {len(xml_files)}")
-                else:
-                    with open(Path(tmpdir) / xml_files[0], 'rb') as xml_file:
-                        logger.debug(f"Successfully extracted XML: {xml_files[0].name}")
-                        return xml_file.read().decode('utf-8')
-            except Exception as e:
-                logger.error(f"Error processing {url}: {str(e)}")
-                raise ValueError(f"An error occurred while processing {url}: {str(e)}")
+        Returns:
+            The XML content as a string
 
-    def download_law_xml(self, url: str) -> str:
+        Raises:
+            ValueError: If the download fails or the ZIP doesn't contain exactly one XML file
+        """
         logger.debug(f"Downloading law XML from {url}")
+        return self._download_xml(url)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            try:
-                response = httpx.get(url, follow_redirects=True)
-                if response.status_code != 200:
-                    logger.error(f"Download failed: HTTP {response.status_code} for {url}")
-                    raise ValueError(f"Failed to download the file: {url} - HTTP {response.status_code}")
+    def download_law_xml_by_abbreviation(self, abbreviation: str) -> str:
+        """
+        Downloads the XML content of a law book by its abbreviation, e.g. 'BGB'.
 
-                with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                    z.extractall(tmpdir)
+        Args:
+            abbreviation: The abbreviation of the law book as used in its URL
 
-                xml_files = [*Path(tmpdir).glob('*.xml')]
-                if len(xml_files) != 1:
-                    logger.error(f"Expected 1 XML file, found {len(xml_files)} in {url}")
-                    raise RuntimeError(f"Expected 1 XML file, found {len(xml_files)}")
-                else:
-                    with open(Path(tmpdir) / xml_files[0], 'rb') as xml_file:
-                        logger.debug(f"Successfully extracted XML: {xml_files[0].name}")
-                        return xml_file.read().decode('utf-8')
-            except Exception as e:
-                logger.error(f"Error processing {url}: {str(e)}")
-                raise ValueError(f"An error occurred while processing {url}: {str(e)}")
+        Returns:
+            The XML content as a string
+
+        Raises:
+            ValueError: If the download fails or the ZIP doesn't contain exactly one XML file
+        """
+        url = f"{self.base_url}/{abbreviation.lower()}/xml.zip"
+        logger.debug(f"Downloading law XML for abbreviation '{abbreviation}' from {url}")
+        return self._download_xml(url)
 
     def download_law_book(self, url: str) -> Gesetzbuch:
         """
-        Downloads the law book for a given abbreviation and returns it as a Gesetzbuch object.
+        Downloads the law book from a given URL and returns it as a Gesetzbuch object.
 
         Args:
-            abbreviation: The abbreviation of the law book to download
+            url: The URL to the xml.zip file of the law book
 
         Returns:
             A Gesetzbuch object representing the downloaded law book
@@ -82,8 +69,8 @@ class GermanLawDownloader:
         Raises:
             ValueError: If the download fails or the XML cannot be parsed
         """
-        xml_content = self.download_law_xml(url)
-        return Gesetzbuch.from_xml(xml_content)
+        logger.debug(f"Downloading law book from {url}")
+        return self._download_parsed(url, Gesetzbuch.from_xml)
 
     def get_all_xml_paths(self) -> list:
         """
@@ -100,7 +87,7 @@ class GermanLawDownloader:
         logger.debug(f"Fetching law index from {toc_url}")
 
         try:
-            response = httpx.get(toc_url, follow_redirects=True)
+            response = self._get(toc_url)
             if response.status_code != 200:
                 logger.error(f"Failed to download TOC: HTTP {response.status_code}")
                 raise ValueError(f"Failed to download the TOC XML file: {toc_url} - HTTP {response.status_code}")
@@ -111,10 +98,9 @@ class GermanLawDownloader:
             all_xml_paths = []
 
             for item in root.findall('.//item'):
-                link_element = item.find('link')
-                if link_element is not None and link_element.text:
-                    link = link_element.text.strip()
-                    all_xml_paths.append(link.replace('http://', 'https://', 1))
+                xml_path = self._xml_path_from_item(item)
+                if xml_path:
+                    all_xml_paths.append(xml_path)
 
             logger.info(f"Retrieved {len(all_xml_paths)} law book entries from index")
             return all_xml_paths
@@ -125,54 +111,189 @@ class GermanLawDownloader:
             logger.error(f"Error processing TOC: {str(e)}")
             raise ValueError(f"An error occurred while processing the TOC XML file: {str(e)}")
 
-    def download_all_law_books(self) -> list[Gesetzbuch]:
+    def iter_xml_paths(self) -> Generator[str, None, None]:
+        """
+        Streams the XML paths from https://www.gesetze-im-internet.de/gii-toc.xml.
+
+        Unlike get_all_xml_paths(), the index is parsed incrementally while it
+        downloads and each path is yielded as soon as its <item> is complete.
+
+        Yields:
+            The XML path of each law book in index order
+
+        Raises:
+            ValueError: If the TOC XML file cannot be downloaded or parsed
+        """
+        toc_url = f"{self.base_url}/gii-toc.xml"
+        logger.debug(f"Streaming law index from {toc_url}")
+        try:
+            for item in self._iter_toc_items(toc_url):
+                xml_path = self._xml_path_from_item(item)
+                if xml_path:
+                    yield xml_path
+        except ET.ParseError as e:
+            logger.error(f"Failed to parse TOC XML: {str(e)}")
+            raise ValueError(f"Failed to parse the TOC XML file: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error processing TOC: {str(e)}")
+            raise ValueError(f"An error occurred while processing the TOC XML file: {str(e)}")
+
+    def _xml_path_from_item(self, item: ET.Element) -> str | None:
+        link = item.findtext('link')
+        if not link:
+            return None
+        return link.strip().replace('http://', 'https://', 1)
+
+    def download_all_law_books(self, incremental: LawManifest | str | Path | None = None,
+                               workers: int | None = None,
+                               max_per_second: float | None = None,
+                               report: DownloadReport[str] | None = None) -> list[Gesetzbuch] | LawSyncResult:
         """
         Downloads all law books available from the German legal texts website.
 
         This method calls get_all_xml_paths() to get URLs for all available law books,
         then downloads each one by calling download_law_book() for each URL.
 
+        If incremental is given, only law books that changed since the manifest was
+        written are downloaded and parsed (see sync_law_books()).
+
+        Args:
+            incremental: Optional LawManifest or path of a manifest JSON file
+            workers: Optional number of threads that download and parse in parallel.
+                     The threads share one connection pool and one rate limit.
+            max_per_second: Optional limit on the number of downloads started per second.
+                            Ignored if the downloader has a rate_limiter.
+            report: Optional DownloadReport that collects the URLs of failed downloads.
+                    In incremental mode they are also listed in LawSyncResult.failed.
+
         Returns:
-            A list of Gesetzbuch objects representing all downloaded law books
+            A list of Gesetzbuch objects representing all downloaded law books in index
+            order, or a LawSyncResult in incremental mode
 
         Raises:
             ValueError: If there are issues downloading the index page or any law book
         """
-        xml_paths = self.get_all_xml_paths()
-        logger.info(f"Starting download of {len(xml_paths)} law books")
+        if incremental is not None:
+            return self.sync_law_books(incremental, workers=workers, max_per_second=max_per_second, report=report)
 
-        law_books = []
+        with self._worker_session(workers):
+            xml_paths = self.get_all_xml_paths()
+            logger.info(f"Starting download of {len(xml_paths)} law books")
 
-        for i, xml_path in enumerate(xml_paths, 1):
-            try:
-                law_book = self.download_law_book(xml_path)
-                law_books.append(law_book)
+            law_books = []
+            results = self._download_each(xml_paths, self.download_law_book, lambda path: f"law book from {path}",
+                                          workers=workers, max_per_second=max_per_second, report=report)
+            for i, (_, law_book) in enumerate(results, 1):
+                if law_book is not None:
+                    law_books.append(law_book)
 
                 if i % 50 == 0:
                     logger.info(f"Progress: {i}/{len(xml_paths)} law books downloaded")
-            except Exception as e:
-                logger.warning(f"Failed to download law book from {xml_path}: {str(e)}")
-                continue
 
         logger.info(f"Completed: {len(law_books)}/{len(xml_paths)} law books downloaded successfully")
         return law_books
 
-    async def _get_all_xml_paths_async(self, client: httpx.AsyncClient) -> list[str]:
+    def sync_law_books(self, manifest: LawManifest | str | Path,
+                       workers: int | None = None,
+                       max_per_second: float | None = None,
+                       report: DownloadReport[str] | None = None) -> LawSyncResult:
+        """
+        Downloads only the law books that changed since the manifest was written.
+
+        Every law book in the index is revalidated with a conditional request using
+        the ETag/Last-Modified stored in the manifest. A 304 answer, or a payload
+        whose SHA-256 matches the manifest, counts as unchanged and is not parsed.
+        Otherwise the book is parsed; it is reported as changed unless its builddate
+        and doknr are the same as before. URLs that left the index are reported as
+        removed. The manifest is updated and, if it has a path, saved afterwards.
+
+        Args:
+            manifest: A LawManifest or the path of a manifest JSON file
+                      (a missing file means a full download)
+            workers: Optional number of threads that download and parse in parallel.
+                     The threads share one connection pool and one rate limit.
+            max_per_second: Optional limit on the number of downloads started per second.
+                            Ignored if the downloader has a rate_limiter.
+            report: Optional DownloadReport that collects the URLs of failed downloads
+                    and why they failed, in addition to LawSyncResult.failed
+
+        Returns:
+            A LawSyncResult with the new and changed books, the manifest entries of
+            the unchanged ones, and the removed and failed URLs
+
+        Raises:
+            ValueError: If the index cannot be retrieved
+        """
+        manifest = LawManifest.coerce(manifest)
+        with self._worker_session(workers):
+            xml_paths = self.get_all_xml_paths()
+            logger.info(f"Starting incremental sync of {len(xml_paths)} law books")
+
+            result = LawSyncResult()
+            current = set(xml_paths)
+            for entry in manifest.entries:
+                if entry.url not in current:
+                    manifest.remove(entry.url)
+                    result.removed.append(entry.url)
+
+            results = self._download_each(xml_paths, lambda path: self._sync_law_book(path, manifest.get(path)),
+                                          lambda path: f"law book from {path}",
+                                          workers=workers, max_per_second=max_per_second, report=report)
+            for i, (xml_path, synced) in enumerate(results, 1):
+                if synced is None:
+                    result.failed.append(xml_path)
+                    continue
+                status, law_book, entry = synced
+                manifest.update(entry)
+                if status == 'new':
+                    result.new.append(law_book)
+                elif status == 'changed':
+                    result.changed.append(law_book)
+                else:
+                    result.unchanged.append(entry)
+
+                if i % 50 == 0:
+                    logger.info(f"Progress: {i}/{len(xml_paths)} law books checked")
+
+        manifest.save()
+        logger.info(f"Law book sync completed: {len(result.new)} new, {len(result.changed)} changed, "
+                    f"{len(result.unchanged)} unchanged, {len(result.removed)} removed, {len(result.failed)} failed")
+        return result
+
+    def _sync_law_book(self, url: str, previous: LawManifestEntry | None) -> tuple[str, Gesetzbuch | None, LawManifestEntry]:
+        response = self._get(url, headers=previous.request_headers() if previous is not None else None)
+        if response.status_code == 304 and previous is not None:
+            logger.debug(f"Law book not modified: {url}")
+            return 'unchanged', None, previous
+        if response.status_code != 200:
+            logger.error(f"Download failed: HTTP {response.status_code} for {url}")
+            raise ValueError(f"Failed to download the file: {url} - HTTP {response.status_code}")
+
+        sha256 = hashlib.sha256(response.content).hexdigest()
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        if previous is not None and previous.sha256 == sha256:
+            return 'unchanged', None, replace(previous, etag=etag, last_modified=last_modified)
+
+        with open_zipped_xml(response.content) as xml_file:
+            law_book = Gesetzbuch.from_xml(xml_file)
+        entry = LawManifestEntry(url=url, builddate=law_book.builddate, doknr=law_book.doknr,
+                                 sha256=sha256, etag=etag, last_modified=last_modified)
+        if previous is None:
+            return 'new', law_book, entry
+        if (previous.builddate, previous.doknr) == (law_book.builddate, law_book.doknr):
+            return 'unchanged', None, entry
+        return 'changed', law_book, entry
+
+    async def _aiter_xml_paths_async(self, client: httpx.AsyncClient) -> AsyncGenerator[str, None]:
         toc_url = f"{self.base_url}/gii-toc.xml"
-        logger.debug(f"Fetching law index async from {toc_url}")
+        logger.debug(f"Streaming law index async from {toc_url}")
         try:
-            response = await client.get(toc_url)
-            if response.status_code != 200:
-                logger.error(f"Failed to download TOC: HTTP {response.status_code}")
-                raise ValueError(f"Failed to download the TOC XML file: {toc_url} - HTTP {response.status_code}")
-            root = ET.fromstring(response.text)
-            paths = []
-            for item in root.findall('.//item'):
-                link = item.findtext('link')
-                if link:
-                    paths.append(link.strip().replace('http://', 'https://', 1))
-            logger.info(f"Retrieved {len(paths)} law book entries from index")
-            return paths
+            async with aclosing(self._aiter_toc_items(client, toc_url)) as items:
+                async for item in items:
+                    xml_path = self._xml_path_from_item(item)
+                    if xml_path:
+                        yield xml_path
         except ET.ParseError as e:
             logger.error(f"Failed to parse TOC XML: {str(e)}")
             raise ValueError(f"Failed to parse the TOC XML file: {str(e)}")
@@ -180,70 +301,118 @@ class GermanLawDownloader:
             logger.error(f"Error processing TOC: {str(e)}")
             raise ValueError(f"An error occurred while processing the TOC XML file: {str(e)}")
 
-    async def _download_law_xml_async(self, client: httpx.AsyncClient, url: str) -> str:
-        logger.debug(f"Downloading law XML async from {url}")
-        try:
-            response = await client.get(url)
-            if response.status_code != 200:
-                logger.error(f"Download failed: HTTP {response.status_code} for {url}")
-                raise ValueError(f"Failed to download the file: {url} - HTTP {response.status_code}")
-            with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                xml_files = [f for f in z.namelist() if f.endswith('.xml')]
-                if len(xml_files) != 1:
-                    logger.error(f"Expected 1 XML file, found {len(xml_files)} in {url}")
-                    raise RuntimeError(f"Expected 1 XML file, found {len(xml_files)}")
-                return z.read(xml_files[0]).decode('utf-8')
-        except Exception as e:
-            logger.error(f"Error processing {url}: {str(e)}")
-            raise ValueError(f"An error occurred while processing {url}: {str(e)}")
-
-    async def _download_law_book_async(self, client: httpx.AsyncClient, url: str) -> Gesetzbuch:
-        xml_content = await self._download_law_xml_async(client, url)
-        return Gesetzbuch.from_xml(xml_content)
-
-    async def iter_all_law_books(self, max_per_second: float | None = 1.0) -> AsyncGenerator[Gesetzbuch, None]:
+    async def _download_law_book_async(self, client: httpx.AsyncClient, url: str,
+                                       executor: Executor | None = None) -> Gesetzbuch:
+        archive = await self._download_archive_async(client, url)
+        return await self._parse_archive_async(archive, url, Gesetzbuch.from_xml, executor)
+
+    async def iter_all_law_books(self,
+                                 max_per_second: float | None = 1.0,
+                                 max_in_flight: int = 16,
+                                 buffer_size: int | None = None,
+                                 parse_executor: ParseExecutor = None,
+                                 report: DownloadReport[str] | None = None,
+                                 journal: CrawlJournal | str | Path | None = None) -> AsyncGenerator[Gesetzbuch, None]:
         """
         Asynchronously downloads all law books and yields them as they complete.
 
         Downloads are started at a controlled rate and run in parallel — multiple
         downloads can be in-flight simultaneously while new ones are started at
-        most max_per_second times per second.
+        most max_per_second times per second. At most max_in_flight downloads run
+        at once and at most buffer_size finished books wait for the consumer, so a
+        slow consumer throttles the downloads. The index is streamed, so the first
+        downloads start before gii-toc.xml has fully arrived.
+
+        Parsing runs on the event loop unless parse_executor is given. With
+        'process', large codes are parsed on all cores while the loop keeps
+        serving the network.
 
         Args:
             max_per_second: Maximum number of new downloads to start per second.
-                            Set to None to start all downloads immediately with no throttle.
+                            Set to None to start downloads as fast as max_in_flight allows.
+                            Ignored if the downloader has a rate_limiter.
+            max_in_flight: Maximum number of downloads running at the same time.
+            buffer_size: Maximum number of finished law books buffered for the consumer.
+                         Defaults to max_in_flight.
+            parse_executor: Where to parse the XML: 'process' for a process pool,
+                            'thread' for a thread pool, an Executor instance, or
+                            None to parse inline on the event loop.
+            report: Optional DownloadReport that collects the URLs of failed downloads,
+                    e.g. for a follow-up run with iter_law_books().
+            journal: Optional CrawlJournal, or the path of its file, that makes the
+                     crawl resumable. Law books already recorded in it are skipped,
+                     and each book is recorded once the consumer asks for the next
+                     one, so a book still being processed when the crawl died is
+                     delivered again after the restart.
+
+        Yields:
+            Gesetzbuch objects in completion order (not index order).
+        """
+        pipeline = self._pipeline(max_per_second, max_in_flight, buffer_size)
+        async with self._async_session() as client:
+            with open_journal(journal) as journal:
+                logger.info("Starting async download of law books while streaming the index")
+                paths = self._aiter_xml_paths_async(client)
+                async with aclosing(self._iter_law_books(client, paths, pipeline, parse_executor, report,
+                                                         journal)) as books:
+                    async for book in books:
+                        yield book
+
+    async def iter_law_books(self,
+                             urls: Iterable[str],
+                             max_per_second: float | None = 1.0,
+                             max_in_flight: int = 16,
+                             buffer_size: int | None = None,
+                             parse_executor: ParseExecutor = None,
+                             report: DownloadReport[str] | None = None,
+                             journal: CrawlJournal | str | Path | None = None) -> AsyncGenerator[Gesetzbuch, None]:
+        """
+        Asynchronously downloads the given law books and yields them as they complete.
+
+        Takes the same options as iter_all_law_books() but downloads only the given
+        URLs, e.g. the failed_items of a previous run's DownloadReport. With a
+        journal, URLs already recorded in it are skipped.
+
+        Args:
+            urls: The xml.zip URLs of the law books to download
 
         Yields:
             Gesetzbuch objects in completion order (not index order).
         """
-        async with httpx.AsyncClient(timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0)) as client:
-            paths = await self._get_all_xml_paths_async(client)
-            total = len(paths)
-            logger.info(f"Starting async download of {total} law books")
-            queue: asyncio.Queue[Gesetzbuch | None] = asyncio.Queue()
-
-            async def _worker(path: str) -> None:
-                try:
-                    result = await self._download_law_book_async(client, path)
-                    await queue.put(result)
-                except Exception as e:
-                    logger.warning(f"Failed to download law book from {path}: {str(e)}")
-                    await queue.put(None)
-
-            async def _producer() -> None:
-                delay = 1.0 / max_per_second if max_per_second is not None else 0.0
-                for path in paths:
-                    asyncio.create_task(_worker(path))
-                    if delay > 0:
-                        await asyncio.sleep(delay)
-
-            asyncio.create_task(_producer())
-
-            received = 0
-            while received < total:
-                item = await queue.get()
-                received += 1
-                if item is not None:
-                    yield item
-
-            logger.info(f"Async download of {total} law books complete")
+        pipeline = self._pipeline(max_per_second, max_in_flight, buffer_size)
+        async with self._async_session() as client:
+            with open_journal(journal) as journal:
+                async with aclosing(self._iter_law_books(client, list(urls), pipeline, parse_executor, report,
+                                                         journal)) as books:
+                    async for book in books:
+                        yield book
+
+    async def _iter_law_books(self, client: httpx.AsyncClient, urls: Iterable[str] | AsyncIterable[str],
+                              pipeline: DownloadPipeline, parse_executor: ParseExecutor,
+                              report: DownloadReport[str] | None,
+                              journal: CrawlJournal | None = None) -> AsyncGenerator[Gesetzbuch, None]:
+        downloaded = 0
+        if journal is not None:
+            urls = self._skip_completed(urls, journal, key=lambda path: path)
+
+        with open_parse_executor(parse_executor) as executor:
+            async def _download(path: str) -> tuple[str, Gesetzbuch, str | None]:
+                if journal is None:
+                    return path, await self._download_law_book_async(client, path, executor), None
+                book, sha256 = await self._download_hashed_async(client, path, Gesetzbuch.from_xml, executor)
+                return path, book, sha256
+
+            results = pipeline.run(
+                urls,
+                download=_download,
+                describe=lambda path: f"law book from {path}",
+                report=report,
+            )
+            async with aclosing(results) as books:
+                async for path, book, sha256 in books:
+                    downloaded += 1
+                    yield book
+                    if journal is not None:
+                        journal.record(path, sha256)
+
+        logger.info(f"Async download of law books complete: {downloaded} downloaded")
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class HttpCache:
+    """
+    On-disk cache for raw HTTP responses, revalidated with conditional requests.
+
+    Each cached URL is stored as a body file plus a small JSON file holding the
+    response's ETag and Last-Modified validators. Before a request the cache adds
+    If-None-Match / If-Modified-Since headers; a 304 answer is then served from
+    disk. The total body size is capped and the least recently used entries are
+    evicted first.
+    """
+
+    _stored_headers = ('etag', 'last-modified', 'content-type')
+
+    def __init__(self, directory: str | Path, max_size: int | None = 2 * 1024 ** 3):
+        """
+        Args:
+            directory: Directory to store the cached responses in. Created if missing.
+            max_size: Maximum total size of the cached bodies in bytes.
+                      Set to None for an unbounded cache.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # Body sizes by key, least recently used first, and their sum
+        self._entries: OrderedDict[str, int] | None = None
+        self._total = 0
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _load_entries(self) -> OrderedDict[str, int]:
+        if self._entries is None:
+            found = []
+            for meta_path in self.directory.glob('*.json'):
+                body_path = meta_path.with_suffix('.body')
+                try:
+                    found.append((meta_path.stat().st_mtime, meta_path.stem, body_path.stat().st_size))
+                except FileNotFoundError:
+                    continue
+            found.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in found)
+            self._total = sum(self._entries.values())
+        return self._entries
+
+    def _set_entry(self, key: str, size: int) -> None:
+        """Records the size of an entry and marks it as most recently used. Call with the lock held."""
+        entries = self._load_entries()
+        self._total += size - entries.get(key, 0)
+        entries[key] = size
+        entries.move_to_end(key)
+
+    def _read_meta(self, key: str) -> dict | None:
+        try:
+            with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached bodies in bytes."""
+        with self._lock:
+            self._load_entries()
+            return self._total
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        """
+        Returns the conditional request headers for a URL.
+
+        Args:
+            url: The URL about to be requested
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, or an empty dict if the URL
+            is not cached
+        """
+        key = self._key(url)
+        meta = self._read_meta(key)
+        if meta is None or not self._body_path(key).exists():
+            return {}
+        headers = {}
+        if 'etag' in meta['headers']:
+            headers['If-None-Match'] = meta['headers']['etag']
+        if 'last-modified' in meta['headers']:
+            headers['If-Modified-Since'] = meta['headers']['last-modified']
+        return headers
+
+    def update(self, url: str, response: httpx.Response) -> httpx.Response | None:
+        """
+        Updates the cache with the response to a (possibly conditional) request.
+
+        A 200 response carrying a validator is stored. A 304 response is replaced
+        by a 200 response built from the cached body.
+
+        Args:
+            url: The requested URL
+            response: The server's response
+
+        Returns:
+            The response to hand to the caller, or None if the server answered 304
+            but the cached body has disappeared in the meantime
+        """
+        key = self._key(url)
+        if response.status_code == 304:
+            meta = self._read_meta(key)
+            try:
+                body = self._body_path(key).read_bytes()
+            except FileNotFoundError:
+                body = None
+            if meta is None or body is None:
+                logger.debug(f"Cache entry for {url} vanished before revalidation completed")
+                return None
+            self._touch(key, len(body))
+            logger.debug(f"Serving {url} from cache (304 Not Modified)")
+            return httpx.Response(200, headers=meta['headers'], content=body, request=response.request)
+
+        if response.status_code == 200:
+            headers = {name: response.headers[name] for name in self._stored_headers if name in response.headers}
+            if 'etag' in headers or 'last-modified' in headers:
+                self._store(key, url, headers, response.content)
+        return response
+
+    def _touch(self, key: str, size: int) -> None:
+        now = time.time()
+        try:
+            os.utime(self._meta_path(key), (now, now))
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._set_entry(key, size)
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _store(self, key: str, url: str, headers: dict[str, str], body: bytes) -> None:
+        if self.max_size is not None and len(body) > self.max_size:
+            logger.debug(f"Not caching {url}: {len(body)} bytes exceeds the cache size limit")
+            return
+        self._write_atomic(self._body_path(key), body)
+        self._write_atomic(self._meta_path(key), json.dumps({'url': url, 'headers': headers}).encode('utf-8'))
+        with self._lock:
+            self._set_entry(key, len(body))
+            self._evict()
+        logger.debug(f"Cached {len(body)} bytes for {url}")
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+        entries = self._load_entries()
+        while self._total > self.max_size and entries:
+            key, size = entries.popitem(last=False)
+            for path in (self._meta_path(key), self._body_path(key)):
+                path.unlink(missing_ok=True)
+            self._total -= size
+            logger.debug(f"Evicted cache entry {key} ({size} bytes)")
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        with self._lock:
+            for key in list(self._load_entries()):
+                for path in (self._meta_path(key), self._body_path(key)):
+                    path.unlink(missing_ok=True)
+            self._entries = OrderedDict()
+            self._total = 0
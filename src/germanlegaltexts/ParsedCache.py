@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Callable
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .model.Gesetzbuch import Gesetzbuch
+from .model.Rechtsprechung import Rechtsprechung
+from .model.Serializable import schema_fingerprint
+from .model.XmlSource import XmlSource, peek_root_attributes, read_xml_source
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+R = TypeVar('R')
+
+
+def _package_version() -> str:
+    try:
+        return version('germanlegaltexts')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+@cache
+def _model_schema() -> str:
+    return schema_fingerprint(Gesetzbuch, Rechtsprechung)
+
+
+def root_cache_key(source: XmlSource) -> tuple[str, str] | None:
+    """
+    Returns the (doknr, builddate) of a law book XML, read from the root's start
+    tag only, or None if the root doesn't carry both attributes.
+    """
+    attributes = peek_root_attributes(source)
+    doknr, builddate = attributes.get('doknr'), attributes.get('builddate')
+    if not doknr or not builddate:
+        return None
+    return doknr, builddate
+
+
+class ParsedCache:
+    """
+    On-disk cache of parsed Gesetzbuch and Rechtsprechung objects.
+
+    An entry is looked up by a document key (a law book's doknr, a judgement's
+    URL) and is only valid for one stamp (the builddate, or the judgement's
+    modified timestamp from the index), one package version and one layout of
+    the model classes. Each key has a single file, so storing a newer stamp
+    replaces the stale entry, and entries written by another version of the
+    package, or by a checkout whose model fields differ, are ignored and
+    overwritten. The layout is checked too because an editable install keeps
+    reporting the same version while the model changes.
+
+    Objects with a to_tuple() codec are pickled in their compact tuple form,
+    which is smaller and faster to load than the pickled dataclasses. Only use a
+    directory that nobody else can write to.
+    """
+
+    def __init__(self, directory: str | Path, version: str | None = None):
+        """
+        Args:
+            directory: Directory to store the parsed objects in. Created if missing.
+            version: Version entries are valid for. Defaults to the installed
+                     package version, so upgrading invalidates the whole cache.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.version = version if version is not None else _package_version()
+        self.schema = _model_schema()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.pickle"
+
+    def load(self, key: str, stamp: str) -> Any | None:
+        """
+        Returns the cached object for key, or None if there is none for this stamp, version and model layout.
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                # The header is read first, so a stale entry is rejected without loading the object
+                if pickle.load(f) != (self.version, self.schema, stamp):
+                    return None
+                cls, data = pickle.load(f)
+                return cls.from_tuple(data) if cls is not None else data
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry for {key}: {str(e)}")
+            return None
+
+    def store(self, key: str, stamp: str, obj: Any) -> None:
+        """Caches obj for key and stamp, replacing any previous entry for key."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((self.version, self.schema, stamp), f, protocol=pickle.HIGHEST_PROTOCOL)
+                payload = (type(obj), obj.to_tuple()) if hasattr(obj, 'to_tuple') else (None, obj)
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load_or_parse(self, key: str, stamp: str, parse: Callable[[], R]) -> R:
+        """
+        Returns the cached object for key and stamp, or calls parse() and caches its result.
+        """
+        cached = self.load(key, stamp)
+        if cached is not None:
+            logger.debug(f"Loaded parsed {key} ({stamp}) from cache")
+            return cached
+        obj = parse()
+        self.store(key, stamp, obj)
+        return obj
+
+    def parse(self, parse: Callable[[XmlSource], R], xml_content: XmlSource,
+              cache_key: tuple[str, str] | None = None) -> R:
+        """
+        Parses xml_content with parse() unless an up-to-date object is cached.
+
+        Args:
+            parse: Gesetzbuch.from_xml or Rechtsprechung.from_xml
+            xml_content: The XML as text, bytes or a binary file-like object. A
+                         seekable file is rewound after its root has been peeked
+                         at; any other file is read into memory first.
+            cache_key: The (key, stamp) of the document. Defaults to the doknr and
+                       builddate attributes of the root, which law books carry;
+                       without either, the content is parsed and not cached.
+
+        Returns:
+            The parsed or cached object
+        """
+        if cache_key is None:
+            if isinstance(xml_content, (str, bytes, bytearray, memoryview)):
+                cache_key = root_cache_key(xml_content)
+            elif xml_content.seekable():
+                position = xml_content.tell()
+                cache_key = root_cache_key(xml_content)
+                xml_content.seek(position)
+            else:
+                xml_content = read_xml_source(xml_content)
+                cache_key = root_cache_key(xml_content)
+            if cache_key is None:
+                return parse(xml_content)
+        return self.load_or_parse(*cache_key, lambda: parse(xml_content))
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a Retry-After header.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        The delay in seconds, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how many requests are started per second.
+
+    Tokens refill continuously at the current rate up to burst. Callers reserve
+    a token and wait until it is due, so the rate doesn't drift with the time
+    spent between calls. One limiter can be shared by several downloaders,
+    threads and event loops; they all draw from the same bucket.
+
+    If adaptive, the rate follows the servers' pushback (AIMD): every 429 or 5xx
+    answer, and every response slower than target_latency, halves the rate down
+    to min_per_second, while each fast successful response adds increase_per_second
+    back up to max_per_second. A Retry-After header pauses all callers until it
+    has passed.
+    """
+
+    def __init__(self,
+                 max_per_second: float,
+                 burst: int = 1,
+                 adaptive: bool = True,
+                 min_per_second: float | None = None,
+                 increase_per_second: float | None = None,
+                 decrease_factor: float = 0.5,
+                 target_latency: float | None = None):
+        """
+        Args:
+            max_per_second: Maximum (and initial) number of requests started per second
+            burst: Number of requests that may start at once after an idle period
+            adaptive: Adjust the rate to 429/5xx responses, Retry-After and latency
+            min_per_second: Lower bound of the adaptive rate. Defaults to max_per_second / 32.
+            increase_per_second: Additive increase per successful response.
+                                 Defaults to max_per_second / 32.
+            decrease_factor: Multiplicative decrease on pushback, between 0 and 1
+            target_latency: Responses slower than this many seconds count as pushback.
+                            None ignores latency.
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if max_per_second <= 0:
+            raise ValueError("max_per_second must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.max_per_second = max_per_second
+        self.min_per_second = min_per_second if min_per_second is not None else max_per_second / 32
+        if not 0 < self.min_per_second <= max_per_second:
+            raise ValueError("min_per_second must be positive and at most max_per_second")
+        self.increase_per_second = increase_per_second if increase_per_second is not None else max_per_second / 32
+        self.decrease_factor = decrease_factor
+        self.target_latency = target_latency
+        self.burst = burst
+        self.adaptive = adaptive
+
+        self._lock = threading.Lock()
+        self._rate = max_per_second
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = float('-inf')
+
+    @property
+    def rate(self) -> float:
+        """The current number of requests allowed per second."""
+        return self._rate
+
+    def acquire(self) -> None:
+        """Blocks until the caller may start its next request."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits without blocking the event loop until the caller may start its next request."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_response(self, status_code: int, latency: float | None = None, retry_after: str | None = None) -> None:
+        """
+        Feeds a response back into the adaptive rate.
+
+        Args:
+            status_code: The HTTP status of the response
+            latency: Seconds until the response headers arrived
+            retry_after: The Retry-After header, if any
+        """
+        if not self.adaptive:
+            return
+        pushback = status_code == 429 or status_code >= 500
+        slow = self.target_latency is not None and latency is not None and latency > self.target_latency
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            delay = parse_retry_after(retry_after) if pushback else None
+            if delay:
+                self._paused_until = max(self._paused_until, now + delay)
+                self._tokens = min(self._tokens, 0.0)
+                logger.info(f"Server asked to retry after {delay:.1f}s, pausing requests")
+            if pushback or slow:
+                # One decrease per interval at the current rate, so a burst of
+                # failures from requests already in flight counts as one event
+                if now - self._last_decrease >= 1 / self._rate:
+                    self._rate = max(self.min_per_second, self._rate * self.decrease_factor)
+                    self._last_decrease = now
+                    reason = f"HTTP {status_code}" if pushback else f"{latency:.1f}s latency"
+                    logger.info(f"Reducing request rate to {self._rate:.2f}/s after {reason}")
+            elif status_code < 400:
+                self._rate = min(self.max_per_second, self._rate + self.increase_per_second)
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue while paused by Retry-After
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(float(self.burst), self._tokens + (now - start) * self._rate)
+        self._updated = max(self._updated, now)
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            # A negative balance is the queue of callers that already hold a reservation
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            return max(0.0, self._paused_until - now) + delay
@@ -0,0 +1,59 @@
+import random
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how often a failed request is retried.
+
+    The delay before retry n is drawn uniformly from [0, backoff * 2 ** (n - 1)],
+    capped at max_backoff ("full jitter"), so many workers that failed together
+    don't retry in lockstep. A longer Retry-After from the server takes precedence.
+    """
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+    retry_exceptions: tuple[type[BaseException], ...] = (httpx.TransportError,)
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.backoff < 0 or self.max_backoff < 0:
+            raise ValueError("backoff and max_backoff must not be negative")
+
+    def should_retry(self, attempt: int, status_code: int | None = None, error: BaseException | None = None) -> bool:
+        """
+        Args:
+            attempt: The number of the attempt that just failed, starting at 1
+            status_code: The HTTP status of the response, if one arrived
+            error: The exception raised instead of a response
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if error is not None:
+            return isinstance(error, self.retry_exceptions)
+        return status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Args:
+            attempt: The number of the attempt that just failed, starting at 1
+            retry_after: The server's Retry-After in seconds, if any
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -0,0 +1,229 @@
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .model.Gesetzbuch import Gesetzbuch
+from .model.Rechtsprechung import Rechtsprechung, RIIIndexItem
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@dataclass
+class IndexDiff:
+    """Difference between two snapshots of the judgement index, matched by link."""
+    new: list[RIIIndexItem] = field(default_factory=list)
+    changed: list[RIIIndexItem] = field(default_factory=list)
+    unchanged: list[RIIIndexItem] = field(default_factory=list)
+    deleted: list[RIIIndexItem] = field(default_factory=list)
+
+    @classmethod
+    def between(cls, previous: Iterable[RIIIndexItem], current: Iterable[RIIIndexItem]) -> 'IndexDiff':
+        """
+        Compares two index snapshots.
+
+        An item is changed if its modified timestamp differs from the previous snapshot.
+
+        Args:
+            previous: The index as of the last sync
+            current: The current index
+
+        Returns:
+            An IndexDiff; new, changed and unchanged keep the order of current
+        """
+        previous_by_link = {item.link: item for item in previous}
+        diff = cls()
+        seen = set()
+        for item in current:
+            seen.add(item.link)
+            old = previous_by_link.get(item.link)
+            if old is None:
+                diff.new.append(item)
+            elif old.modified != item.modified:
+                diff.changed.append(item)
+            else:
+                diff.unchanged.append(item)
+        diff.deleted = [item for link, item in previous_by_link.items() if link not in seen]
+        return diff
+
+
+@dataclass
+class JudgementChange:
+    """A single change found by an incremental judgement sync."""
+    status: str
+    item: RIIIndexItem
+    judgement: Rechtsprechung | None = None
+
+
+class JudgementSyncState:
+    """
+    Local store of the judgement index as of the last successful sync.
+
+    Only items that were actually downloaded are recorded, so a judgement whose
+    download failed is picked up again by the next sync.
+    """
+
+    def __init__(self, items: Iterable[RIIIndexItem] = (), path: str | Path | None = None):
+        """
+        Args:
+            items: The index items known to be in sync
+            path: Optional JSON file the state is saved to
+        """
+        self._items = {item.link: item for item in items}
+        self.path = Path(path) if path is not None else None
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'JudgementSyncState':
+        """
+        Loads the state from a JSON file. A missing file yields an empty state.
+
+        Args:
+            path: The JSON file written by save()
+
+        Returns:
+            A JudgementSyncState bound to path
+        """
+        path = Path(path)
+        if not path.exists():
+            logger.info(f"No sync state at {path}, starting from an empty index")
+            return cls(path=path)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls((RIIIndexItem(**item) for item in data['items']), path=path)
+
+    @classmethod
+    def coerce(cls, previous: 'JudgementSyncState | Iterable[RIIIndexItem] | str | Path') -> 'JudgementSyncState':
+        if isinstance(previous, JudgementSyncState):
+            return previous
+        if isinstance(previous, (str, Path)):
+            return cls.load(previous)
+        return cls(previous)
+
+    @property
+    def items(self) -> list[RIIIndexItem]:
+        return list(self._items.values())
+
+    def diff(self, current: Iterable[RIIIndexItem]) -> IndexDiff:
+        return IndexDiff.between(self._items.values(), current)
+
+    def mark_synced(self, item: RIIIndexItem) -> None:
+        self._items[item.link] = item
+
+    def mark_deleted(self, item: RIIIndexItem) -> None:
+        self._items.pop(item.link, None)
+
+    def save(self) -> None:
+        """Writes the state to its path. Does nothing for an in-memory state."""
+        if self.path is None:
+            return
+        _write_json_atomic(self.path, {'items': [asdict(item) for item in self._items.values()]})
+        logger.debug(f"Saved sync state with {len(self._items)} items to {self.path}")
+
+
+@dataclass
+class LawManifestEntry:
+    """What is known about a law book as of the last sync."""
+    url: str
+    builddate: str
+    doknr: str
+    sha256: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def request_headers(self) -> dict[str, str]:
+        """Returns the conditional request headers for revalidating this law book."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@dataclass
+class LawSyncResult:
+    """Outcome of an incremental law book sync."""
+    new: list[Gesetzbuch] = field(default_factory=list)
+    changed: list[Gesetzbuch] = field(default_factory=list)
+    unchanged: list[LawManifestEntry] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+class LawManifest:
+    """
+    Local manifest of the law books as of the last sync, keyed by URL.
+
+    Each entry records the book's builddate and doknr, the SHA-256 of the
+    downloaded xml.zip and the validators needed for a conditional request.
+    """
+
+    def __init__(self, entries: Iterable[LawManifestEntry] = (), path: str | Path | None = None):
+        """
+        Args:
+            entries: The known law books
+            path: Optional JSON file the manifest is saved to
+        """
+        self._entries = {entry.url: entry for entry in entries}
+        self.path = Path(path) if path is not None else None
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'LawManifest':
+        """
+        Loads the manifest from a JSON file. A missing file yields an empty manifest.
+
+        Args:
+            path: The JSON file written by save()
+
+        Returns:
+            A LawManifest bound to path
+        """
+        path = Path(path)
+        if not path.exists():
+            logger.info(f"No law manifest at {path}, starting from an empty manifest")
+            return cls(path=path)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls((LawManifestEntry(**entry) for entry in data['entries']), path=path)
+
+    @classmethod
+    def coerce(cls, manifest: 'LawManifest | str | Path') -> 'LawManifest':
+        if isinstance(manifest, LawManifest):
+            return manifest
+        return cls.load(manifest)
+
+    @property
+    def entries(self) -> list[LawManifestEntry]:
+        return list(self._entries.values())
+
+    def get(self, url: str) -> LawManifestEntry | None:
+        return self._entries.get(url)
+
+    def update(self, entry: LawManifestEntry) -> None:
+        self._entries[entry.url] = entry
+
+    def remove(self, url: str) -> None:
+        self._entries.pop(url, None)
+
+    def save(self) -> None:
+        """Writes the manifest to its path. Does nothing for an in-memory manifest."""
+        if self.path is None:
+            return
+        _write_json_atomic(self.path, {'entries': [asdict(entry) for entry in self._entries.values()]})
+        logger.debug(f"Saved law manifest with {len(self._entries)} entries to {self.path}")
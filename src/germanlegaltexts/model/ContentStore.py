@@ -0,0 +1,117 @@
+import re
+import zlib
+from array import array
+
+_XML_DECLARATION = re.compile(rb'\s*<\?xml[^>]*\?>')
+
+LAZY_ATTRIBUTE = 'lazy-content'
+"""Attribute of the placeholder elements that holds the fragment's number in the ContentStore."""
+
+
+class ContentStore:
+    """
+    The cut-out <Content> elements of one lazily parsed law book, compressed.
+
+    Fragments are packed into blocks of about block_size bytes, and each block
+    is zlib-compressed, so the store takes a fraction of the memory of the XML.
+    Reading a fragment decompresses its block. The last block read is kept, so
+    reading the fragments in document order decompresses each block once.
+    """
+
+    def __init__(self, fragments: list[str | bytes], declaration: bytes = b"", block_size: int = 16 * 1024):
+        """
+        Args:
+            fragments: The XML of the elements, all str or all bytes
+            declaration: The source's XML declaration, prepended to bytes fragments
+                         so they are decoded with the declared encoding
+            block_size: Uncompressed size to fill a block up to
+        """
+        self._text = bool(fragments) and isinstance(fragments[0], str)
+        self._declaration = declaration
+        self._blocks: list[bytes] = []
+        self._block = array('I')
+        self._offset = array('I')
+        self._length = array('I')
+        self._last: tuple[int, bytes] | None = None
+
+        pending, pending_size = [], 0
+        for fragment in fragments:
+            data = fragment.encode('utf-8') if self._text else fragment
+            if pending and pending_size + len(data) > block_size:
+                self._blocks.append(zlib.compress(b"".join(pending), 1))
+                pending, pending_size = [], 0
+            self._block.append(len(self._blocks))
+            self._offset.append(pending_size)
+            self._length.append(len(data))
+            pending.append(data)
+            pending_size += len(data)
+        if pending:
+            self._blocks.append(zlib.compress(b"".join(pending), 1))
+
+    def __len__(self) -> int:
+        return len(self._block)
+
+    def __getitem__(self, index: int) -> str | bytes:
+        """Returns the XML of fragment index, ready for ET.fromstring()."""
+        number = self._block[index]
+        last = self._last
+        if last is not None and last[0] == number:
+            block = last[1]
+        else:
+            block = zlib.decompress(self._blocks[number])
+            # Replaced as a whole, so concurrent readers never see a mismatched pair
+            self._last = (number, block)
+        offset = self._offset[index]
+        data = block[offset:offset + self._length[index]]
+        return data.decode('utf-8') if self._text else self._declaration + data
+
+
+def cut_out_contents(source: str | bytes) -> tuple[str | bytes, ContentStore]:
+    """
+    Replaces every <Content> element of a law book XML with an empty placeholder.
+
+    The elements are found with plain substring searches, which is much faster
+    than parsing them. <Content> elements don't nest, so the first closing tag
+    after an opening one ends it, and empty <Content/> elements are left alone.
+
+    Args:
+        source: The whole XML document
+
+    Returns:
+        (skeleton, store): the document with placeholders whose LAZY_ATTRIBUTE
+        is the number of the element's XML in the store
+    """
+    if isinstance(source, bytes):
+        literal = lambda text: text.encode('ascii')
+        match = _XML_DECLARATION.match(source)
+        declaration = match.group().strip() if match else b""
+    else:
+        literal = str
+        declaration = b""
+    open_tag, close_tag, tag_end, slash = literal('<Content'), literal('</Content'), literal('>'), literal('/')
+    name_ends = {literal(c) for c in '> \t\r\n'}
+
+    pieces, fragments = [], []
+    position = 0
+    start = source.find(open_tag)
+    while start >= 0:
+        after_name = start + len(open_tag)
+        end = source.find(tag_end, after_name)
+        if end < 0:
+            break
+        if source[after_name:after_name + 1] not in name_ends or source[end - 1:end] == slash:
+            # Another element whose name starts with "Content", or an empty <Content/>
+            start = source.find(open_tag, after_name)
+            continue
+        close = source.find(close_tag, end)
+        if close < 0 or source.find(open_tag, end, close) >= 0:
+            # Unterminated, left in place for the parser to report
+            break
+        end = source.find(tag_end, close) + 1
+        pieces.append(source[position:start])
+        pieces.append(literal(f'<Content {LAZY_ATTRIBUTE}="{len(fragments)}"/>'))
+        fragments.append(source[start:end])
+        position = end
+        start = source.find(open_tag, position)
+    pieces.append(source[position:])
+    return source[:0].join(pieces), ContentStore(fragments, declaration)
@@ -1,20 +1,33 @@
+import sys
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
-@dataclass
+from .ContentStore import LAZY_ATTRIBUTE, ContentStore, cut_out_contents
+from .Gliederung import Gliederung, is_heading
+from .Interning import intern_value
+from .NormIndex import IndexedNorms, NormList, normalize_enbez
+from .Serializable import serializable
+from .XmlSource import XmlSource, iter_child_elements, parse_xml_root, read_xml_source
+
+@serializable
+@dataclass(slots=True)
 class Fundstelle:
     """Represents a citation/reference in the legal text."""
     typ: str
     periodikum: str | None = None
     zitstelle: str | None = None
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Standangabe:
     """Represents the status information of the legal text."""
     checked: str
     standtyp: str
     standkommentar: str | None = None
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Metadaten:
     """Represents metadata of a norm/section in the legal text."""
     jurabk: str
@@ -29,30 +42,150 @@ class Metadaten:
     titel_format: str | None = None
     gliederungseinheit: dict[str, str] | None = None
 
-@dataclass
+    @classmethod
+    def from_element(cls, metadaten_elem: ET.Element) -> 'Metadaten':
+        """
+        Create a Metadaten from a parsed <metadaten> element.
+
+        The children are visited once and dispatched on their tag, most frequent
+        tags first. They are visited in reverse, so that, as with find(), the
+        first child with a given tag is the one that ends up in the result.
+        Element text is read as findtext() would: "" for an element without text.
+
+        Args:
+            metadaten_elem: The <metadaten> element
+
+        Returns:
+            An instance of Metadaten
+        """
+        metadaten = cls(jurabk="")
+        # An if/elif chain rather than a table of handler functions: the call per
+        # child made a table slower than the find() calls it replaced
+        for child in reversed(metadaten_elem):
+            tag = child.tag
+            if tag == 'enbez':
+                metadaten.enbez = child.text or ""
+            elif tag == 'jurabk':
+                metadaten.jurabk = sys.intern(child.text or "")
+            elif tag == 'titel':
+                metadaten.titel = child.text or ""
+                metadaten.titel_format = intern_value(child.get('format'))
+            elif tag == 'gliederungseinheit':
+                metadaten.gliederungseinheit = {sys.intern(unit.tag): unit.text for unit in child}
+            elif tag == 'amtabk':
+                metadaten.amtabk = sys.intern(child.text or "")
+            elif tag == 'fundstelle':
+                metadaten.fundstelle = Fundstelle(
+                    typ=sys.intern(child.get('typ', "")),
+                    periodikum=intern_value(child.findtext('periodikum')),
+                    zitstelle=child.findtext('zitstelle')
+                )
+            elif tag == 'standangabe':
+                metadaten.standangabe = Standangabe(
+                    checked=sys.intern(child.get('checked', "")),
+                    standtyp=sys.intern(child.findtext('standtyp') or ""),
+                    standkommentar=child.findtext('standkommentar')
+                )
+            elif tag == 'ausfertigung-datum':
+                metadaten.ausfertigung_datum = child.text or ""
+            elif tag == 'kurzue':
+                metadaten.kurzue = child.text or ""
+            elif tag == 'langue':
+                metadaten.langue = child.text or ""
+        return metadaten
+
+@serializable
+@dataclass(slots=True)
 class Content:
     """Represents the content of a text section."""
     text: str
 
-@dataclass
+_content_text = Content.text
+
+
+class LazyContent(Content):
+    """
+    Content whose text is extracted from its XML only when it is first read.
+
+    Created by Gesetzbuch.from_xml(..., lazy=True). Until then the element's
+    XML is kept compressed in the law book's ContentStore. It compares equal to an eagerly parsed Content
+    with the same text. Pickling or copying it, and to_dict()/to_tuple(), extract
+    the text; copies are plain Content objects.
+    """
+    __slots__ = ('_source',)
+
+    def __init__(self, store: ContentStore, index: int, tail: str | None):
+        """
+        Args:
+            store: The store holding the <Content> element's XML
+            index: The element's number in the store
+            tail: The text that followed the element, which the eager parser includes
+        """
+        self._source = (store, index, tail)
+
+    @property
+    def text(self) -> str:
+        source = self._source
+        if source is None:
+            return _content_text.__get__(self)
+        store, index, tail = source
+        text = ET.tostring(ET.fromstring(store[index]), encoding='unicode', method='text') + (tail or "")
+        # The text is stored before the source is dropped, so a concurrent reader
+        # that finds no source always finds the text
+        _content_text.__set__(self, text)
+        self._source = None
+        return text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        _content_text.__set__(self, value)
+        self._source = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the text has been extracted yet."""
+        return self._source is None
+
+    def __eq__(self, other):
+        if isinstance(other, Content):
+            return self.text == other.text
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return Content, (self.text,)
+
+@serializable
+@dataclass(slots=True)
 class Fussnoten:
     """Represents footnotes in the legal text."""
     content: Content | None = None
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Text:
     """Represents a text element with format and content."""
     format: str
     content: Content | None = None
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Textdaten:
     """Represents the text data of a norm/section."""
     text: Text | None = None
     fussnoten: Fussnoten | None = None
     content: Content | None = None
 
-@dataclass
+def _content_from(content_elem: ET.Element, store: ContentStore | None) -> Content:
+    if store is not None:
+        lazy = content_elem.get(LAZY_ATTRIBUTE)
+        if lazy is not None:
+            return LazyContent(store, int(lazy), content_elem.tail)
+    return Content(text=ET.tostring(content_elem, encoding='unicode', method='text'))
+
+@serializable
+@dataclass(slots=True)
 class Norm:
     """Represents a norm/section in the legal text."""
     builddate: str
@@ -60,130 +193,143 @@ class Norm:
     metadaten: Metadaten
     textdaten: Textdaten
 
-@dataclass
-class Gesetzbuch:
-    """Represents a German legal code document."""
+    @classmethod
+    def from_element(cls, norm_elem: ET.Element, store: ContentStore | None = None) -> 'Norm | None':
+        """
+        Create a Norm from a parsed <norm> element.
+
+        Args:
+            norm_elem: The <norm> element
+            store: The cut-out <Content> elements of a lazily parsed document
+
+        Returns:
+            The Norm, or None if the element has no metadaten
+        """
+        metadaten_elem = norm_elem.find('metadaten')
+        if metadaten_elem is None:
+            return None
+
+        metadaten = Metadaten.from_element(metadaten_elem)
+
+        textdaten_elem = norm_elem.find('textdaten')
+        textdaten = Textdaten()
+
+        text_elem = textdaten_elem.find('text') if textdaten_elem is not None else None
+        if text_elem is not None:
+            text = Text(format=intern_value(text_elem.get('format', "")))
+            content_elem = text_elem.find('Content')
+            if content_elem is not None:
+                text.content = _content_from(content_elem, store)
+            textdaten.text = text
+
+        fussnoten_elem = textdaten_elem.find('fussnoten') if textdaten_elem is not None else None
+        if fussnoten_elem is not None:
+            fussnoten = Fussnoten()
+            content_elem = fussnoten_elem.find('Content')
+            if content_elem is not None:
+                fussnoten.content = _content_from(content_elem, store)
+            textdaten.fussnoten = fussnoten
+        return cls(
+            builddate=intern_value(norm_elem.get('builddate', "")),
+            doknr=norm_elem.get('doknr', ""),
+            metadaten=metadaten,
+            textdaten=textdaten
+        )
+
+@serializable
+@dataclass(slots=True)
+class Gesetzbuch(IndexedNorms):
+    """
+    Represents a German legal code document.
+
+    The lookup methods are answered from an index over the norms that is built
+    on first use and rebuilt after norms is changed (see IndexedNorms).
+    """
     builddate: str
     doknr: str
-    norms: list[Norm] = field(default_factory=list)
+    norms: list[Norm] = field(default_factory=NormList)
 
     @classmethod
-    def from_xml(cls, xml_content: str) -> 'Gesetzbuch':
+    def from_xml(cls, xml_content: XmlSource, lazy: bool = False) -> 'Gesetzbuch':
         """
         Parse the XML content and create a Gesetzbuch instance.
 
         Args:
-            xml_content: The XML content as a string
+            xml_content: The XML content as a string, as bytes/memoryview, or as a
+                         binary file-like object such as an open zipfile member
+            lazy: If True, only the structure and metadata are parsed up front. The
+                  text and footnote contents become LazyContent objects, whose text
+                  is extracted from the XML when it is first accessed.
 
         Returns:
             An instance of Gesetzbuch
         """
-        import xml.etree.ElementTree as ET
-        from io import StringIO
-
-        tree = ET.parse(StringIO(xml_content))
-        root = tree.getroot()
+        store = None
+        if lazy:
+            xml_content, store = cut_out_contents(read_xml_source(xml_content))
+        root = parse_xml_root(xml_content)
 
         gesetz = cls(
             builddate=root.get('builddate'),
             doknr=root.get('doknr'),
-            norms=[]
         )
         for norm_elem in root.findall('norm'):
-            metadaten_elem = norm_elem.find('metadaten')
-            if metadaten_elem is None:
-                continue
-
-            metadaten = Metadaten(jurabk=metadaten_elem.findtext('jurabk') or "")
-            if metadaten_elem.find('amtabk') is not None:
-                metadaten.amtabk = metadaten_elem.findtext('amtabk')
-
-            if metadaten_elem.find('ausfertigung-datum') is not None:
-                metadaten.ausfertigung_datum = metadaten_elem.findtext('ausfertigung-datum')
-
-            if metadaten_elem.find('kurzue') is not None:
-                metadaten.kurzue = metadaten_elem.findtext('kurzue')
-
-            if metadaten_elem.find('langue') is not None:
-                metadaten.langue = metadaten_elem.findtext('langue')
-
-            if metadaten_elem.find('enbez') is not None:
-                metadaten.enbez = metadaten_elem.findtext('enbez')
-
-            if metadaten_elem.find('titel') is not None:
-                metadaten.titel = metadaten_elem.findtext('titel')
-                titel_elem = metadaten_elem.find('titel')
-                if titel_elem is not None and 'format' in titel_elem.attrib:
-                    metadaten.titel_format = titel_elem.get('format')
-
-            fundstelle_elem = metadaten_elem.find('fundstelle')
-            if fundstelle_elem is not None:
-                fundstelle = Fundstelle(
-                    typ=fundstelle_elem.get('typ', ""),
-                    periodikum=fundstelle_elem.findtext('periodikum'),
-                    zitstelle=fundstelle_elem.findtext('zitstelle')
-                )
-                metadaten.fundstelle = fundstelle
-
-            standangabe_elem = metadaten_elem.find('standangabe')
-            if standangabe_elem is not None:
-                standangabe = Standangabe(
-                    checked=standangabe_elem.get('checked', ""),
-                    standtyp=standangabe_elem.findtext('standtyp') or "",
-                    standkommentar=standangabe_elem.findtext('standkommentar')
-                )
-                metadaten.standangabe = standangabe
-            gliederungseinheit_elem = metadaten_elem.find('gliederungseinheit')
-            if gliederungseinheit_elem is not None:
-                gliederungseinheit = {}
-                for child in gliederungseinheit_elem:
-                    gliederungseinheit[child.tag] = child.text
-                metadaten.gliederungseinheit = gliederungseinheit
-
-            textdaten_elem = norm_elem.find('textdaten')
-            textdaten = Textdaten()
-
-            text_elem = textdaten_elem.find('text') if textdaten_elem is not None else None
-            if text_elem is not None:
-                text = Text(format=text_elem.get('format', ""))
-                content_elem = text_elem.find('Content')
-                if content_elem is not None:
-                    content_text = ET.tostring(content_elem, encoding='unicode', method='text')
-                    text.content = Content(text=content_text)
-                textdaten.text = text
-
-            fussnoten_elem = textdaten_elem.find('fussnoten') if textdaten_elem is not None else None
-            if fussnoten_elem is not None:
-                fussnoten = Fussnoten()
-                content_elem = fussnoten_elem.find('Content')
-                if content_elem is not None:
-                    content_text = ET.tostring(content_elem, encoding='unicode', method='text')
-                    fussnoten.content = Content(text=content_text)
-                textdaten.fussnoten = fussnoten
-            norm = Norm(
-                builddate=norm_elem.get('builddate', ""),
-                doknr=norm_elem.get('doknr', ""),
-                metadaten=metadaten,
-                textdaten=textdaten
-            )
-            gesetz.norms.append(norm)
+            norm = Norm.from_element(norm_elem, store)
+            if norm is not None:
+                gesetz.norms.append(norm)
 
         return gesetz
 
+    @staticmethod
+    def iter_norms(xml_content: XmlSource) -> Iterator[Norm]:
+        """
+        Parse the norms of a law book one at a time, without building the whole document.
+
+        Each norm is yielded as soon as its end tag has been parsed, and its
+        elements are discarded afterwards, so memory use doesn't grow with the
+        size of the law book and consumers can start before parsing finishes.
+
+        Args:
+            xml_content: The XML content as a string, as bytes/memoryview, or as a
+                         binary file-like object such as an open zipfile member,
+                         which is read in chunks
+
+        Yields:
+            Norm objects in document order, equal to those in from_xml(xml_content).norms
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the XML is not well-formed. Norms
+                before the error have been yielded already.
+        """
+        for norm_elem in iter_child_elements(xml_content, 'norm'):
+            norm = Norm.from_element(norm_elem)
+            if norm is not None:
+                yield norm
+
     def get_paragraph(self, paragraph_number: str) -> Norm | None:
         """
         Get a specific paragraph by its number.
 
         Args:
-            paragraph_number: The paragraph number (e.g., "§ 1")
+            paragraph_number: The paragraph number (e.g., "§ 1"). Spelling variants
+                              such as "§1" or "Art. 1" for "Art 1" are matched too.
 
         Returns:
             The Norm object for the paragraph, or None if not found
         """
-        for norm in self.norms:
-            if norm.metadaten.enbez == paragraph_number:
-                return norm
-        return None
+        return self._index().by_enbez.get(normalize_enbez(paragraph_number))
+
+    def get_norm(self, doknr: str) -> Norm | None:
+        """
+        Get a specific norm by its document number.
+
+        Args:
+            doknr: The doknr of the norm (e.g., "BJNR010050934BJNE000100000")
+
+        Returns:
+            The Norm object, or None if not found
+        """
+        return self._index().by_doknr.get(doknr)
 
     def get_section(self, section_number: str) -> list[Norm]:
         """
@@ -195,12 +341,36 @@ class Gesetzbuch:
         Returns:
             A list of Norm objects in the section
         """
-        result = []
-        for norm in self.norms:
-            if (norm.metadaten.gliederungseinheit and 
-                norm.metadaten.gliederungseinheit.get('gliederungsbez') == section_number):
-                result.append(norm)
-        return result
+        return list(self._index().by_gliederungsbez.get(section_number, ()))
+
+    def get_gliederung(self, *path: str) -> Gliederung | None:
+        """
+        Get the outline of the law book, or one structural unit of it.
+
+        Args:
+            *path: The gliederungsbez of each level down to the unit
+                   (e.g., "Buch 2", "Abschnitt 8", "Titel 1"). Empty for the whole outline.
+
+        Returns:
+            The Gliederung node, or None if the path doesn't exist
+        """
+        return self._index().gliederung.find(*path)
+
+    def get_norms_in(self, *path: str) -> list[Norm]:
+        """
+        Get the norms in a structural unit and all units below it, without the headings.
+
+        Args:
+            *path: The gliederungsbez of each level down to the unit
+                   (e.g., "Buch 2", "Abschnitt 8", "Titel 1")
+
+        Returns:
+            A list of Norm objects in document order, empty if the path doesn't exist
+        """
+        unit = self.get_gliederung(*path)
+        if unit is None:
+            return []
+        return [norm for norm in self.norms[unit.start:unit.end] if not is_heading(norm)]
 
     def get_all_paragraphs(self) -> list[str]:
         """
@@ -209,11 +379,7 @@ class Gesetzbuch:
         Returns:
             A list of paragraph numbers
         """
-        result = []
-        for norm in self.norms:
-            if norm.metadaten.enbez and norm.metadaten.enbez.startswith('§'):
-                result.append(norm.metadaten.enbez)
-        return result
+        return list(self._index().paragraphs)
 
     def get_all_sections(self) -> list[str]:
         """
@@ -222,9 +388,4 @@ class Gesetzbuch:
         Returns:
             A list of section titles
         """
-        result = []
-        for norm in self.norms:
-            if (norm.metadaten.gliederungseinheit and 
-                'gliederungstitel' in norm.metadaten.gliederungseinheit):
-                result.append(norm.metadaten.gliederungseinheit['gliederungstitel'])
-        return result
+        return list(self._index().sections)
@@ -0,0 +1,105 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .Gesetzbuch import Norm
+
+
+def _bez_key(bez: str) -> str:
+    return " ".join(bez.split()).casefold()
+
+
+@dataclass(slots=True)
+class Gliederung:
+    """
+    A structural unit of a law book (Buch, Teil, Abschnitt, Titel, ...) in its outline.
+
+    The unit covers the contiguous norms[start:end]: the norm that opens it
+    (its heading, which carries the gliederungseinheit) and everything up to
+    the next unit on the same or a higher level. The root stands for the whole
+    law book and has no kennzahl, bez or titel.
+    """
+    kennzahl: str | None
+    bez: str | None
+    titel: str | None
+    start: int
+    end: int
+    children: list['Gliederung'] = field(default_factory=list)
+    _children_by_bez: dict[str, 'Gliederung'] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def add_child(self, child: 'Gliederung') -> None:
+        self.children.append(child)
+        if child.bez:
+            self._children_by_bez.setdefault(_bez_key(child.bez), child)
+
+    def find(self, *path: str) -> 'Gliederung | None':
+        """
+        Returns the unit below this one reached by following gliederungsbez values.
+
+        Args:
+            *path: One gliederungsbez per level, e.g. "Buch 2", "Abschnitt 8", "Titel 1".
+                   Whitespace and case don't matter.
+
+        Returns:
+            The unit, this unit itself for an empty path, or None if a level is missing
+        """
+        node = self
+        for bez in path:
+            node = node._children_by_bez.get(_bez_key(bez))
+            if node is None:
+                return None
+        return node
+
+    def walk(self) -> Iterator[tuple[int, 'Gliederung']]:
+        """
+        Yields (depth, unit) for this unit and all units below it in document order,
+        which is the order of a table of contents. This unit has depth 0.
+        """
+        stack = [(0, self)]
+        while stack:
+            depth, node = stack.pop()
+            yield depth, node
+            stack.extend((depth + 1, child) for child in reversed(node.children))
+
+
+def is_heading(norm: 'Norm') -> bool:
+    """Whether the norm opens a structural unit rather than holding law text."""
+    return bool(norm.metadaten.gliederungseinheit)
+
+
+def _is_below(kennzahl: str | None, parent: str | None) -> bool:
+    # Units without a kennzahl have no place in the hierarchy, so nothing is below them
+    return bool(kennzahl and parent and kennzahl != parent and kennzahl.startswith(parent))
+
+
+def build_gliederung(norms: list['Norm']) -> Gliederung:
+    """
+    Builds the outline of a law book from the gliederungskennzahl of its headings.
+
+    Every level of the hierarchy adds digits to the kennzahl of its parent (for
+    example 020 for Buch 2, 020080 for its Abschnitt 8), so a heading belongs to
+    the closest open unit whose kennzahl is a prefix of its own. A heading
+    without a kennzahl is placed at the top level and gets no subunits: the
+    next heading closes it.
+
+    Args:
+        norms: The norms of the law book in document order
+
+    Returns:
+        The root unit, spanning all norms
+    """
+    root = Gliederung(kennzahl=None, bez=None, titel=None, start=0, end=len(norms))
+    open_units = [root]
+    for i, norm in enumerate(norms):
+        einheit = norm.metadaten.gliederungseinheit
+        if not einheit:
+            continue
+        kennzahl = einheit.get('gliederungskennzahl')
+        while len(open_units) > 1 and not _is_below(kennzahl, open_units[-1].kennzahl):
+            open_units.pop().end = i
+        unit = Gliederung(kennzahl=kennzahl, bez=einheit.get('gliederungsbez'),
+                          titel=einheit.get('gliederungstitel'), start=i, end=len(norms))
+        open_units[-1].add_child(unit)
+        open_units.append(unit)
+    return root
@@ -0,0 +1,10 @@
+import sys
+
+
+def intern_value(value: str | None) -> str | None:
+    """
+    Interns a field value that repeats across documents, such as a court name or
+    a builddate, so all records share one string object instead of each parse
+    allocating its own copy. None is passed through.
+    """
+    return sys.intern(value) if value is not None else None
@@ -0,0 +1,136 @@
+import dataclasses
+import functools
+import re
+from typing import TYPE_CHECKING
+
+from .Gliederung import Gliederung, build_gliederung
+
+if TYPE_CHECKING:
+    from .Gesetzbuch import Norm
+
+# "Art" only counts as a prefix when a number or a space follows, not in e.g. "Artenschutz"
+_ENBEZ_PREFIX = re.compile(r'(§+)\s*|art(?:ikel|\.)?(?:\s+|(?=\d))', re.IGNORECASE)
+
+
+def normalize_enbez(enbez: str) -> str:
+    """
+    Returns the lookup key for a norm designation, so that spelling variants
+    such as "§242" and "§ 242", or "Art. 1", "Artikel 1" and "Art 1" match.
+
+    Whitespace is collapsed, "Art."/"Artikel" become "Art", the number is
+    separated from the prefix by one space, and the result is case-folded.
+    """
+    enbez = " ".join(enbez.split())
+    match = _ENBEZ_PREFIX.match(enbez)
+    if match and match.end() < len(enbez):
+        enbez = f"{match.group(1) or 'Art'} {enbez[match.end():]}"
+    return enbez.casefold()
+
+
+class NormIndex:
+    """
+    Lookup tables and the outline of the norms of a law book.
+
+    Where several norms share an enbez or doknr, the first one wins, which is
+    what a linear scan over the norms would find. The outline is only built
+    when it is first asked for, so the lookup tables don't depend on it.
+    """
+
+    __slots__ = ('by_enbez', 'by_doknr', 'by_gliederungsbez', 'paragraphs', 'sections', '_norms', '_gliederung')
+
+    def __init__(self, norms: list['Norm']):
+        self._norms = norms
+        self._gliederung: Gliederung | None = None
+        self.by_enbez: dict[str, Norm] = {}
+        self.by_doknr: dict[str, Norm] = {}
+        self.by_gliederungsbez: dict[str, list[Norm]] = {}
+        self.paragraphs: list[str] = []
+        self.sections: list[str] = []
+        for norm in norms:
+            metadaten = norm.metadaten
+            if metadaten.enbez:
+                self.by_enbez.setdefault(normalize_enbez(metadaten.enbez), norm)
+                if metadaten.enbez.startswith('§'):
+                    self.paragraphs.append(metadaten.enbez)
+            if norm.doknr:
+                self.by_doknr.setdefault(norm.doknr, norm)
+            gliederungseinheit = metadaten.gliederungseinheit
+            if gliederungseinheit:
+                if 'gliederungsbez' in gliederungseinheit:
+                    self.by_gliederungsbez.setdefault(gliederungseinheit['gliederungsbez'], []).append(norm)
+                if 'gliederungstitel' in gliederungseinheit:
+                    self.sections.append(gliederungseinheit['gliederungstitel'])
+
+    @property
+    def gliederung(self) -> Gliederung:
+        """The outline of the norms, built on first access."""
+        if self._gliederung is None:
+            self._gliederung = build_gliederung(self._norms)
+        return self._gliederung
+
+
+class NormList(list):
+    """
+    A list of norms that counts its changes.
+
+    Gesetzbuch.from_xml() returns its norms as a NormList. Every method that
+    changes the list increments version, so an index over the norms can tell
+    that it is stale even when items were replaced or reordered.
+    """
+
+    __slots__ = ('version',)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def __reduce__(self):
+        # Pickle and copy as the plain items
+        return type(self), (list(self),)
+
+
+def _counting(name: str):
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(NormList, _name, _counting(_name))
+
+
+class IndexedNorms:
+    """
+    Base class of Gesetzbuch that keeps a NormIndex over self.norms.
+
+    The index lives in a slot of the law book, not in a dataclass field or in
+    the list, so norms stays whatever list the caller assigned. It is rebuilt
+    when norms is a different list than it was built for, or when the list
+    changed since: for a NormList any change is noticed, for a plain list only
+    a change in length. Call invalidate_index() after editing norms in other
+    ways, such as changing a norm's metadata in place.
+    """
+
+    __slots__ = ('_norm_index',)
+
+    def _index(self) -> NormIndex:
+        norms = self.norms
+        stamp = norms.version if isinstance(norms, NormList) else len(norms)
+        cached = getattr(self, '_norm_index', None)
+        if cached is None or cached[0] is not norms or cached[1] != stamp:
+            cached = (norms, stamp, NormIndex(norms))
+            self._norm_index = cached
+        return cached[2]
+
+    def invalidate_index(self) -> None:
+        """Drops the index, so the next lookup rebuilds it."""
+        self._norm_index = None
+
+    def __reduce__(self):
+        # Pickle and copy the fields only, without the index
+        return type(self), tuple(getattr(self, f.name) for f in dataclasses.fields(self))
@@ -1,12 +1,15 @@
 from dataclasses import dataclass, field
 import re
 
+from .Serializable import serializable
+
 
 TYP_MARKERS = {"§", "§§", "Art", "R", "Teil"}
 QUALIFIER_KEYS = {"Abs", "S", "Nr", "Halbs", "Alt", "Buchst", "DBuchst"}
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Normverweis:
     """A single structured citation of a German legal norm.
 
@@ -1,8 +1,12 @@
 from dataclasses import dataclass, field
 from .Normverweis import Normverweis
+from .Interning import intern_value
+from .Serializable import serializable
+from .XmlSource import XmlSource, parse_xml_root
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class RIIIndexItem:
     """Represents an item from the rii-toc.xml index."""
     gericht: str
@@ -12,62 +16,72 @@ class RIIIndexItem:
     modified: str
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Region:
     """Represents the regional information of a judgement."""
     abk: str | None = None
     long: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Content:
     """Represents the content of a section in the judgement."""
     text: str
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Titelzeile:
     """Represents the title line of the judgement."""
     content: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Leitsatz:
     """Represents the headnote (Leitsatz) of the judgement."""
     content: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Tenor:
     """Represents the operative part (Tenor) of the judgement."""
     content: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Tatbestand:
     """Represents the facts (Tatbestand) of the case."""
     content: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Entscheidungsgruende:
     """Represents the reasoning for the decision."""
     content: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Gruende:
     """Represents the grounds/reasoning (Gründe) of the judgement."""
     content: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Abweichende_Meinung:
     """Represents a dissenting opinion."""
     content: str | None = None
 
 
-@dataclass
+@serializable
+@dataclass(slots=True)
 class Rechtsprechung:
     """Represents a German court judgement (Rechtsprechung) document."""
     doknr: str
@@ -98,21 +112,18 @@ class Rechtsprechung:
     access_rights: str | None = None
 
     @classmethod
-    def from_xml(cls, xml_content: str) -> 'Rechtsprechung':
+    def from_xml(cls, xml_content: XmlSource) -> 'Rechtsprechung':
         """
         Parse the XML content and create a Rechtsprechung instance.
 
         Args:
-            xml_content: The XML content as a string
+            xml_content: The XML content as a string, as bytes/memoryview, or as a
+                         binary file-like object such as an open zipfile member
 
         Returns:
             An instance of Rechtsprechung
         """
-        import xml.etree.ElementTree as ET
-        from io import StringIO
-
-        tree = ET.parse(StringIO(xml_content))
-        root = tree.getroot()
+        root = parse_xml_root(xml_content)
 
         def get_text_content(element) -> str | None:
             """Extract text content from an element and its children."""
@@ -131,8 +142,8 @@ class Rechtsprechung:
         region_elem = root.find('region')
         if region_elem is not None:
             region = Region(
-                abk=region_elem.findtext('abk'),
-                long=region_elem.findtext('long')
+                abk=intern_value(region_elem.findtext('abk')),
+                long=intern_value(region_elem.findtext('long'))
             )
 
         titelzeile = None
@@ -175,12 +186,12 @@ class Rechtsprechung:
         return cls(
             doknr=root.findtext('doknr') or "",
             ecli=root.findtext('ecli') or None,
-            gertyp=root.findtext('gertyp') or "",
-            gerort=root.findtext('gerort') or None,
-            spruchkoerper=root.findtext('spruchkoerper') or "",
+            gertyp=intern_value(root.findtext('gertyp') or ""),
+            gerort=intern_value(root.findtext('gerort') or None),
+            spruchkoerper=intern_value(root.findtext('spruchkoerper') or ""),
             entsch_datum=root.findtext('entsch-datum') or "",
             aktenzeichen=root.findtext('aktenzeichen') or "",
-            doktyp=root.findtext('doktyp') or "",
+            doktyp=intern_value(root.findtext('doktyp') or ""),
             norm=root.findtext('norm') or None,
             vorinstanz=root.findtext('vorinstanz') or None,
             region=region,
@@ -195,10 +206,10 @@ class Rechtsprechung:
             abwmeinung=abwmeinung,
             sonstlt=root.findtext('sonstlt') or None,
             identifier=root.findtext('identifier') or None,
-            coverage=root.findtext('coverage') or None,
-            language=root.findtext('language') or None,
-            publisher=root.findtext('publisher') or None,
-            access_rights=root.findtext('accessRights') or None,
+            coverage=intern_value(root.findtext('coverage') or None),
+            language=intern_value(root.findtext('language') or None),
+            publisher=intern_value(root.findtext('publisher') or None),
+            access_rights=intern_value(root.findtext('accessRights') or None),
         )
     
     def get_structured_norms(self) -> list[Normverweis]:
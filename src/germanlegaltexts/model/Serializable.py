@@ -0,0 +1,163 @@
+import dataclasses
+import hashlib
+import types
+import typing
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar('T')
+
+
+def _field_kind(hint) -> tuple[str, type | None, bool]:
+    """
+    Classifies a field annotation for code generation.
+
+    Returns:
+        (kind, nested class, optional): kind is 'one' for a dataclass, 'many' for a
+        list of dataclasses, 'dict' for a dict and 'plain' for anything else
+    """
+    optional = False
+    if typing.get_origin(hint) in (types.UnionType, typing.Union):
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        optional = len(args) < len(typing.get_args(hint))
+        if len(args) != 1:
+            return 'plain', None, optional
+        hint = args[0]
+    if dataclasses.is_dataclass(hint):
+        return 'one', hint, optional
+    origin = typing.get_origin(hint)
+    if origin is list and dataclasses.is_dataclass(typing.get_args(hint)[0]):
+        return 'many', typing.get_args(hint)[0], optional
+    if hint is dict or origin is dict:
+        return 'dict', None, optional
+    return 'plain', None, optional
+
+
+def _encode(kind: str, optional: bool, value: str, method: str) -> str:
+    if kind == 'one':
+        expression = f"{value}.{method}()"
+    elif kind == 'many':
+        expression = f"[v.{method}() for v in {value}]"
+    elif kind == 'dict':
+        expression = f"dict({value})"
+    else:
+        return value
+    return f"(None if {value} is None else {expression})" if optional else expression
+
+
+def _decode(kind: str, nested: str, optional: bool, value: str, method: str, container: str | None = None) -> str:
+    if kind == 'plain':
+        return value
+    # An optional value is bound to v first, so a data.get() lookup only runs once
+    target = 'v' if optional else value
+    if kind == 'one':
+        expression = f"{nested}.{method}({target})"
+    elif kind == 'many':
+        expression = f"[{nested}.{method}(item) for item in {target}]"
+        if container is not None:
+            expression = f"{container}({expression})"
+    else:
+        expression = f"dict({target})"
+    return f"(None if (v := {value}) is None else {expression})" if optional else expression
+
+
+def serializable(cls: type[T]) -> type[T]:
+    """
+    Adds to_dict()/from_dict() and to_tuple()/from_tuple() to a dataclass.
+
+    Unlike dataclasses.asdict() the methods don't deep-copy: they are generated
+    once per class with every field access spelled out, nested dataclasses call
+    their own generated methods, and values such as strings are passed through.
+    The dict form uses the field names as keys; the tuple form lists the fields
+    in definition order, which is smaller to pickle or send to another process.
+    Fields declared with init=False are left out. Nested dataclasses must be
+    serializable too. A list field whose default_factory is a list subclass
+    is decoded into that subclass.
+
+    Decorate above @dataclass:
+
+        @serializable
+        @dataclass
+        class Content:
+            text: str
+    """
+    hints = typing.get_type_hints(cls)
+    namespace: dict[str, object] = {}
+    to_dict, to_tuple, from_dict, from_tuple = [], [], [], []
+    # Fields left out of __init__ are derived state, which the constructor rebuilds
+    fields = [f for f in dataclasses.fields(cls) if f.init]
+    for i, f in enumerate(fields):
+        kind, nested, optional = _field_kind(hints[f.name])
+        nested_name = f"_{f.name}_cls"
+        namespace[nested_name] = nested
+        to_dict.append(f"{f.name!r}: {_encode(kind, optional, f'self.{f.name}', 'to_dict')}")
+        to_tuple.append(_encode(kind, optional, f"self.{f.name}", 'to_tuple'))
+        if f.default is not dataclasses.MISSING:
+            namespace[f"_{f.name}_default"] = f.default
+            lookup = f"data.get({f.name!r}, _{f.name}_default)"
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f"_{f.name}_factory"] = f.default_factory
+            lookup = f"(data[{f.name!r}] if {f.name!r} in data else _{f.name}_factory())"
+        else:
+            lookup = f"data[{f.name!r}]"
+        # A list field whose default is a list subclass (e.g. NormList) is decoded into that subclass
+        container = None
+        if (kind == 'many' and isinstance(f.default_factory, type)
+                and issubclass(f.default_factory, list) and f.default_factory is not list):
+            container = f"_{f.name}_factory"
+        from_dict.append(_decode(kind, nested_name, optional, lookup, 'from_dict', container))
+        from_tuple.append(_decode(kind, nested_name, optional, f"data[{i}]", 'from_tuple', container))
+
+    source = (
+        "def to_dict(self):\n"
+        f"    return {{{', '.join(to_dict)}}}\n"
+        "def to_tuple(self):\n"
+        f"    return ({', '.join(to_tuple)},)\n"
+        "def from_dict(cls, data):\n"
+        f"    return cls({', '.join(from_dict)})\n"
+        "def from_tuple(cls, data):\n"
+        f"    return cls({', '.join(from_tuple)})\n"
+    )
+    exec(source, namespace)
+
+    namespace['to_dict'].__doc__ = "Returns the fields as a dict, nested dataclasses as dicts."
+    namespace['to_tuple'].__doc__ = "Returns the fields as a tuple in definition order, nested dataclasses as tuples."
+    namespace['from_dict'].__doc__ = "Creates an instance from the output of to_dict()."
+    namespace['from_tuple'].__doc__ = "Creates an instance from the output of to_tuple()."
+    for name in ('to_dict', 'to_tuple'):
+        _attach(cls, name, namespace[name])
+    for name in ('from_dict', 'from_tuple'):
+        _attach(cls, name, classmethod(namespace[name]))
+    return cls
+
+
+def _attach(cls: type, name: str, method: Callable | classmethod) -> None:
+    function = method.__func__ if isinstance(method, classmethod) else method
+    function.__qualname__ = f"{cls.__qualname__}.{name}"
+    function.__module__ = cls.__module__
+    setattr(cls, name, method)
+
+
+def schema_fingerprint(*classes: type) -> str:
+    """
+    Returns a hash of the field names and annotations of the given dataclasses
+    and of every dataclass nested in their fields.
+
+    It changes whenever a field is added, removed, renamed, reordered or retyped,
+    which also changes the layout of to_tuple().
+    """
+    digest = hashlib.sha256()
+    pending, seen = list(classes), set()
+    while pending:
+        cls = pending.pop(0)
+        if cls in seen:
+            continue
+        seen.add(cls)
+        hints = typing.get_type_hints(cls)
+        digest.update(f"{cls.__module__}.{cls.__qualname__}\n".encode('utf-8'))
+        for f in dataclasses.fields(cls):
+            digest.update(f"{f.name}: {hints[f.name]}\n".encode('utf-8'))
+            nested = _field_kind(hints[f.name])[1]
+            if nested is not None:
+                pending.append(nested)
+    return digest.hexdigest()[:16]
@@ -0,0 +1,114 @@
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from typing import BinaryIO
+
+XmlSource = str | bytes | bytearray | memoryview | BinaryIO
+"""XML input accepted by the from_xml methods: text, raw bytes, or a binary file-like object."""
+
+
+def parse_xml_root(source: XmlSource) -> ET.Element:
+    """
+    Parses an XML document and returns its root element.
+
+    Text and bytes-like input is fed to the parser directly, without wrapping
+    it in an intermediate StringIO/BytesIO copy. File-like objects, such as an
+    open zipfile member, are read in chunks.
+
+    Args:
+        source: The XML as str, bytes, bytearray, memoryview or binary file-like object
+
+    Returns:
+        The root element of the document
+    """
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        parser = ET.XMLParser()
+        parser.feed(source)
+        return parser.close()
+    return ET.parse(source).getroot()
+
+
+def read_xml_source(source: XmlSource) -> str | bytes:
+    """
+    Returns the whole document as str or bytes, reading a file-like source to the end.
+
+    Args:
+        source: The XML as str, bytes, bytearray, memoryview or binary file-like object
+
+    Returns:
+        The source itself if it is str or bytes, otherwise its content as bytes
+    """
+    if isinstance(source, (str, bytes)):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    return source.read()
+
+
+def peek_root_attributes(source: XmlSource, chunk_size: int = 4096) -> dict[str, str]:
+    """
+    Returns the attributes of the root element without parsing the rest of the document.
+
+    Only as much input is read as it takes to reach the end of the root's start
+    tag, usually a single chunk. A file-like source is left positioned after the
+    consumed input.
+
+    Args:
+        source: The XML as str, bytes, bytearray, memoryview or binary file-like object
+        chunk_size: How much input to read at a time
+
+    Returns:
+        The root element's attributes, or an empty dict for an empty document
+    """
+    parser = ET.XMLPullParser(events=('start',))
+    for chunk in _chunks(source, chunk_size):
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            return dict(element.attrib)
+    return {}
+
+
+def iter_child_elements(source: XmlSource, tag: str, chunk_size: int = 64 * 1024) -> Iterator[ET.Element]:
+    """
+    Parses a document incrementally and yields each complete child of the root with the given tag.
+
+    This is ElementTree.iterparse() for every XmlSource: input is fed to the
+    parser a chunk at a time, and a child is yielded as soon as its end tag has
+    been read. After the caller resumes, the child is cleared and removed from
+    the root, so memory stays bounded by one child instead of the document.
+
+    Args:
+        source: The XML as str, bytes, bytearray, memoryview or binary file-like object
+        tag: The tag of the children to yield, e.g. 'norm'
+        chunk_size: How much input to feed at a time
+
+    Yields:
+        The complete child elements, in document order
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is not well-formed
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    root: ET.Element | None = None
+    depth = 0
+    for chunk in _chunks(source, chunk_size):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == 'start':
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1 and element.tag == tag:
+                yield element
+            if depth == 1:
+                # Children of the root are only needed until they are complete
+                element.clear()
+                del root[:]
+    parser.close()
+
+
+def _chunks(source: XmlSource, chunk_size: int) -> Iterator[str | bytes]:
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        return (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    return iter(lambda: source.read(chunk_size), b'')
@@ -0,0 +1,124 @@
+import hashlib
+import io
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from germanlegaltexts.ArchiveMirror import ArchiveMirror
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+
+from test_async_downloaders import LAW_TOC_XML, LAW_XML, make_mock_client, make_zip
+
+URL = "https://example.com/law/xml.zip"
+
+
+def no_network(*args, **kwargs):
+    raise AssertionError("offline mode must not touch the network")
+
+
+class TestArchiveMirror:
+    def test_store_and_read(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+
+        sha256 = mirror.store(URL, b"archive")
+
+        assert sha256 == hashlib.sha256(b"archive").hexdigest()
+        assert URL in mirror
+        assert mirror.read(URL) == b"archive"
+        assert mirror.urls() == [URL]
+
+    def test_identical_bodies_are_stored_once(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+
+        mirror.store("https://example.com/a", b"same")
+        mirror.store("https://example.com/b", b"same")
+
+        assert len([p for p in (tmp_path / 'objects').rglob('*') if p.is_file()]) == 1
+
+    def test_changed_body_moves_the_ref(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+
+        mirror.store(URL, b"old")
+        mirror.store(URL, b"new")
+
+        assert mirror.read(URL) == b"new"
+
+    def test_store_file_rewinds(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+        spool = io.BytesIO(b"spooled archive")
+        spool.seek(5)
+
+        mirror.store_file(URL, spool)
+
+        assert spool.tell() == 0
+        assert mirror.read(URL) == b"spooled archive"
+
+    def test_missing_url_raises_lookup_error(self, tmp_path):
+        with pytest.raises(LookupError, match="not in the mirror"):
+            ArchiveMirror(tmp_path).read(URL)
+
+
+class TestSyncMirror:
+    def test_downloads_are_mirrored_and_replayed_offline(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+        response = httpx.Response(200, content=make_zip(LAW_XML), request=httpx.Request('GET', URL))
+        with patch('httpx.get', return_value=response):
+            assert GermanLawDownloader(mirror=mirror).download_law_xml(URL) == LAW_XML
+
+        offline = GermanLawDownloader(mirror=mirror, offline=True)
+        with patch('httpx.get', side_effect=no_network), patch('httpx.stream', side_effect=no_network):
+            assert offline.download_law_xml(URL) == LAW_XML
+
+    def test_failed_downloads_are_not_mirrored(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+        response = httpx.Response(404, request=httpx.Request('GET', URL))
+        with patch('httpx.get', return_value=response):
+            with pytest.raises(ValueError):
+                GermanLawDownloader(mirror=mirror).download_law_xml(URL)
+
+        assert URL not in mirror
+
+    def test_offline_miss_raises(self, tmp_path):
+        offline = GermanJudgementDownloader(mirror=ArchiveMirror(tmp_path), offline=True)
+
+        with pytest.raises(ValueError, match="not in the mirror"):
+            offline.download_judgement_xml(URL)
+
+    def test_offline_requires_a_mirror(self):
+        with pytest.raises(ValueError, match="mirror"):
+            GermanLawDownloader(offline=True)
+
+
+class TestAsyncMirror:
+    async def test_full_crawl_can_be_reparsed_offline(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+        law_ok = MagicMock(status_code=200, content=make_zip(LAW_XML), headers={})
+        with patch('httpx.AsyncClient', return_value=make_mock_client(
+                MagicMock(status_code=200, content=LAW_TOC_XML.encode('utf-8'), headers={}), law_ok, law_ok)):
+            online = [b async for b in GermanLawDownloader(mirror=mirror).iter_all_law_books(max_per_second=None)]
+
+        offline = GermanLawDownloader(mirror=mirror, offline=True)
+        with patch('httpx.AsyncClient', return_value=make_mock_client()):
+            # The default max_per_second would take a second per book online
+            books = [b async for b in offline.iter_all_law_books()]
+
+        assert len(online) == len(books) == 2
+        assert len(mirror.urls()) == 3
+
+    async def test_spooled_archives_are_mirrored(self, tmp_path):
+        mirror = ArchiveMirror(tmp_path)
+        archive = make_zip(LAW_XML)
+        downloader = GermanLawDownloader(mirror=mirror, spool_threshold=16)
+        with patch('httpx.AsyncClient', return_value=make_mock_client(
+                MagicMock(status_code=200, content=archive, headers={}))):
+            books = [b async for b in downloader.iter_law_books([URL], max_per_second=None)]
+
+        assert len(books) == 1
+        assert mirror.read(URL) == archive
+
+    def test_offline_pipelines_are_not_paced(self, tmp_path):
+        offline = GermanLawDownloader(mirror=ArchiveMirror(tmp_path), offline=True)
+
+        assert offline._pipeline(1.0, 16, None).rate_limiter is None
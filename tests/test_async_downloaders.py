@@ -1,9 +1,14 @@
+import asyncio
 import io
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from germanlegaltexts.DownloadReport import DownloadReport
 from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
 from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
 from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
@@ -19,10 +24,27 @@ def make_zip(xml_content: str, filename: str = "test.xml") -> bytes:
     return buf.getvalue()
 
 
+def streamable(response):
+    """Give a mock response the aiter_bytes() of a streamed httpx response."""
+    body = response.content if isinstance(response.content, bytes) else response.text.encode('utf-8')
+
+    async def aiter_bytes():
+        for i in range(0, len(body), 64):
+            yield body[i:i + 64]
+
+    response.aiter_bytes = aiter_bytes
+    stream_context = MagicMock()
+    stream_context.__aenter__ = AsyncMock(return_value=response)
+    stream_context.__aexit__ = AsyncMock(return_value=None)
+    return stream_context
+
+
 def make_mock_client(*responses):
-    """Return a mock httpx.AsyncClient whose .get() returns responses in order."""
+    """Return a mock httpx.AsyncClient whose .get() and .stream() return responses in order."""
+    remaining = list(responses)
     mock_client = AsyncMock()
-    mock_client.get = AsyncMock(side_effect=list(responses))
+    mock_client.get = AsyncMock(side_effect=lambda *args, **kwargs: remaining.pop(0))
+    mock_client.stream = MagicMock(side_effect=lambda *args, **kwargs: streamable(remaining.pop(0)))
     mock_context = MagicMock()
     mock_context.__aenter__ = AsyncMock(return_value=mock_client)
     mock_context.__aexit__ = AsyncMock(return_value=None)
@@ -113,6 +135,19 @@ class TestIterAllLawBooks:
         assert len(results) == 1
         assert isinstance(results[0], Gesetzbuch)
 
+    @pytest.mark.parametrize("content", [b"not a zip", make_zip("<dokumente><norm>")], ids=["not-a-zip", "malformed-xml"])
+    async def test_corrupt_archive_is_reported_with_its_url(self, content):
+        url = "https://example.com/lawa/xml.zip"
+        mock_ctx = make_mock_client(MagicMock(status_code=200, content=content))
+        report = DownloadReport()
+
+        downloader = GermanLawDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            results = [book async for book in downloader.iter_law_books([url], max_per_second=None, report=report)]
+
+        assert results == []
+        assert report.failed[0].error.startswith(f"An error occurred while processing {url}:")
+
     async def test_toc_failure_raises(self):
         toc_response = MagicMock(status_code=500, text="")
         mock_ctx = make_mock_client(toc_response)
@@ -168,6 +203,164 @@ class TestIterAllJudgements:
         assert len(results) == 1
 
 
+class TestParseExecutor:
+    @pytest.mark.parametrize("parse_executor", ["thread", "process"])
+    async def test_law_books_parsed_in_pool(self, parse_executor):
+        toc_response = MagicMock(status_code=200, text=LAW_TOC_XML)
+        law_response = MagicMock(status_code=200, content=make_zip(LAW_XML))
+        mock_ctx = make_mock_client(toc_response, law_response, law_response)
+
+        downloader = GermanLawDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            results = [book async for book in downloader.iter_all_law_books(max_per_second=None,
+                                                                            parse_executor=parse_executor)]
+
+        assert len(results) == 2
+        assert all(book.norms[0].metadaten.jurabk == "TestGesetz" for book in results)
+
+    async def test_judgements_parsed_in_given_executor(self):
+        toc_response = MagicMock(status_code=200, text=JUDGEMENT_TOC_XML)
+        j_response = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML))
+        mock_ctx = make_mock_client(toc_response, j_response, j_response)
+
+        downloader = GermanJudgementDownloader()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with patch('httpx.AsyncClient', return_value=mock_ctx):
+                results = [j async for j in downloader.iter_all_judgements(max_per_second=None,
+                                                                         parse_executor=executor)]
+            # A caller-supplied executor is left running
+            assert executor.submit(len, "abc").result() == 3
+
+        assert [j.aktenzeichen for j in results] == ["IX ZB 1/23", "IX ZB 1/23"]
+
+    async def test_unknown_executor_raises(self):
+        toc_response = MagicMock(status_code=200, text=JUDGEMENT_TOC_XML)
+        mock_ctx = make_mock_client(toc_response)
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            with pytest.raises(ValueError, match="Unknown parse executor"):
+                async for _ in downloader.iter_all_judgements(max_per_second=None, parse_executor="gpu"):
+                    pass
+
+
+class TestEarlyBreak:
+    async def test_no_requests_after_early_break(self):
+        """Breaking out of the iterator cancels pending downloads and starts no new ones."""
+        n_items = 50
+        toc_xml = "<items>" + "".join(
+            f"<item><gericht>BGH</gericht><entsch-datum>2023-01-15</entsch-datum>"
+            f"<aktenzeichen>IX ZB {i}/23</aktenzeichen><link>http://example.com/j{i}.zip</link>"
+            f"<modified>2023-02-01</modified></item>"
+            for i in range(n_items)
+        ) + "</items>"
+        toc_response = MagicMock(status_code=200, text=toc_xml)
+        j_response = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML))
+        requests = []
+        running = 0
+
+        async def get(url, **kwargs):
+            nonlocal running
+            requests.append(url)
+            if url.endswith('rii-toc.xml'):
+                return toc_response
+            running += 1
+            try:
+                await asyncio.sleep(0.01)
+                return j_response
+            finally:
+                running -= 1
+
+        mock_client = AsyncMock()
+        mock_client.get = get
+        mock_client.stream = MagicMock(side_effect=lambda method, url: requests.append(url) or streamable(toc_response))
+        mock_ctx = MagicMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_ctx.__aexit__ = AsyncMock(return_value=None)
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            async with aclosing(downloader.iter_all_judgements(max_per_second=None, max_in_flight=4)) as judgements:
+                async for _ in judgements:
+                    break
+            issued_at_break = len(requests)
+            await asyncio.sleep(0.1)
+
+        assert running == 0
+        assert len(requests) - issued_at_break == 0
+        # TOC request plus at most the first batch of in-flight downloads
+        assert issued_at_break <= 1 + 4 + 4
+
+
+class TestSpooledDownloads:
+    @staticmethod
+    def spool_spy():
+        spools = []
+        real = tempfile.SpooledTemporaryFile
+
+        def spy(*args, **kwargs):
+            spools.append(real(*args, **kwargs))
+            return spools[-1]
+        return spools, spy
+
+    @pytest.mark.parametrize("parse_executor", [None, "thread", "process"])
+    async def test_archives_are_streamed_and_spooled(self, parse_executor):
+        toc_response = MagicMock(status_code=200, text=LAW_TOC_XML)
+        law_response = MagicMock(status_code=200, content=make_zip(LAW_XML))
+        mock_ctx = make_mock_client(toc_response, law_response, law_response)
+        spools, spy = self.spool_spy()
+
+        downloader = GermanLawDownloader(spool_threshold=64)
+        with patch('httpx.AsyncClient', return_value=mock_ctx), \
+             patch('tempfile.SpooledTemporaryFile', side_effect=spy):
+            results = [book async for book in downloader.iter_all_law_books(max_per_second=None,
+                                                                            parse_executor=parse_executor)]
+
+        assert all(book.norms[0].metadaten.jurabk == "TestGesetz" for book in results)
+        assert len(results) == 2
+        client = mock_ctx.__aenter__.return_value
+        client.get.assert_not_called()
+        assert client.stream.call_count == 3
+        # Archives above the threshold rolled over to disk and were closed after parsing
+        assert len(spools) == 2
+        assert all(spool._rolled and spool.closed for spool in spools)
+
+    async def test_small_archives_stay_in_memory(self):
+        toc_response = MagicMock(status_code=200, text=JUDGEMENT_TOC_XML)
+        j_response = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML))
+        mock_ctx = make_mock_client(toc_response, j_response, j_response)
+        spools, spy = self.spool_spy()
+
+        downloader = GermanJudgementDownloader(spool_threshold=1024 * 1024)
+        with patch('httpx.AsyncClient', return_value=mock_ctx), \
+             patch('tempfile.SpooledTemporaryFile', side_effect=spy):
+            results = [j async for j in downloader.iter_all_judgements(max_per_second=None)]
+
+        assert [j.aktenzeichen for j in results] == ["IX ZB 1/23", "IX ZB 1/23"]
+        assert not any(spool._rolled for spool in spools)
+        assert all(spool.closed for spool in spools)
+
+    async def test_failed_download_closes_spool(self):
+        toc_response = MagicMock(status_code=200, text=JUDGEMENT_TOC_XML)
+        ok_response = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML))
+        fail_response = MagicMock(status_code=500, content=b"")
+        mock_ctx = make_mock_client(toc_response, ok_response, fail_response)
+        spools, spy = self.spool_spy()
+
+        downloader = GermanJudgementDownloader(spool_threshold=64)
+        with patch('httpx.AsyncClient', return_value=mock_ctx), \
+             patch('tempfile.SpooledTemporaryFile', side_effect=spy):
+            results = [j async for j in downloader.iter_all_judgements(max_per_second=None)]
+
+        assert len(results) == 1
+        assert len(spools) == 2
+        assert all(spool.closed for spool in spools)
+
+    def test_negative_threshold_raises(self):
+        with pytest.raises(ValueError, match="spool_threshold"):
+            GermanLawDownloader(spool_threshold=-1)
+
+
 class TestIterFirstNJudgements:
     async def test_yields_n_judgements(self):
         toc_response = MagicMock(status_code=200, text=JUDGEMENT_TOC_XML)
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from germanlegaltexts.CrawlJournal import CrawlJournal
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+
+from test_async_downloaders import JUDGEMENT_TOC_XML, JUDGEMENT_XML, LAW_XML, make_mock_client, make_zip
+from test_retries import async_client, response
+
+
+class TestCrawlJournal:
+    def test_entries_survive_reopening(self, tmp_path):
+        path = tmp_path / "crawl.jsonl"
+        with CrawlJournal(path) as journal:
+            journal.record("https://example.com/a.zip", "aa")
+            journal.record("https://example.com/b.zip", "bb")
+
+        with CrawlJournal(path) as journal:
+            assert len(journal) == 2
+            assert "https://example.com/a.zip" in journal
+            assert journal.sha256("https://example.com/b.zip") == "bb"
+            assert journal.sha256("https://example.com/c.zip") is None
+
+    def test_truncated_last_line_is_dropped(self, tmp_path):
+        path = tmp_path / "crawl.jsonl"
+        with CrawlJournal(path) as journal:
+            journal.record("a", "aa")
+        with open(path, 'ab') as f:
+            f.write(b'{"key": "b", "sha2')  # the process died mid-write
+
+        with CrawlJournal(path) as journal:
+            assert len(journal) == 1
+            journal.record("c", "cc")
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)['key'] for line in lines] == ["a", "c"]
+
+    def test_concurrent_records_are_not_interleaved(self, tmp_path):
+        path = tmp_path / "crawl.jsonl"
+        with CrawlJournal(path) as journal:
+            def work(n):
+                for i in range(200):
+                    journal.record(f"{n}-{i}", "x" * 64)
+
+            threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        with CrawlJournal(path) as journal:
+            assert len(journal) == 1600
+
+
+class TestResumableCrawl:
+    async def test_restarted_crawl_skips_completed_judgements(self, tmp_path):
+        path = tmp_path / "crawl.jsonl"
+        archive = make_zip(JUDGEMENT_XML)
+
+        def toc():
+            return MagicMock(status_code=200, text=JUDGEMENT_TOC_XML, headers={})
+
+        def judgement():
+            return MagicMock(status_code=200, content=archive, headers={})
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=make_mock_client(toc(), judgement(), judgement())):
+            async for i, _ in _enumerate(downloader.iter_all_judgements(max_per_second=None, max_in_flight=1,
+                                                                        journal=path)):
+                if i == 1:
+                    break  # crash while processing the second judgement
+
+        with CrawlJournal(path) as journal:
+            assert len(journal) == 1
+            assert journal.sha256("https://example.com/j1.zip") == hashlib.sha256(archive).hexdigest()
+
+        # Only the TOC and the second judgement are served; a request for j1 would fail
+        client = make_mock_client(toc(), judgement())
+        with patch('httpx.AsyncClient', return_value=client):
+            resumed = [j async for j in downloader.iter_all_judgements(max_per_second=None, journal=path)]
+
+        assert len(resumed) == 1
+        assert client.__aenter__.return_value.get.call_count == 1
+        with CrawlJournal(path) as journal:
+            assert len(journal) == 2
+
+    async def test_item_being_processed_is_delivered_again(self, tmp_path):
+        path = tmp_path / "crawl.jsonl"
+        downloader = GermanLawDownloader()
+        urls = ["https://example.com/a/xml.zip", "https://example.com/b/xml.zip"]
+
+        async def get(url, **kwargs):
+            return response(200, make_zip(LAW_XML))
+
+        with patch('httpx.AsyncClient', return_value=async_client(get)):
+            with pytest.raises(RuntimeError):
+                async for _ in downloader.iter_law_books(urls, max_per_second=None, max_in_flight=1, journal=path):
+                    raise RuntimeError("consumer crashed")
+
+        with CrawlJournal(path) as journal:
+            assert len(journal) == 0
+
+    async def test_shared_journal_is_left_open(self, tmp_path):
+        downloader = GermanLawDownloader()
+
+        async def get(url, **kwargs):
+            return response(200, make_zip(LAW_XML))
+
+        with CrawlJournal(tmp_path / "crawl.jsonl") as journal:
+            with patch('httpx.AsyncClient', return_value=async_client(get)):
+                books = [b async for b in downloader.iter_law_books(["https://example.com/a/xml.zip"],
+                                                                    max_per_second=None, journal=journal)]
+                again = [b async for b in downloader.iter_law_books(["https://example.com/a/xml.zip"],
+                                                                    max_per_second=None, journal=journal)]
+
+        assert len(books) == 1
+        assert again == []
+
+
+async def _enumerate(items):
+    i = 0
+    async for item in items:
+        yield i, item
+        i += 1
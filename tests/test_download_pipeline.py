@@ -0,0 +1,132 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from germanlegaltexts.DownloadPipeline import DownloadPipeline
+
+
+class Tracker:
+    """Download stub that records how many downloads run concurrently."""
+
+    def __init__(self, fail: set[int] | None = None):
+        self.running = 0
+        self.max_running = 0
+        self.started = 0
+        self.fail = fail or set()
+
+    async def download(self, item: int) -> int:
+        self.started += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.001)
+            if item in self.fail:
+                raise ValueError(f"item {item} failed")
+            return item
+        finally:
+            self.running -= 1
+
+
+class TestDownloadPipeline:
+    async def test_yields_all_results(self):
+        tracker = Tracker()
+        pipeline = DownloadPipeline(max_per_second=None, max_in_flight=4)
+
+        results = [r async for r in pipeline.run(range(20), tracker.download, str)]
+
+        assert sorted(results) == list(range(20))
+
+    async def test_skips_failed_downloads(self):
+        tracker = Tracker(fail={3, 7})
+        pipeline = DownloadPipeline(max_per_second=None, max_in_flight=4)
+
+        results = [r async for r in pipeline.run(range(10), tracker.download, str)]
+
+        assert sorted(results) == [0, 1, 2, 4, 5, 6, 8, 9]
+
+    async def test_in_flight_is_capped(self):
+        tracker = Tracker()
+        pipeline = DownloadPipeline(max_per_second=None, max_in_flight=3)
+
+        results = [r async for r in pipeline.run(range(30), tracker.download, str)]
+
+        assert len(results) == 30
+        assert tracker.max_running <= 3
+
+    async def test_slow_consumer_throttles_producer(self):
+        """Started downloads never exceed consumed + buffered + in-flight."""
+        tracker = Tracker()
+        pipeline = DownloadPipeline(max_per_second=None, max_in_flight=2, buffer_size=3)
+
+        consumed = 0
+        async for _ in pipeline.run(range(50), tracker.download, str):
+            consumed += 1
+            await asyncio.sleep(0.005)
+            assert tracker.started <= consumed + 3 + 2
+
+        assert consumed == 50
+
+    async def test_rate_limit_applies_with_max_in_flight(self):
+        tracker = Tracker()
+        pipeline = DownloadPipeline(max_per_second=200.0, max_in_flight=2)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = [r async for r in pipeline.run(range(10), tracker.download, str)]
+
+        assert len(results) == 10
+        assert loop.time() - start >= 9 / 200.0
+
+    def test_invalid_limits_raise(self):
+        with pytest.raises(ValueError, match="max_in_flight must be at least 1"):
+            DownloadPipeline(max_in_flight=0)
+        with pytest.raises(ValueError, match="buffer_size must be at least 1"):
+            DownloadPipeline(buffer_size=0)
+
+    async def test_aclose_cancels_pending_downloads(self):
+        started = []
+        cancelled = []
+
+        async def download(item: int) -> int:
+            started.append(item)
+            try:
+                await asyncio.sleep(0 if item == 0 else 10)
+                return item
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+
+        pipeline = DownloadPipeline(max_per_second=None, max_in_flight=4)
+        results = pipeline.run(range(100), download, str)
+
+        assert await anext(results) == 0
+        await results.aclose()
+
+        assert len(started) <= 5
+        assert sorted(cancelled) == sorted(started)[1:]
+
+    async def test_consumer_exception_cancels_pending_downloads(self):
+        tracker = Tracker()
+        pipeline = DownloadPipeline(max_per_second=None, max_in_flight=4)
+
+        with pytest.raises(RuntimeError):
+            async with aclosing(pipeline.run(range(100), tracker.download, str)) as results:
+                async for _ in results:
+                    raise RuntimeError("consumer failed")
+
+        assert tracker.running == 0
+        started = tracker.started
+        await asyncio.sleep(0.01)
+        assert tracker.started == started
+
+    async def test_producer_error_propagates(self):
+        def items():
+            yield 1
+            raise OSError("index broken")
+
+        pipeline = DownloadPipeline(max_per_second=None)
+
+        with pytest.raises(OSError, match="index broken"):
+            async for _ in pipeline.run(items(), Tracker().download, str):
+                pass
@@ -1,9 +1,16 @@
+import io
 import os
 import sys
+import zipfile
 from unittest.mock import patch, Mock
+
+import pytest
+
 from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
 from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
 
+from test_async_downloaders import make_zip
+
 # Add the parent directory to sys.path to allow importing from src
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -58,8 +65,13 @@ class TestGermanLawDownloader:
           </norm>
         </dokumente>'''
 
-        with patch.object(downloader, 'download_law_xml', return_value=test_xml):
-            result = downloader.download_law_book('tg')
+        mock_response = Mock(status_code=200, content=make_zip(test_xml))
+        with patch('httpx.get', return_value=mock_response), \
+             patch.object(downloader, 'download_law_xml') as download_law_xml:
+            result = downloader.download_law_book('https://www.gesetze-im-internet.de/tg/xml.zip')
+
+            # Parsed from the archive, without decoding the XML to a str first
+            download_law_xml.assert_not_called()
 
             assert isinstance(result, Gesetzbuch)
             assert result.builddate == "2023-01-01"
@@ -102,3 +114,41 @@ class TestGermanLawDownloader:
             assert result[0] == "https://www.gesetze-im-internet.de/1-dm-goldm_nzg/xml.zip"
             assert result[1] == "https://www.gesetze-im-internet.de/besvng_1/xml.zip"
             assert result[2] == "https://www.gesetze-im-internet.de/bimschv_1_2010/xml.zip"
+
+    def test_download_law_xml_reads_zip_in_memory(self):
+        """Test that the XML is read from the archive without extracting it to disk."""
+        downloader = GermanLawDownloader()
+        law_xml = '<?xml version="1.0" encoding="UTF-8"?><dokumente builddate="1" doknr="Ä"/>'
+        mock_response = Mock(status_code=200, content=make_zip(law_xml))
+
+        with patch('httpx.get', return_value=mock_response) as get, \
+             patch('tempfile.TemporaryDirectory') as tmpdir:
+            result = downloader.download_law_xml("https://www.gesetze-im-internet.de/tg/xml.zip")
+
+        assert result == law_xml
+        tmpdir.assert_not_called()
+        get.assert_called_once_with("https://www.gesetze-im-internet.de/tg/xml.zip",
+                                    follow_redirects=True, headers=None)
+
+    def test_download_law_xml_by_abbreviation(self):
+        """Test that the abbreviation is turned into the xml.zip URL."""
+        downloader = GermanLawDownloader()
+        mock_response = Mock(status_code=200, content=make_zip("<dokumente/>"))
+
+        with patch('httpx.get', return_value=mock_response) as get:
+            assert downloader.download_law_xml_by_abbreviation("IfSG") == "<dokumente/>"
+
+        assert get.call_args.args[0] == "https://www.gesetze-im-internet.de/ifsg/xml.zip"
+
+    def test_download_law_xml_rejects_archive_without_single_xml(self):
+        """Test that an archive with more than one XML file raises a ValueError."""
+        downloader = GermanLawDownloader()
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as z:
+            z.writestr("a.xml", "<a/>")
+            z.writestr("b.xml", "<b/>")
+        mock_response = Mock(status_code=200, content=buf.getvalue())
+
+        with patch('httpx.get', return_value=mock_response):
+            with pytest.raises(ValueError, match="Expected 1 XML file, found 2"):
+                downloader.download_law_xml("https://www.gesetze-im-internet.de/tg/xml.zip")
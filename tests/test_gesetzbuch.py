@@ -1,3 +1,6 @@
+import io
+import zipfile
+
 import pytest
 from src.germanlegaltexts.model.Gesetzbuch import Gesetzbuch
 
@@ -62,3 +65,47 @@ class TestGesetzbuch:
 
             assert isinstance(paragraphs, list)
             assert isinstance(sections, list)
+
+
+LAW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="20240101000000" doknr="BJNR000000000">
+  <norm builddate="20240101000000" doknr="BJNR000000000">
+    <metadaten><jurabk>TestG</jurabk><enbez>§ 1</enbez><titel>Zweck des Gesetzes</titel></metadaten>
+    <textdaten><text format="XML"><Content><P>Straßenverkehr</P></Content></text></textdaten>
+  </norm>
+</dokumente>"""
+
+
+class TestGesetzbuchBinaryInput:
+    @pytest.mark.parametrize("as_input", [
+        lambda xml: xml.encode('utf-8'),
+        lambda xml: memoryview(xml.encode('utf-8')),
+        lambda xml: io.BytesIO(xml.encode('utf-8')),
+    ])
+    def test_from_bytes_like(self, as_input):
+        """Test that bytes, memoryview and binary file objects parse like str."""
+        gesetz = Gesetzbuch.from_xml(as_input(LAW_XML))
+
+        assert gesetz == Gesetzbuch.from_xml(LAW_XML)
+        assert gesetz.norms[0].textdaten.text.content.text.strip() == "Straßenverkehr"
+
+    def test_from_zip_member(self):
+        """Test parsing straight from an open zipfile member."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr("BJNR000000000.xml", LAW_XML)
+
+        with zipfile.ZipFile(archive) as z, z.open("BJNR000000000.xml") as member:
+            gesetz = Gesetzbuch.from_xml(member)
+
+        assert gesetz.doknr == "BJNR000000000"
+        assert gesetz.get_paragraph("§ 1") is not None
+
+
+def test_repeated_metadata_is_interned():
+    """Test that values repeating across law books share one string object."""
+    first, second = Gesetzbuch.from_xml(LAW_XML), Gesetzbuch.from_xml(LAW_XML.encode('utf-8'))
+
+    assert first.norms[0].metadaten.jurabk is second.norms[0].metadaten.jurabk
+    assert first.norms[0].builddate is second.norms[0].builddate
+    assert first.norms[0].textdaten.text.format is second.norms[0].textdaten.text.format
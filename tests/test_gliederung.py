@@ -0,0 +1,126 @@
+import pytest
+
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch, Metadaten, Norm, Textdaten
+from germanlegaltexts.model.Gliederung import Gliederung
+
+
+def heading(doknr: str, kennzahl: str | None, bez: str, titel: str) -> str:
+    kennzahl_elem = f"<gliederungskennzahl>{kennzahl}</gliederungskennzahl>" if kennzahl else ""
+    return (f'<norm builddate="20240101" doknr="{doknr}"><metadaten><jurabk>TestG</jurabk>'
+            f'<gliederungseinheit>{kennzahl_elem}<gliederungsbez>{bez}</gliederungsbez>'
+            f'<gliederungstitel>{titel}</gliederungstitel></gliederungseinheit></metadaten></norm>')
+
+
+def paragraph(doknr: str, enbez: str) -> str:
+    return (f'<norm builddate="20240101" doknr="{doknr}"><metadaten><jurabk>TestG</jurabk>'
+            f'<enbez>{enbez}</enbez></metadaten></norm>')
+
+
+LAW_XML = '<dokumente builddate="20240101" doknr="BJNR0000">' + "".join([
+    '<norm builddate="20240101" doknr="BJNR0000"><metadaten><jurabk>TestG</jurabk></metadaten></norm>',
+    paragraph("N01", "Eingangsformel"),
+    heading("H01", "010", "Buch 1", "Allgemeiner Teil"),
+    heading("H02", "010010", "Abschnitt 1", "Personen"),
+    heading("H03", "010010010", "Titel 1", "Natürliche Personen"),
+    paragraph("N02", "§ 1"),
+    paragraph("N03", "§ 2"),
+    heading("H04", "010010020", "Titel 2", "Juristische Personen"),
+    paragraph("N04", "§ 21"),
+    heading("H05", "010020", "Abschnitt 2", "Sachen"),
+    paragraph("N05", "§ 90"),
+    heading("H06", "020", "Buch 2", "Schuldrecht"),
+    heading("H07", "020080", "Abschnitt 8", "Einzelne Schuldverhältnisse"),
+    heading("H08", "020080010", "Titel 1", "Kauf"),
+    paragraph("N06", "§ 433"),
+    paragraph("N07", "§ 434"),
+    heading("H09", "020080020", "Titel 2", "Tausch"),
+    paragraph("N08", "§ 480"),
+]) + '</dokumente>'
+
+
+@pytest.fixture
+def gesetz():
+    return Gesetzbuch.from_xml(LAW_XML)
+
+
+def enbez(norms: list[Norm]) -> list[str]:
+    return [norm.metadaten.enbez for norm in norms]
+
+
+def test_outline_follows_kennzahl(gesetz):
+    root = gesetz.get_gliederung()
+
+    assert [unit.bez for unit in root.children] == ["Buch 1", "Buch 2"]
+    assert [unit.bez for unit in root.children[0].children] == ["Abschnitt 1", "Abschnitt 2"]
+    assert [unit.titel for unit in root.find("Buch 1", "Abschnitt 1").children] == [
+        "Natürliche Personen", "Juristische Personen"]
+
+
+def test_units_cover_contiguous_ranges(gesetz):
+    root = gesetz.get_gliederung()
+    buch_1 = root.find("Buch 1")
+
+    assert (root.start, root.end) == (0, len(gesetz.norms))
+    assert gesetz.norms[buch_1.start].doknr == "H01"
+    assert gesetz.norms[buch_1.end].doknr == "H06"
+    assert buch_1.find("Abschnitt 2").end == buch_1.end
+    assert root.find("Buch 2", "Abschnitt 8", "Titel 2").end == len(gesetz.norms)
+
+
+def test_get_norms_in(gesetz):
+    assert enbez(gesetz.get_norms_in("Buch 2", "Abschnitt 8", "Titel 1")) == ["§ 433", "§ 434"]
+    assert enbez(gesetz.get_norms_in("Buch 1")) == ["§ 1", "§ 2", "§ 21", "§ 90"]
+    assert enbez(gesetz.get_norms_in("buch  2", "ABSCHNITT 8")) == ["§ 433", "§ 434", "§ 480"]
+    assert gesetz.get_norms_in("Buch 3") == []
+    assert gesetz.get_norms_in("Buch 1", "Titel 1") == []
+
+
+def test_walk_renders_table_of_contents(gesetz):
+    toc = [f"{'  ' * (depth - 1)}{unit.bez}" for depth, unit in gesetz.get_gliederung().walk() if depth]
+
+    assert toc == [
+        "Buch 1", "  Abschnitt 1", "    Titel 1", "    Titel 2", "  Abschnitt 2",
+        "Buch 2", "  Abschnitt 8", "    Titel 1", "    Titel 2",
+    ]
+
+
+def test_heading_without_kennzahl_is_top_level():
+    xml = ('<dokumente builddate="20240101" doknr="BJNR0000">'
+           + heading("H01", "010", "Teil 1", "Eins") + paragraph("N01", "§ 1")
+           + heading("H02", None, "Anlagen", "Anlagen") + paragraph("N02", "Anlage 1")
+           + '</dokumente>')
+    gesetz = Gesetzbuch.from_xml(xml)
+
+    assert [unit.bez for unit in gesetz.get_gliederung().children] == ["Teil 1", "Anlagen"]
+    assert enbez(gesetz.get_norms_in("Anlagen")) == ["Anlage 1"]
+
+
+def test_heading_without_kennzahl_before_numbered_ones():
+    xml = ('<dokumente builddate="20240101" doknr="BJNR0000">'
+           + heading("H01", None, "Anlage", "Vorbemerkung") + paragraph("N01", "Anlage 1")
+           + heading("H02", "010", "Teil 1", "Eins") + heading("H03", "010010", "Kapitel 1", "A")
+           + paragraph("N02", "§ 1")
+           + '</dokumente>')
+    gesetz = Gesetzbuch.from_xml(xml)
+
+    assert [unit.bez for unit in gesetz.get_gliederung().children] == ["Anlage", "Teil 1"]
+    assert gesetz.get_gliederung("Anlage").children == []
+    assert enbez(gesetz.get_norms_in("Anlage")) == ["Anlage 1"]
+    assert enbez(gesetz.get_norms_in("Teil 1", "Kapitel 1")) == ["§ 1"]
+    assert gesetz.get_paragraph("§ 1").doknr == "N02"
+
+
+def test_outline_is_rebuilt_after_changes(gesetz):
+    assert gesetz.get_gliederung("Buch 3") is None
+    gesetz.norms.append(Norm("20240101", "H10", Metadaten(
+        jurabk="TestG", gliederungseinheit={'gliederungskennzahl': "030", 'gliederungsbez': "Buch 3"}), Textdaten()))
+
+    assert gesetz.get_gliederung("Buch 3").start == len(gesetz.norms) - 1
+
+
+def test_lookup_table_is_not_a_constructor_argument():
+    with pytest.raises(TypeError):
+        Gliederung(kennzahl=None, bez=None, titel=None, start=0, end=0, _children_by_bez={})
+
+    unit = Gliederung(kennzahl="010", bez="Teil 1", titel="Eins", start=0, end=1)
+    assert "_children_by_bez" not in repr(unit)
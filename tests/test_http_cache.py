@@ -0,0 +1,192 @@
+import os
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+from germanlegaltexts.HttpCache import HttpCache
+
+URL = "https://example.com/gii-toc.xml"
+
+LAW_TOC_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<items>
+  <item><title>Gesetz A</title><link>http://example.com/lawa/xml.zip</link></item>
+</items>"""
+
+JUDGEMENT_TOC_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<items>
+  <item>
+    <gericht>BGH</gericht>
+    <entsch-datum>2023-01-15</entsch-datum>
+    <aktenzeichen>IX ZB 1/23</aktenzeichen>
+    <link>http://example.com/j1.zip</link>
+    <modified>2023-02-01</modified>
+  </item>
+</items>"""
+
+
+def ok(content: bytes, **headers) -> httpx.Response:
+    return httpx.Response(200, content=content, headers=headers, request=httpx.Request('GET', URL))
+
+
+def not_modified() -> httpx.Response:
+    return httpx.Response(304, request=httpx.Request('GET', URL))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(tmp_path / "cache")
+
+
+class TestHttpCache:
+    def test_uncached_url_has_no_conditional_headers(self, cache):
+        assert cache.request_headers(URL) == {}
+
+    def test_stores_response_with_validators(self, cache):
+        cache.update(URL, ok(b"payload", etag='"abc"', **{'last-modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}))
+
+        assert cache.request_headers(URL) == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT',
+        }
+        assert cache.size == len(b"payload")
+
+    def test_response_without_validators_is_not_stored(self, cache):
+        response = ok(b"payload")
+
+        assert cache.update(URL, response) is response
+        assert cache.request_headers(URL) == {}
+        assert cache.size == 0
+
+    def test_304_is_served_from_disk(self, cache):
+        cache.update(URL, ok(b"payload", etag='"abc"'))
+
+        response = cache.update(URL, not_modified())
+
+        assert response.status_code == 200
+        assert response.content == b"payload"
+        assert response.headers['etag'] == '"abc"'
+
+    def test_304_without_entry_returns_none(self, cache):
+        assert cache.update(URL, not_modified()) is None
+
+    def test_non_200_responses_pass_through(self, cache):
+        response = httpx.Response(404, request=httpx.Request('GET', URL))
+
+        assert cache.update(URL, response) is response
+        assert cache.size == 0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = HttpCache(tmp_path / "cache", max_size=10)
+        cache.update("https://example.com/a", ok(b"aaaa", etag='"a"'))
+        cache.update("https://example.com/b", ok(b"bbbb", etag='"b"'))
+        # Revalidating a marks it as recently used, so b is evicted first
+        cache.update("https://example.com/a", not_modified())
+        cache.update("https://example.com/c", ok(b"cccc", etag='"c"'))
+
+        assert cache.request_headers("https://example.com/a") != {}
+        assert cache.request_headers("https://example.com/b") == {}
+        assert cache.request_headers("https://example.com/c") != {}
+        assert cache.size == 8
+
+    def test_restored_entry_replaces_its_size(self, tmp_path):
+        cache = HttpCache(tmp_path / "cache", max_size=10)
+        cache.update("https://example.com/a", ok(b"aaaa", etag='"a1"'))
+        cache.update("https://example.com/a", ok(b"aaaaaa", etag='"a2"'))
+        cache.update("https://example.com/b", ok(b"bbbb", etag='"b"'))
+
+        assert cache.size == 10
+        assert cache.request_headers("https://example.com/a") != {}
+
+    def test_reopened_cache_evicts_oldest_first(self, tmp_path):
+        cache = HttpCache(tmp_path / "cache", max_size=10)
+        cache.update("https://example.com/a", ok(b"aaaa", etag='"a"'))
+        cache.update("https://example.com/b", ok(b"bbbb", etag='"b"'))
+        os.utime(cache._meta_path(cache._key("https://example.com/a")), (2000, 2000))
+        os.utime(cache._meta_path(cache._key("https://example.com/b")), (1000, 1000))
+
+        reopened = HttpCache(tmp_path / "cache", max_size=10)
+        reopened.update("https://example.com/c", ok(b"cccc", etag='"c"'))
+
+        assert reopened.request_headers("https://example.com/a") != {}
+        assert reopened.request_headers("https://example.com/b") == {}
+        assert reopened.size == 8
+
+    def test_oversized_body_is_not_stored(self, tmp_path):
+        cache = HttpCache(tmp_path / "cache", max_size=3)
+        cache.update(URL, ok(b"payload", etag='"abc"'))
+
+        assert cache.size == 0
+
+    def test_entries_survive_new_instance(self, tmp_path):
+        HttpCache(tmp_path / "cache").update(URL, ok(b"payload", etag='"abc"'))
+
+        reopened = HttpCache(tmp_path / "cache")
+
+        assert reopened.size == len(b"payload")
+        assert reopened.update(URL, not_modified()).content == b"payload"
+
+    def test_clear(self, cache):
+        cache.update(URL, ok(b"payload", etag='"abc"'))
+        cache.clear()
+
+        assert cache.size == 0
+        assert cache.request_headers(URL) == {}
+
+
+class TestDownloaderCaching:
+    def test_sync_revalidates_and_serves_304(self, cache):
+        requests = []
+
+        def get(url, follow_redirects, headers=None):
+            requests.append(headers or {})
+            if headers and headers.get('If-None-Match') == '"v1"':
+                return not_modified()
+            return ok(LAW_TOC_XML, etag='"v1"')
+
+        downloader = GermanLawDownloader(cache=cache)
+        with patch('httpx.get', side_effect=get):
+            first = downloader.get_all_xml_paths()
+            second = downloader.get_all_xml_paths()
+
+        assert first == second == ["https://example.com/lawa/xml.zip"]
+        assert requests == [{}, {'If-None-Match': '"v1"'}]
+
+    def test_sync_refetches_if_entry_vanished(self, cache):
+        cache.update(URL, ok(LAW_TOC_XML, etag='"v1"'))
+        responses = [not_modified(), ok(LAW_TOC_XML, etag='"v2"')]
+
+        def get(url, follow_redirects, headers=None):
+            if headers:
+                cache.clear()
+            return responses.pop(0)
+
+        downloader = GermanLawDownloader(cache=cache)
+        downloader.base_url = "https://example.com"
+        with patch('httpx.get', side_effect=get):
+            paths = downloader.get_all_xml_paths()
+
+        assert paths == ["https://example.com/lawa/xml.zip"]
+        assert responses == []
+
+    async def test_async_revalidates_and_serves_304(self, cache):
+        requests = []
+
+        async def get(url, headers=None):
+            requests.append(headers or {})
+            if headers and headers.get('If-None-Match') == '"v1"':
+                return not_modified()
+            return ok(JUDGEMENT_TOC_XML, etag='"v1"')
+
+        client = AsyncMock()
+        client.get = get
+        downloader = GermanJudgementDownloader(cache=cache)
+
+        first = await downloader._get_all_judgement_index_items_async(client)
+        second = await downloader._get_all_judgement_index_items_async(client)
+
+        assert first == second
+        assert first[0].aktenzeichen == "IX ZB 1/23"
+        assert requests == [{}, {'If-None-Match': '"v1"'}]
@@ -0,0 +1,74 @@
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
+from germanlegaltexts.model.XmlSource import iter_child_elements
+
+from test_lazy_gesetzbuch import TRICKY_LAW_XML
+from test_serialization import RICH_LAW_XML
+
+
+class CountingReader(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+def big_law(norms: int) -> bytes:
+    body = "".join(
+        f'<norm builddate="20240101" doknr="BJNR{i:05d}"><metadaten><jurabk>TestG</jurabk><enbez>§ {i}</enbez>'
+        f'</metadaten><textdaten><text format="XML"><Content><P>Absatz {i}</P></Content></text></textdaten></norm>'
+        for i in range(norms)
+    )
+    return f'<dokumente builddate="20240101" doknr="BJNR0000">{body}</dokumente>'.encode('utf-8')
+
+
+@pytest.mark.parametrize("xml", [RICH_LAW_XML, TRICKY_LAW_XML])
+@pytest.mark.parametrize("as_input", [
+    lambda xml: xml,
+    lambda xml: xml.encode('utf-8'),
+    lambda xml: memoryview(xml.encode('utf-8')),
+    lambda xml: io.BytesIO(xml.encode('utf-8')),
+])
+def test_iter_norms_matches_from_xml(xml, as_input):
+    assert list(Gesetzbuch.iter_norms(as_input(xml))) == Gesetzbuch.from_xml(xml).norms
+
+
+def test_corpus_iter_norms_matches_from_xml(all_xml_contents):
+    for name, content in all_xml_contents.items():
+        assert list(Gesetzbuch.iter_norms(content.encode('utf-8'))) == Gesetzbuch.from_xml(content).norms, name
+
+
+def test_first_norm_arrives_before_the_source_is_read():
+    reader = CountingReader(big_law(2000))
+
+    norms = Gesetzbuch.iter_norms(reader)
+    first = next(norms)
+
+    assert first.metadaten.enbez == "§ 0"
+    assert reader.reads == 1
+    assert len(list(norms)) == 1999
+
+
+def test_yielded_elements_are_released():
+    seen = []
+    for element in iter_child_elements(big_law(50), 'norm', chunk_size=256):
+        assert all(len(previous) == 0 and not previous.attrib for previous in seen)
+        seen.append(element)
+
+    assert len(seen) == 50
+
+
+def test_parse_error_after_earlier_norms():
+    broken = big_law(3)[:-len(b'</norm></dokumente>')]
+    norms = Gesetzbuch.iter_norms(broken + b'</dokumente>')
+
+    assert next(norms).doknr == "BJNR00000"
+    with pytest.raises(ET.ParseError):
+        list(norms)
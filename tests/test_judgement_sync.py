@@ -0,0 +1,194 @@
+from unittest.mock import MagicMock, patch
+
+from germanlegaltexts.DownloadReport import DownloadReport
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.SyncState import IndexDiff, JudgementSyncState
+from germanlegaltexts.model.Rechtsprechung import Rechtsprechung, RIIIndexItem
+
+from test_async_downloaders import JUDGEMENT_XML, make_mock_client, make_zip
+
+
+def item(n: int, modified: str = "2023-01-01") -> RIIIndexItem:
+    return RIIIndexItem(
+        gericht="BGH",
+        entsch_datum="20230101",
+        aktenzeichen=f"IX ZB {n}/23",
+        link=f"https://example.com/j{n}.zip",
+        modified=modified,
+    )
+
+
+def toc_xml(items: list[RIIIndexItem]) -> str:
+    return "<items>" + "".join(
+        f"<item><gericht>{i.gericht}</gericht><entsch-datum>{i.entsch_datum}</entsch-datum>"
+        f"<aktenzeichen>{i.aktenzeichen}</aktenzeichen><link>{i.link}</link>"
+        f"<modified>{i.modified}</modified></item>"
+        for i in items
+    ) + "</items>"
+
+
+class TestIndexDiff:
+    def test_classifies_items(self):
+        previous = [item(1), item(2), item(3)]
+        current = [item(1), item(2, modified="2024-05-05"), item(4)]
+
+        diff = IndexDiff.between(previous, current)
+
+        assert diff.unchanged == [item(1)]
+        assert diff.changed == [item(2, modified="2024-05-05")]
+        assert diff.new == [item(4)]
+        assert diff.deleted == [item(3)]
+
+    def test_empty_previous_means_everything_is_new(self):
+        diff = IndexDiff.between([], [item(1), item(2)])
+
+        assert diff.new == [item(1), item(2)]
+        assert diff.changed == diff.unchanged == diff.deleted == []
+
+
+class TestJudgementSyncState:
+    def test_missing_file_is_empty(self, tmp_path):
+        state = JudgementSyncState.load(tmp_path / "state.json")
+
+        assert state.items == []
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = tmp_path / "state.json"
+        state = JudgementSyncState([item(1), item(2)], path=path)
+        state.mark_deleted(item(1))
+        state.mark_synced(item(3))
+        state.save()
+
+        assert JudgementSyncState.load(path).items == [item(2), item(3)]
+
+
+class TestSyncJudgements:
+    def test_downloads_only_new_and_changed(self, tmp_path):
+        path = tmp_path / "state.json"
+        JudgementSyncState([item(1), item(2), item(3)], path=path).save()
+        current = [item(1), item(2, modified="2024-05-05"), item(4)]
+        judgement = Rechtsprechung.from_xml(JUDGEMENT_XML)
+
+        downloader = GermanJudgementDownloader()
+        with patch.object(downloader, 'get_all_judgement_index_items', return_value=current), \
+             patch.object(downloader, 'download_judgement', return_value=judgement) as download:
+            changes = downloader.sync_judgements(path)
+
+        assert [(c.status, c.item.link) for c in changes] == [
+            ('deleted', item(3).link),
+            ('new', item(4).link),
+            ('changed', item(2).link),
+        ]
+        assert changes[0].judgement is None
+        assert changes[1].judgement is judgement
+        assert sorted(call.args[0] for call in download.call_args_list) == [item(2).link, item(4).link]
+        assert JudgementSyncState.load(path).items == current
+
+    def test_failed_download_is_retried_next_time(self, tmp_path):
+        path = tmp_path / "state.json"
+        JudgementSyncState([item(1)], path=path).save()
+        current = [item(1, modified="2024-05-05"), item(2)]
+
+        downloader = GermanJudgementDownloader()
+        with patch.object(downloader, 'get_all_judgement_index_items', return_value=current), \
+             patch.object(downloader, 'download_judgement', side_effect=ValueError("boom")):
+            changes = downloader.sync_judgements(path)
+
+        assert changes == []
+        assert JudgementSyncState.load(path).items == [item(1)]
+
+    def test_passes_modified_for_the_parsed_cache(self):
+        current = [item(1, modified="2024-05-05")]
+        downloader = GermanJudgementDownloader()
+        with patch.object(downloader, 'get_all_judgement_index_items', return_value=current), \
+             patch.object(downloader, 'download_judgement') as download:
+            downloader.sync_judgements([])
+
+        download.assert_called_once_with(item(1).link, modified="2024-05-05")
+
+    def test_failures_are_reported(self):
+        current = [item(1), item(2)]
+        judgement = Rechtsprechung.from_xml(JUDGEMENT_XML)
+        report = DownloadReport()
+
+        def download(link, modified=None):
+            if link == item(1).link:
+                raise ValueError("boom")
+            return judgement
+
+        downloader = GermanJudgementDownloader()
+        with patch.object(downloader, 'get_all_judgement_index_items', return_value=current), \
+             patch.object(downloader, 'download_judgement', side_effect=download):
+            changes = downloader.sync_judgements([], workers=2, report=report)
+
+        assert [(c.status, c.item) for c in changes] == [('new', item(2))]
+        assert report.failed_items == [item(1)]
+        assert report.succeeded == 1
+
+    def test_rate_limiter_paces_every_download(self):
+        limiter = MagicMock()
+        downloader = GermanJudgementDownloader(rate_limiter=limiter)
+        with patch.object(downloader, 'get_all_judgement_index_items', return_value=[item(1), item(2)]), \
+             patch.object(downloader, 'download_judgement'):
+            downloader.sync_judgements([])
+
+        assert limiter.acquire.call_count == 2
+
+    def test_accepts_previous_index_list(self):
+        downloader = GermanJudgementDownloader()
+        with patch.object(downloader, 'get_all_judgement_index_items', return_value=[item(1)]), \
+             patch.object(downloader, 'download_judgement') as download:
+            changes = downloader.sync_judgements([item(1)])
+
+        assert changes == []
+        download.assert_not_called()
+
+
+class TestIterJudgementChanges:
+    async def test_yields_deleted_then_downloads(self, tmp_path):
+        path = tmp_path / "state.json"
+        JudgementSyncState([item(1), item(2)], path=path).save()
+        current = [item(1), item(3)]
+        toc_response = MagicMock(status_code=200, text=toc_xml(current))
+        j_response = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML))
+        mock_ctx = make_mock_client(toc_response, j_response)
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            changes = [c async for c in downloader.iter_judgement_changes(path, max_per_second=None)]
+
+        assert [(c.status, c.item.link) for c in changes] == [('deleted', item(2).link), ('new', item(3).link)]
+        assert isinstance(changes[1].judgement, Rechtsprechung)
+        assert mock_ctx.__aenter__.return_value.get.call_count == 2
+        assert JudgementSyncState.load(path).items == current
+
+    async def test_early_stop_saves_partial_progress(self, tmp_path):
+        path = tmp_path / "state.json"
+        current = [item(1), item(2)]
+        toc_response = MagicMock(status_code=200, text=toc_xml(current))
+        j_response = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML))
+        mock_ctx = make_mock_client(toc_response, j_response, j_response)
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            changes = downloader.iter_judgement_changes(path, max_per_second=None, max_in_flight=1, buffer_size=1)
+            first = await anext(changes)
+            await changes.aclose()
+
+        assert JudgementSyncState.load(path).items == [first.item]
+
+    async def test_failures_are_reported(self):
+        current = [item(1), item(2)]
+        toc_response = MagicMock(status_code=200, text=toc_xml(current))
+        j_response = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML))
+        mock_ctx = make_mock_client(toc_response, MagicMock(status_code=500), j_response)
+        report = DownloadReport()
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            changes = [c async for c in downloader.iter_judgement_changes([], max_per_second=None,
+                                                                           max_in_flight=1, report=report)]
+
+        assert [c.item for c in changes] == [item(2)]
+        assert report.failed_items == [item(1)]
+        assert report.succeeded == 1
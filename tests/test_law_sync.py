@@ -0,0 +1,173 @@
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from germanlegaltexts.DownloadReport import DownloadReport
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+from germanlegaltexts.SyncState import LawManifest, LawManifestEntry, LawSyncResult
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
+
+from test_async_downloaders import make_zip
+
+URL_A = "https://example.com/lawa/xml.zip"
+URL_B = "https://example.com/lawb/xml.zip"
+URL_C = "https://example.com/lawc/xml.zip"
+
+
+def law_xml(doknr: str, builddate: str) -> str:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="{builddate}" doknr="{doknr}">
+  <norm builddate="{builddate}" doknr="{doknr}">
+    <metadaten><jurabk>{doknr}</jurabk><enbez>§ 1</enbez></metadaten>
+    <textdaten><text format="XML"><Content>Text</Content></text></textdaten>
+  </norm>
+</dokumente>"""
+
+
+class FakeServer:
+    """Serves law zips and answers conditional requests like gesetze-im-internet.de."""
+
+    def __init__(self, laws: dict[str, tuple[bytes, str]]):
+        self.laws = laws
+        self.requests = []
+
+    def get(self, url, follow_redirects=True, headers=None):
+        headers = headers or {}
+        self.requests.append((url, headers))
+        content, etag = self.laws[url]
+        if headers.get('If-None-Match') == etag:
+            return httpx.Response(304, request=httpx.Request('GET', url))
+        return httpx.Response(200, content=content, headers={'ETag': etag}, request=httpx.Request('GET', url))
+
+
+def sync(downloader: GermanLawDownloader, server: FakeServer, manifest) -> LawSyncResult:
+    with patch.object(downloader, 'get_all_xml_paths', return_value=list(server.laws)), \
+         patch('httpx.get', side_effect=server.get):
+        return downloader.download_all_law_books(incremental=manifest)
+
+
+class TestSyncLawBooks:
+    def test_first_sync_downloads_everything(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        server = FakeServer({
+            URL_A: (make_zip(law_xml("A", "1")), '"a1"'),
+            URL_B: (make_zip(law_xml("B", "1")), '"b1"'),
+        })
+
+        result = sync(GermanLawDownloader(), server, path)
+
+        assert [book.doknr for book in result.new] == ["A", "B"]
+        assert result.changed == result.unchanged == result.removed == []
+        entries = LawManifest.load(path).entries
+        assert [(e.url, e.doknr, e.builddate, e.etag) for e in entries] == [
+            (URL_A, "A", "1", '"a1"'),
+            (URL_B, "B", "1", '"b1"'),
+        ]
+        assert entries[0].sha256 == hashlib.sha256(server.laws[URL_A][0]).hexdigest()
+
+    def test_second_sync_only_fetches_changes(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        downloader = GermanLawDownloader()
+        server = FakeServer({
+            URL_A: (make_zip(law_xml("A", "1")), '"a1"'),
+            URL_B: (make_zip(law_xml("B", "1")), '"b1"'),
+        })
+        sync(downloader, server, path)
+
+        server.laws = {
+            URL_A: (make_zip(law_xml("A", "2")), '"a2"'),
+            URL_C: (make_zip(law_xml("C", "1")), '"c1"'),
+        }
+        server.requests.clear()
+        with patch.object(Gesetzbuch, 'from_xml', wraps=Gesetzbuch.from_xml) as parse:
+            result = sync(downloader, server, path)
+
+        assert [book.builddate for book in result.changed] == ["2"]
+        assert [book.doknr for book in result.new] == ["C"]
+        assert result.removed == [URL_B]
+        assert parse.call_count == 2
+        assert server.requests[0] == (URL_A, {'If-None-Match': '"a1"'})
+        assert [e.url for e in LawManifest.load(path).entries] == [URL_A, URL_C]
+
+    def test_not_modified_is_unchanged_without_parsing(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        downloader = GermanLawDownloader()
+        server = FakeServer({URL_A: (make_zip(law_xml("A", "1")), '"a1"')})
+        sync(downloader, server, path)
+
+        with patch.object(Gesetzbuch, 'from_xml') as parse:
+            result = sync(downloader, server, path)
+
+        parse.assert_not_called()
+        assert [entry.url for entry in result.unchanged] == [URL_A]
+        assert result.new == result.changed == []
+
+    def test_same_payload_without_validators_is_unchanged(self):
+        content = make_zip(law_xml("A", "1"))
+        manifest = LawManifest([LawManifestEntry(url=URL_A, builddate="1", doknr="A",
+                                                 sha256=hashlib.sha256(content).hexdigest())])
+        server = FakeServer({URL_A: (content, '"new-etag"')})
+
+        with patch.object(Gesetzbuch, 'from_xml') as parse:
+            result = sync(GermanLawDownloader(), server, manifest)
+
+        parse.assert_not_called()
+        assert result.unchanged[0].etag == '"new-etag"'
+
+    def test_failed_download_keeps_previous_entry(self):
+        previous = LawManifestEntry(url=URL_A, builddate="1", doknr="A", sha256="x", etag='"a1"')
+        manifest = LawManifest([previous])
+        downloader = GermanLawDownloader()
+
+        with patch.object(downloader, 'get_all_xml_paths', return_value=[URL_A]), \
+             patch('httpx.get', return_value=httpx.Response(500, request=httpx.Request('GET', URL_A))):
+            result = downloader.sync_law_books(manifest)
+
+        assert result.failed == [URL_A]
+        assert manifest.get(URL_A) == previous
+
+    def test_failed_download_is_reported(self):
+        downloader = GermanLawDownloader()
+        report = DownloadReport()
+
+        with patch.object(downloader, 'get_all_xml_paths', return_value=[URL_A]), \
+             patch('httpx.get', return_value=httpx.Response(500, request=httpx.Request('GET', URL_A))):
+            result = downloader.sync_law_books(LawManifest(), report=report)
+
+        assert result.failed == report.failed_items == [URL_A]
+
+    def test_rate_limiter_paces_every_download(self):
+        server = FakeServer({
+            URL_A: (make_zip(law_xml("A", "1")), '"a1"'),
+            URL_B: (make_zip(law_xml("B", "1")), '"b1"'),
+        })
+        limiter = MagicMock()
+
+        sync(GermanLawDownloader(rate_limiter=limiter), server, LawManifest())
+
+        assert limiter.acquire.call_count == 2
+
+    def test_workers_keep_index_order(self):
+        server = FakeServer({
+            URL_A: (make_zip(law_xml("A", "1")), '"a1"'),
+            URL_B: (make_zip(law_xml("B", "1")), '"b1"'),
+            URL_C: (make_zip(law_xml("C", "1")), '"c1"'),
+        })
+        downloader = GermanLawDownloader()
+
+        with patch.object(downloader, 'get_all_xml_paths', return_value=list(server.laws)), \
+             patch.object(httpx.Client, 'get', side_effect=server.get):
+            result = downloader.sync_law_books(LawManifest(), workers=2)
+
+        assert [book.doknr for book in result.new] == ["A", "B", "C"]
+
+    def test_incremental_download_passes_batch_options(self):
+        downloader = GermanLawDownloader()
+        report = DownloadReport()
+
+        with patch.object(downloader, 'sync_law_books') as sync_law_books:
+            downloader.download_all_law_books(incremental=LawManifest(), workers=3, max_per_second=2.0, report=report)
+
+        _, kwargs = sync_law_books.call_args
+        assert kwargs == {'workers': 3, 'max_per_second': 2.0, 'report': report}
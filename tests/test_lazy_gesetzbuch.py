@@ -0,0 +1,144 @@
+import copy
+import io
+import pickle
+import zipfile
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from germanlegaltexts.model.ContentStore import ContentStore, cut_out_contents
+from germanlegaltexts.model.Gesetzbuch import Content, Gesetzbuch, LazyContent
+
+from test_serialization import RICH_LAW_XML
+
+TRICKY_LAW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="20240101" doknr="BJNR0001">
+  <norm builddate="20240101" doknr="BJNR0001">
+    <metadaten><jurabk>TestG</jurabk><enbez>§ 1</enbez></metadaten>
+    <textdaten>
+      <text format="XML"><Content Class="x"><P>(1) A &amp; B &#167; 2 „Zitat“</P>
+        <DL Type="arabic"><DT>1.</DT><DD><LA>Nummer</LA></DD></DL></Content>  nach dem Inhalt
+      </text>
+      <fussnoten><Content/></fussnoten>
+    </textdaten>
+  </norm>
+  <norm builddate="20240101" doknr="BJNR0002">
+    <metadaten><jurabk>TestG</jurabk><enbez>§ 2</enbez></metadaten>
+    <textdaten><text format="XML"><Content><P>Zweiter</P></Content></text>
+      <fussnoten><Content><P>Fußnote</P></Content></fussnoten></textdaten>
+  </norm>
+</dokumente>"""
+
+
+def contents(gesetz: Gesetzbuch) -> list[Content]:
+    result = []
+    for norm in gesetz.norms:
+        if norm.textdaten.text and norm.textdaten.text.content:
+            result.append(norm.textdaten.text.content)
+        if norm.textdaten.fussnoten and norm.textdaten.fussnoten.content:
+            result.append(norm.textdaten.fussnoten.content)
+    return result
+
+
+@pytest.mark.parametrize("xml", [RICH_LAW_XML, TRICKY_LAW_XML])
+@pytest.mark.parametrize("as_input", [
+    lambda xml: xml,
+    lambda xml: xml.encode('utf-8'),
+    lambda xml: memoryview(xml.encode('utf-8')),
+    lambda xml: io.BytesIO(xml.encode('utf-8')),
+])
+def test_lazy_parse_matches_eager(xml, as_input):
+    eager = Gesetzbuch.from_xml(xml)
+    lazy = Gesetzbuch.from_xml(as_input(xml), lazy=True)
+
+    assert lazy == eager
+    assert [content.text for content in contents(lazy)] == [content.text for content in contents(eager)]
+
+
+def test_corpus_lazy_parse_matches_eager(all_xml_contents):
+    for name, content in all_xml_contents.items():
+        assert Gesetzbuch.from_xml(content.encode('utf-8'), lazy=True) == Gesetzbuch.from_xml(content), name
+
+
+def test_declared_encoding_is_kept():
+    xml = TRICKY_LAW_XML.replace('encoding="UTF-8"', 'encoding="ISO-8859-15"')
+    data = xml.replace('„Zitat“', 'Zitat').encode('iso-8859-15')
+
+    lazy = Gesetzbuch.from_xml(data, lazy=True)
+
+    assert lazy == Gesetzbuch.from_xml(data)
+    assert "Fußnote" in lazy.norms[1].textdaten.fussnoten.content.text
+
+
+def test_text_is_extracted_on_first_access():
+    gesetz = Gesetzbuch.from_xml(TRICKY_LAW_XML, lazy=True)
+    content = gesetz.get_paragraph("§ 1").textdaten.text.content
+
+    assert isinstance(content, LazyContent)
+    assert not content.is_loaded
+    assert "A & B § 2" in content.text
+    assert content.is_loaded
+    assert not gesetz.norms[1].textdaten.text.content.is_loaded
+
+
+def test_empty_content_is_parsed_eagerly():
+    gesetz = Gesetzbuch.from_xml(TRICKY_LAW_XML, lazy=True)
+
+    assert type(gesetz.norms[0].textdaten.fussnoten.content) is Content
+
+
+def test_assigning_text_replaces_the_source():
+    content = Gesetzbuch.from_xml(TRICKY_LAW_XML, lazy=True).norms[1].textdaten.text.content
+    content.text = "neu"
+
+    assert content.is_loaded
+    assert content.text == "neu"
+    assert content == Content("neu")
+
+
+def test_copies_are_plain_content():
+    gesetz = Gesetzbuch.from_xml(TRICKY_LAW_XML, lazy=True)
+
+    for clone in (pickle.loads(pickle.dumps(gesetz)), copy.deepcopy(gesetz), Gesetzbuch.from_tuple(gesetz.to_tuple())):
+        assert clone == gesetz
+        assert all(type(content) is Content for content in contents(clone))
+
+
+def test_lazy_parse_of_zip_member():
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr("BJNR0001.xml", TRICKY_LAW_XML)
+
+    with zipfile.ZipFile(archive) as z, z.open("BJNR0001.xml") as member:
+        gesetz = Gesetzbuch.from_xml(member, lazy=True)
+
+    assert gesetz == Gesetzbuch.from_xml(TRICKY_LAW_XML)
+
+
+class TestContentStore:
+    @pytest.mark.parametrize("kind", [str, bytes])
+    def test_fragments_across_blocks(self, kind):
+        fragments = [f"<Content><P>Absatz {i}</P></Content>" for i in range(200)]
+        if kind is bytes:
+            fragments = [fragment.encode('utf-8') for fragment in fragments]
+        store = ContentStore(fragments, block_size=256)
+
+        assert len(store) == 200
+        assert len(store._blocks) > 10
+        assert [store[i] for i in (150, 3, 199, 0, 4)] == [fragments[i] for i in (150, 3, 199, 0, 4)]
+
+    def test_bytes_fragments_get_the_declaration(self):
+        store = ContentStore([b"<Content>\xe4</Content>"], declaration=b'<?xml version="1.0" encoding="ISO-8859-1"?>')
+
+        assert ET.fromstring(store[0]).text == "ä"
+
+    def test_cut_out_contents_skips_similar_names(self):
+        skeleton, store = cut_out_contents("<a><ContentX>1</ContentX><Content/><Content a='b'>2</Content></a>")
+
+        assert skeleton == '<a><ContentX>1</ContentX><Content/><Content lazy-content="0"/></a>'
+        assert store[0] == "<Content a='b'>2</Content>"
+
+    def test_unterminated_content_fails_to_parse(self):
+        with pytest.raises(ET.ParseError):
+            Gesetzbuch.from_xml(TRICKY_LAW_XML.replace("</Content>  nach", "  nach"), lazy=True)
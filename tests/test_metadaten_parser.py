@@ -0,0 +1,99 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from germanlegaltexts.model.Gesetzbuch import Fundstelle, Gesetzbuch, Metadaten, Standangabe
+from germanlegaltexts.model.Interning import intern_value
+
+from test_lazy_gesetzbuch import TRICKY_LAW_XML
+from test_serialization import RICH_LAW_XML
+
+
+def legacy_metadaten(metadaten_elem: ET.Element) -> Metadaten:
+    """The find()-based metadata extraction that Metadaten.from_element replaced."""
+    metadaten = Metadaten(jurabk=intern_value(metadaten_elem.findtext('jurabk') or ""))
+    if metadaten_elem.find('amtabk') is not None:
+        metadaten.amtabk = intern_value(metadaten_elem.findtext('amtabk'))
+
+    if metadaten_elem.find('ausfertigung-datum') is not None:
+        metadaten.ausfertigung_datum = metadaten_elem.findtext('ausfertigung-datum')
+
+    if metadaten_elem.find('kurzue') is not None:
+        metadaten.kurzue = metadaten_elem.findtext('kurzue')
+
+    if metadaten_elem.find('langue') is not None:
+        metadaten.langue = metadaten_elem.findtext('langue')
+
+    if metadaten_elem.find('enbez') is not None:
+        metadaten.enbez = metadaten_elem.findtext('enbez')
+
+    if metadaten_elem.find('titel') is not None:
+        metadaten.titel = metadaten_elem.findtext('titel')
+        titel_elem = metadaten_elem.find('titel')
+        if titel_elem is not None and 'format' in titel_elem.attrib:
+            metadaten.titel_format = intern_value(titel_elem.get('format'))
+
+    fundstelle_elem = metadaten_elem.find('fundstelle')
+    if fundstelle_elem is not None:
+        fundstelle = Fundstelle(
+            typ=intern_value(fundstelle_elem.get('typ', "")),
+            periodikum=intern_value(fundstelle_elem.findtext('periodikum')),
+            zitstelle=fundstelle_elem.findtext('zitstelle')
+        )
+        metadaten.fundstelle = fundstelle
+
+    standangabe_elem = metadaten_elem.find('standangabe')
+    if standangabe_elem is not None:
+        standangabe = Standangabe(
+            checked=intern_value(standangabe_elem.get('checked', "")),
+            standtyp=intern_value(standangabe_elem.findtext('standtyp') or ""),
+            standkommentar=standangabe_elem.findtext('standkommentar')
+        )
+        metadaten.standangabe = standangabe
+    gliederungseinheit_elem = metadaten_elem.find('gliederungseinheit')
+    if gliederungseinheit_elem is not None:
+        gliederungseinheit = {}
+        for child in gliederungseinheit_elem:
+            gliederungseinheit[intern_value(child.tag)] = child.text
+        metadaten.gliederungseinheit = gliederungseinheit
+    return metadaten
+
+
+EDGE_CASES = [
+    "<metadaten/>",
+    "<metadaten><jurabk/><amtabk/><enbez/><titel/><kurzue/><langue/><ausfertigung-datum/></metadaten>",
+    "<metadaten><jurabk>A</jurabk><jurabk>B</jurabk><enbez>§ 1</enbez><enbez>§ 2</enbez></metadaten>",
+    '<metadaten><titel format="parat">Eins<BR/>weiter</titel><titel format="XML">Zwei</titel></metadaten>',
+    "<metadaten><titel>Ohne Format</titel></metadaten>",
+    '<metadaten><fundstelle typ="amtlich"><periodikum>BGBl I</periodikum><zitstelle>1</zitstelle></fundstelle>'
+    '<fundstelle typ="nichtamtlich"><periodikum>X</periodikum></fundstelle></metadaten>',
+    "<metadaten><fundstelle><zitstelle/></fundstelle></metadaten>",
+    '<metadaten><standangabe checked="ja"><standtyp>Stand</standtyp></standangabe>'
+    '<standangabe checked="nein"><standtyp>Hinweis</standtyp><standkommentar>k</standkommentar></standangabe></metadaten>',
+    "<metadaten><standangabe/></metadaten>",
+    "<metadaten><gliederungseinheit><gliederungskennzahl>010</gliederungskennzahl>"
+    "<gliederungsbez>Buch 1</gliederungsbez><gliederungsbez>doppelt</gliederungsbez><gliederungstitel/>"
+    "</gliederungseinheit><gliederungseinheit><gliederungsbez>zweite</gliederungsbez></gliederungseinheit></metadaten>",
+    "<metadaten><unbekannt>x</unbekannt><jurabk>TestG</jurabk><enbez>Art 1</enbez></metadaten>",
+]
+
+
+@pytest.mark.parametrize("xml", EDGE_CASES)
+def test_matches_find_based_parser(xml):
+    element = ET.fromstring(xml)
+
+    assert Metadaten.from_element(element) == legacy_metadaten(element)
+
+
+@pytest.mark.parametrize("xml", [RICH_LAW_XML, TRICKY_LAW_XML])
+def test_law_book_metadata_matches(xml):
+    for element in ET.fromstring(xml).iter('metadaten'):
+        assert Metadaten.from_element(element) == legacy_metadaten(element)
+
+
+def test_corpus_metadata_matches(all_xml_contents):
+    for name, content in all_xml_contents.items():
+        gesetz = Gesetzbuch.from_xml(content)
+        elements = [norm.find('metadaten') for norm in ET.fromstring(content).findall('norm')]
+        expected = [legacy_metadaten(element) for element in elements if element is not None]
+        assert [norm.metadaten for norm in gesetz.norms] == expected, name
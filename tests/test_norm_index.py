@@ -0,0 +1,192 @@
+import copy
+import pickle
+from dataclasses import asdict
+
+import pytest
+
+from germanlegaltexts.ParsedCache import ParsedCache
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch, Metadaten, Norm, Textdaten
+from germanlegaltexts.model.NormIndex import NormList, normalize_enbez
+
+LAW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="20240101" doknr="BJNR0001">
+  <norm builddate="20240101" doknr="BJNR0001"><metadaten><jurabk>TestG</jurabk></metadaten></norm>
+  <norm builddate="20240101" doknr="BJNR0002">
+    <metadaten>
+      <jurabk>TestG</jurabk>
+      <gliederungseinheit><gliederungsbez>Abschnitt 1</gliederungsbez><gliederungstitel>Allgemeines</gliederungstitel></gliederungseinheit>
+    </metadaten>
+  </norm>
+  <norm builddate="20240101" doknr="BJNR0003">
+    <metadaten><jurabk>TestG</jurabk><enbez>§ 1</enbez>
+      <gliederungseinheit><gliederungsbez>Abschnitt 1</gliederungsbez></gliederungseinheit></metadaten>
+  </norm>
+  <norm builddate="20240101" doknr="BJNR0004"><metadaten><jurabk>TestG</jurabk><enbez>§ 242</enbez></metadaten></norm>
+  <norm builddate="20240101" doknr="BJNR0005"><metadaten><jurabk>TestG</jurabk><enbez>Art 1</enbez></metadaten></norm>
+</dokumente>"""
+
+
+def make_norm(doknr: str, enbez: str) -> Norm:
+    return Norm("20240101", doknr, Metadaten(jurabk="TestG", enbez=enbez), Textdaten())
+
+
+@pytest.fixture
+def gesetz():
+    return Gesetzbuch.from_xml(LAW_XML)
+
+
+@pytest.mark.parametrize("variant, expected", [
+    ("§242", "§ 242"),
+    ("§  242", "§ 242"),
+    (" § 242a ", "§ 242a"),
+    ("Art. 1", "art 1"),
+    ("Artikel 1", "art 1"),
+    ("Art.1", "art 1"),
+    ("Artenschutz", "artenschutz"),
+    ("Anlage 1", "anlage 1"),
+])
+def test_normalize_enbez(variant, expected):
+    assert normalize_enbez(variant) == normalize_enbez(expected)
+
+
+class TestLookups:
+    @pytest.mark.parametrize("variant", ["§ 242", "§242", "§  242"])
+    def test_get_paragraph_variants(self, gesetz, variant):
+        assert gesetz.get_paragraph(variant).doknr == "BJNR0004"
+
+    @pytest.mark.parametrize("variant", ["Art 1", "Art. 1", "Artikel 1"])
+    def test_get_article_variants(self, gesetz, variant):
+        assert gesetz.get_paragraph(variant).doknr == "BJNR0005"
+
+    def test_get_norm(self, gesetz):
+        assert gesetz.get_norm("BJNR0003").metadaten.enbez == "§ 1"
+        assert gesetz.get_norm("missing") is None
+
+    def test_section_and_lists(self, gesetz):
+        assert [norm.doknr for norm in gesetz.get_section("Abschnitt 1")] == ["BJNR0002", "BJNR0003"]
+        assert gesetz.get_section("Abschnitt 9") == []
+        assert gesetz.get_all_paragraphs() == ["§ 1", "§ 242"]
+        assert gesetz.get_all_sections() == ["Allgemeines"]
+
+    def test_first_duplicate_wins(self, gesetz):
+        gesetz.norms.append(make_norm("BJNR0099", "§ 1"))
+
+        assert gesetz.get_paragraph("§ 1").doknr == "BJNR0003"
+
+    def test_returned_lists_are_copies(self, gesetz):
+        gesetz.get_all_paragraphs().append("§ 999")
+        gesetz.get_section("Abschnitt 1").clear()
+
+        assert gesetz.get_all_paragraphs() == ["§ 1", "§ 242"]
+        assert len(gesetz.get_section("Abschnitt 1")) == 2
+
+
+class TestInvalidation:
+    def test_index_is_reused(self, gesetz):
+        assert gesetz._index() is gesetz._index()
+
+    @pytest.mark.parametrize("mutate", [
+        lambda norms: norms.append(make_norm("BJNR0100", "§ 5")),
+        lambda norms: norms.insert(0, make_norm("BJNR0100", "§ 5")),
+        lambda norms: norms.extend([make_norm("BJNR0100", "§ 5")]),
+        lambda norms: norms.__setitem__(0, make_norm("BJNR0100", "§ 5")),
+        lambda norms: norms.__iadd__([make_norm("BJNR0100", "§ 5")]),
+    ])
+    def test_added_norm_is_found(self, gesetz, mutate):
+        assert gesetz.get_paragraph("§ 5") is None
+        mutate(gesetz.norms)
+
+        assert gesetz.get_paragraph("§ 5").doknr == "BJNR0100"
+
+    @pytest.mark.parametrize("mutate", [
+        lambda norms: norms.pop(3),
+        lambda norms: norms.__delitem__(slice(3, 4)),
+        lambda norms: norms.remove(norms[3]),
+        lambda norms: norms.clear(),
+    ])
+    def test_removed_norm_is_gone(self, gesetz, mutate):
+        assert gesetz.get_paragraph("§ 242") is not None
+        mutate(gesetz.norms)
+
+        assert gesetz.get_paragraph("§ 242") is None
+
+    def test_reassigned_norms(self, gesetz):
+        gesetz.get_paragraph("§ 1")
+        gesetz.norms = [make_norm("BJNR0100", "§ 5")]
+
+        assert gesetz.get_paragraph("§ 1") is None
+        assert gesetz.get_norm("BJNR0100") is not None
+
+    def test_invalidate_after_in_place_edit(self, gesetz):
+        gesetz.get_paragraph("§ 1").metadaten.enbez = "§ 1a"
+        gesetz.invalidate_index()
+
+        assert gesetz.get_paragraph("§ 1a").doknr == "BJNR0003"
+
+
+class TestNormList:
+    def test_from_xml_returns_norm_list(self, gesetz):
+        assert isinstance(gesetz.norms, NormList)
+
+    def test_replaced_norm_is_found(self, gesetz):
+        gesetz.get_paragraph("§ 1")
+        gesetz.norms[3] = make_norm("BJNR0100", "§ 5")
+
+        assert gesetz.get_paragraph("§ 242") is None
+        assert gesetz.get_paragraph("§ 5").doknr == "BJNR0100"
+
+    def test_plain_list_is_kept(self):
+        norms = [make_norm("BJNR0001", "§ 1")]
+        gesetz = Gesetzbuch("20240101", "BJNR0001", norms)
+
+        assert gesetz.norms is norms
+        assert gesetz.get_paragraph("§1") is not None
+
+        norms.append(make_norm("BJNR0002", "§ 2"))
+        assert gesetz.norms[-1].doknr == "BJNR0002"
+        assert gesetz.get_paragraph("§ 2").doknr == "BJNR0002"
+
+    def test_plain_list_item_replaced_needs_invalidate(self):
+        norms = [make_norm("BJNR0001", "§ 1")]
+        gesetz = Gesetzbuch("20240101", "BJNR0001", norms)
+        gesetz.get_paragraph("§ 1")
+        norms[0] = make_norm("BJNR0002", "§ 2")
+        gesetz.invalidate_index()
+
+        assert gesetz.get_paragraph("§ 1") is None
+        assert gesetz.get_paragraph("§ 2").doknr == "BJNR0002"
+
+    def test_copies_and_codecs_keep_working(self, gesetz):
+        gesetz.get_paragraph("§ 1")
+        clone = pickle.loads(pickle.dumps(gesetz))
+
+        assert clone == gesetz == copy.deepcopy(gesetz)
+        assert getattr(clone, '_norm_index', None) is None
+        assert copy.copy(gesetz).norms is gesetz.norms
+        assert clone.get_paragraph("§ 242").doknr == "BJNR0004"
+        assert gesetz.to_dict() == asdict(gesetz)
+        assert Gesetzbuch.from_tuple(gesetz.to_tuple()).get_paragraph("Art. 1").doknr == "BJNR0005"
+
+    @pytest.mark.parametrize("decode", [
+        lambda gesetz: Gesetzbuch.from_dict(gesetz.to_dict()),
+        lambda gesetz: Gesetzbuch.from_tuple(gesetz.to_tuple()),
+        lambda gesetz: pickle.loads(pickle.dumps(gesetz)),
+    ])
+    def test_decoded_norms_notice_replaced_items(self, gesetz, decode):
+        decoded = decode(gesetz)
+        decoded.get_paragraph("§ 1")
+        decoded.norms[3] = make_norm("BJNR0100", "§ 999")
+
+        assert isinstance(decoded.norms, NormList)
+        assert decoded.get_all_paragraphs() == ["§ 1", "§ 999"]
+        assert decoded.get_paragraph("§ 999").doknr == "BJNR0100"
+
+    def test_cache_loaded_norms_notice_replaced_items(self, gesetz, tmp_path):
+        cache = ParsedCache(tmp_path)
+        cache.store(gesetz.doknr, gesetz.builddate, gesetz)
+        loaded = cache.load(gesetz.doknr, gesetz.builddate)
+        loaded.get_paragraph("§ 1")
+        loaded.norms[3] = make_norm("BJNR0100", "§ 999")
+
+        assert loaded.get_paragraph("§ 242") is None
+        assert loaded.get_paragraph("§ 999").doknr == "BJNR0100"
@@ -0,0 +1,146 @@
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+from germanlegaltexts.RateLimiter import RateLimiter
+
+from test_async_downloaders import make_zip
+
+REAL_CLIENT = httpx.Client
+N_ITEMS = 12
+
+
+def judgement_xml(i: int) -> str:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<dokument><doknr>JURE{i:06d}</doknr><gertyp>BGH</gertyp><entsch-datum>20230115</entsch-datum>
+<aktenzeichen>IX ZB {i}/23</aktenzeichen><doktyp>Beschluss</doktyp></dokument>"""
+
+
+def law_xml(i: int) -> str:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="1" doknr="LAW{i}"><norm builddate="1" doknr="LAW{i}">
+<metadaten><jurabk>G{i}</jurabk><enbez>§ 1</enbez></metadaten><textdaten/></norm></dokumente>"""
+
+
+class Server:
+    """Answers TOC and archive requests; earlier items respond more slowly."""
+
+    def __init__(self, failing: set[int] = frozenset()):
+        self.failing = failing
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == '/rii-toc.xml':
+            items = "".join(f"<item><gericht>BGH</gericht><entsch-datum>2023</entsch-datum>"
+                            f"<aktenzeichen>IX ZB {i}/23</aktenzeichen>"
+                            f"<link>http://example.com/j{i}.zip</link></item>" for i in range(N_ITEMS))
+            return httpx.Response(200, text=f"<items>{items}</items>")
+        if path == '/gii-toc.xml':
+            items = "".join(f"<item><link>http://example.com/law{i}/xml.zip</link></item>" for i in range(N_ITEMS))
+            return httpx.Response(200, text=f"<items>{items}</items>")
+
+        i = int(''.join(c for c in path if c.isdigit()))
+        with self.lock:
+            self.threads.add(threading.current_thread().name)
+        time.sleep(0.002 * (N_ITEMS - i))
+        if i in self.failing:
+            return httpx.Response(500)
+        return httpx.Response(200, content=make_zip(law_xml(i) if 'law' in path else judgement_xml(i)))
+
+
+def serve(server: Server):
+    clients = []
+
+    def client(**kwargs):
+        clients.append(REAL_CLIENT(transport=httpx.MockTransport(server), **kwargs))
+        return clients[-1]
+
+    return clients, patch('httpx.Client', side_effect=client)
+
+
+class TestWorkers:
+    def test_judgements_are_returned_in_index_order(self):
+        server = Server()
+        clients, client_patch = serve(server)
+
+        with client_patch:
+            judgements = GermanJudgementDownloader().download_all_judgements(workers=4)
+
+        assert [j.aktenzeichen for j in judgements] == [f"IX ZB {i}/23" for i in range(N_ITEMS)]
+        assert len(server.threads) > 1
+        # One pooled client for the index and all workers, closed afterwards
+        assert len(clients) == 1 and clients[0].is_closed
+
+    def test_failed_downloads_are_skipped(self):
+        clients, client_patch = serve(Server(failing={3, 7}))
+
+        with client_patch:
+            law_books = GermanLawDownloader().download_all_law_books(workers=3)
+
+        assert [book.doknr for book in law_books] == [f"LAW{i}" for i in range(N_ITEMS) if i not in (3, 7)]
+
+    def test_first_n_judgements(self):
+        server = Server()
+        clients, client_patch = serve(server)
+
+        with client_patch:
+            judgements = GermanJudgementDownloader().download_first_n_judgements(5, workers=8)
+
+        assert [j.aktenzeichen for j in judgements] == [f"IX ZB {i}/23" for i in range(5)]
+
+    def test_open_session_is_reused(self):
+        clients, client_patch = serve(Server())
+
+        with client_patch, GermanJudgementDownloader() as downloader:
+            downloader.download_first_n_judgements(2, workers=2)
+            downloader.download_first_n_judgements(2, workers=2)
+            assert not clients[0].is_closed
+
+        assert len(clients) == 1
+
+    def test_shared_rate_limit(self):
+        clients, client_patch = serve(Server())
+
+        start = time.monotonic()
+        with client_patch:
+            GermanJudgementDownloader().download_first_n_judgements(6, workers=6, max_per_second=50)
+
+        # Six starts at 50/s take at least five intervals, however many threads there are
+        assert time.monotonic() - start >= 5 / 50
+
+    def test_invalid_workers_raises(self):
+        clients, client_patch = serve(Server())
+
+        with client_patch, pytest.raises(ValueError, match="workers must be at least 1"):
+            GermanJudgementDownloader().download_first_n_judgements(2, workers=0)
+
+
+class TestRateLimiter:
+    def test_spaces_out_acquisitions_across_threads(self):
+        limiter = RateLimiter(100)
+        times = []
+        lock = threading.Lock()
+
+        def acquire():
+            limiter.acquire()
+            with lock:
+                times.append(time.monotonic())
+
+        threads = [threading.Thread(target=acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(times) - min(times) >= 4 / 100 * 0.9
+
+    def test_invalid_rate_raises(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
@@ -0,0 +1,159 @@
+import io
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+from germanlegaltexts.ParsedCache import ParsedCache, root_cache_key
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch
+from germanlegaltexts.model.Rechtsprechung import Rechtsprechung
+from germanlegaltexts.model.Serializable import schema_fingerprint
+from germanlegaltexts.model.XmlSource import peek_root_attributes
+
+from test_async_downloaders import JUDGEMENT_XML, LAW_XML, make_mock_client, make_zip
+
+URL = "https://example.com/law/xml.zip"
+
+
+class TestPeekRootAttributes:
+    @pytest.mark.parametrize('source', [LAW_XML, LAW_XML.encode('utf-8'), io.BytesIO(LAW_XML.encode('utf-8'))])
+    def test_reads_the_root_start_tag(self, source):
+        assert peek_root_attributes(source) == {'builddate': "2023-01-01", 'doknr': "TEST001"}
+
+    def test_stops_after_the_start_tag(self):
+        body = LAW_XML.encode('utf-8') + b"<norm/>" * 100_000
+        source = io.BytesIO(body)
+
+        peek_root_attributes(source, chunk_size=1024)
+
+        assert source.tell() == 1024
+
+    def test_law_key_needs_doknr_and_builddate(self):
+        assert root_cache_key(LAW_XML) == ("TEST001", "2023-01-01")
+        assert root_cache_key(JUDGEMENT_XML) is None
+
+
+class TestParsedCache:
+    def test_hit_requires_same_stamp_and_version(self, tmp_path):
+        ParsedCache(tmp_path, version="1").store("BJNR1", "2023-01-01", {"parsed": True})
+
+        assert ParsedCache(tmp_path, version="1").load("BJNR1", "2023-01-01") == {"parsed": True}
+        assert ParsedCache(tmp_path, version="1").load("BJNR1", "2024-01-01") is None
+        assert ParsedCache(tmp_path, version="2").load("BJNR1", "2023-01-01") is None
+
+    def test_hit_requires_same_model_schema(self, tmp_path):
+        ParsedCache(tmp_path, version="1").store("BJNR1", "2023-01-01", {"parsed": True})
+        changed = ParsedCache(tmp_path, version="1")
+        changed.schema = "other"
+
+        assert changed.load("BJNR1", "2023-01-01") is None
+
+    def test_newer_stamp_replaces_stale_entry(self, tmp_path):
+        cache = ParsedCache(tmp_path)
+        cache.store("BJNR1", "old", "old book")
+        cache.store("BJNR1", "new", "new book")
+
+        assert cache.load("BJNR1", "new") == "new book"
+        assert len(list(tmp_path.rglob('*.pickle'))) == 1
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = ParsedCache(tmp_path)
+        cache.store("BJNR1", "2023-01-01", "book")
+        for path in tmp_path.rglob('*.pickle'):
+            path.write_bytes(b"garbage")
+
+        assert cache.load("BJNR1", "2023-01-01") is None
+
+    def test_parse_keys_law_books_by_root_attributes(self, tmp_path):
+        cache = ParsedCache(tmp_path)
+        parse = MagicMock(wraps=Gesetzbuch.from_xml)
+
+        first = cache.parse(parse, LAW_XML)
+        second = cache.parse(parse, LAW_XML)
+
+        assert parse.call_count == 1
+        assert second == first
+
+    def test_parse_file_like_source(self, tmp_path):
+        cache = ParsedCache(tmp_path)
+
+        first = cache.parse(Gesetzbuch.from_xml, io.BytesIO(LAW_XML.encode('utf-8')))
+        second = cache.parse(Gesetzbuch.from_xml, io.BytesIO(LAW_XML.encode('utf-8')))
+
+        assert first.doknr == "TEST001"
+        assert second == first
+
+    def test_parse_unseekable_file_like_source(self, tmp_path):
+        class Unseekable(io.RawIOBase):
+            def __init__(self, data: bytes):
+                self._data = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                return self._data.readinto(buffer)
+
+        book = ParsedCache(tmp_path).parse(Gesetzbuch.from_xml, Unseekable(LAW_XML.encode('utf-8')))
+
+        assert book.doknr == "TEST001"
+
+    def test_parse_without_key_is_not_cached(self, tmp_path):
+        cache = ParsedCache(tmp_path)
+
+        cache.parse(Rechtsprechung.from_xml, JUDGEMENT_XML)
+
+        assert list(tmp_path.rglob('*.pickle')) == []
+
+
+def model_tree(leaf_has_number: bool) -> type:
+    @dataclass
+    class Leaf:
+        text: str
+        if leaf_has_number:
+            number: int = 0
+
+    @dataclass
+    class Root:
+        leaves: list[Leaf] = field(default_factory=list)
+
+    return Root
+
+
+class TestSchemaFingerprint:
+    def test_changes_with_nested_fields(self):
+        assert schema_fingerprint(model_tree(False)) == schema_fingerprint(model_tree(False))
+        assert schema_fingerprint(model_tree(False)) != schema_fingerprint(model_tree(True))
+
+    def test_is_stable(self):
+        assert schema_fingerprint(Gesetzbuch, Rechtsprechung) == schema_fingerprint(Gesetzbuch, Rechtsprechung)
+
+
+class TestDownloadersUseTheCache:
+    async def test_unchanged_law_book_is_not_parsed_again(self, tmp_path):
+        downloader = GermanLawDownloader(parsed_cache=ParsedCache(tmp_path))
+        archive = make_zip(LAW_XML)
+
+        with patch.object(Gesetzbuch, 'from_xml', wraps=Gesetzbuch.from_xml) as parse:
+            for _ in range(2):
+                with patch('httpx.AsyncClient', return_value=make_mock_client(
+                        MagicMock(status_code=200, content=archive, headers={}))):
+                    books = [b async for b in downloader.iter_law_books([URL], max_per_second=None)]
+                assert books[0].doknr == "TEST001"
+
+        assert parse.call_count == 1
+
+    def test_judgements_are_keyed_by_link_and_modified(self, tmp_path):
+        downloader = GermanJudgementDownloader(parsed_cache=ParsedCache(tmp_path))
+        response = httpx.Response(200, content=make_zip(JUDGEMENT_XML), request=httpx.Request('GET', URL))
+
+        with patch('httpx.get', return_value=response), \
+             patch.object(Rechtsprechung, 'from_xml', wraps=Rechtsprechung.from_xml) as parse:
+            downloader.download_judgement(URL, modified="2023-02-01")
+            downloader.download_judgement(URL, modified="2023-02-01")
+            assert parse.call_count == 1
+            downloader.download_judgement(URL, modified="2023-03-01")
+            assert parse.call_count == 2
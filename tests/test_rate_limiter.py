@@ -0,0 +1,174 @@
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+from germanlegaltexts.RateLimiter import RateLimiter, parse_retry_after
+
+from test_async_downloaders import JUDGEMENT_TOC_XML, JUDGEMENT_XML, LAW_TOC_XML, LAW_XML, make_mock_client, make_zip
+
+
+class TestTokenBucket:
+    def test_burst_starts_immediately(self):
+        limiter = RateLimiter(1, burst=3)
+
+        assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter._reserve() == pytest.approx(1.0, abs=0.01)
+
+    def test_reservations_queue_without_drift(self):
+        limiter = RateLimiter(10)
+
+        delays = [limiter._reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3], abs=0.01)
+
+    def test_acquire_sleeps_until_due(self):
+        limiter = RateLimiter(100)
+
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+
+        assert time.monotonic() - start >= 5 / 100 * 0.9
+
+    async def test_acquire_async_does_not_block_the_loop(self):
+        limiter = RateLimiter(20)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        for _ in range(3):
+            await limiter.acquire_async()
+        task.cancel()
+
+        assert ticks >= 10
+
+    def test_invalid_arguments_raise(self):
+        with pytest.raises(ValueError, match="burst"):
+            RateLimiter(1, burst=0)
+        with pytest.raises(ValueError, match="decrease_factor"):
+            RateLimiter(1, decrease_factor=1.5)
+        with pytest.raises(ValueError, match="min_per_second"):
+            RateLimiter(1, min_per_second=2)
+
+
+class TestAdaptiveRate:
+    def test_pushback_halves_the_rate_once_per_interval(self):
+        limiter = RateLimiter(8)
+
+        limiter.on_response(429)
+        limiter.on_response(503)  # same congestion event
+
+        assert limiter.rate == 4
+
+    def test_successes_regrow_the_rate_up_to_the_maximum(self):
+        limiter = RateLimiter(8, increase_per_second=1)
+        limiter.on_response(500)
+
+        for _ in range(3):
+            limiter.on_response(200)
+        assert limiter.rate == 7
+        for _ in range(3):
+            limiter.on_response(200)
+        assert limiter.rate == 8
+
+    def test_rate_never_drops_below_minimum(self):
+        limiter = RateLimiter(8, min_per_second=3)
+
+        for _ in range(5):
+            limiter._last_decrease = float('-inf')
+            limiter.on_response(429)
+
+        assert limiter.rate == 3
+
+    def test_slow_responses_count_as_pushback(self):
+        limiter = RateLimiter(8, target_latency=1.0)
+
+        limiter.on_response(200, latency=0.2)
+        assert limiter.rate == 8
+        limiter.on_response(200, latency=2.5)
+        assert limiter.rate == 4
+
+    def test_client_errors_leave_the_rate_alone(self):
+        limiter = RateLimiter(8)
+        limiter.on_response(429)
+
+        limiter.on_response(404)
+
+        assert limiter.rate == 4
+
+    def test_retry_after_pauses_all_callers(self):
+        limiter = RateLimiter(10, burst=5)
+
+        limiter.on_response(429, retry_after="2")
+
+        delays = [limiter._reserve() for _ in range(2)]
+        assert delays[0] == pytest.approx(2 + 1 / limiter.rate, abs=0.05)
+        assert delays[1] == pytest.approx(2 + 2 / limiter.rate, abs=0.05)
+
+    def test_not_adaptive_ignores_feedback(self):
+        limiter = RateLimiter(8, adaptive=False)
+
+        limiter.on_response(429, retry_after="60")
+
+        assert limiter.rate == 8
+        assert limiter._reserve() == 0.0
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
+
+    def test_missing_or_malformed(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestSharedLimiter:
+    async def test_downloaders_share_one_bucket_and_its_feedback(self):
+        limiter = RateLimiter(1000, increase_per_second=0)
+        throttled = MagicMock(status_code=429, content=b"", headers={'retry-after': None})
+        j_ok = MagicMock(status_code=200, content=make_zip(JUDGEMENT_XML), headers={})
+        law_ok = MagicMock(status_code=200, content=make_zip(LAW_XML), headers={})
+
+        judgements = GermanJudgementDownloader(rate_limiter=limiter)
+        laws = GermanLawDownloader(rate_limiter=limiter)
+        with patch('httpx.AsyncClient', return_value=make_mock_client(
+                MagicMock(status_code=200, text=JUDGEMENT_TOC_XML, headers={}), j_ok, throttled)):
+            results = [j async for j in judgements.iter_all_judgements(max_per_second=None)]
+        assert len(results) == 1
+        assert limiter.rate == 500
+
+        with patch('httpx.AsyncClient', return_value=make_mock_client(
+                MagicMock(status_code=200, text=LAW_TOC_XML, headers={}), law_ok, law_ok)), \
+             patch.object(limiter, 'acquire_async', wraps=limiter.acquire_async) as acquire:
+            books = [b async for b in laws.iter_all_law_books(max_per_second=None)]
+
+        assert len(books) == 2
+        # max_per_second=None doesn't bypass the downloader's limiter
+        assert acquire.call_count == 2
+
+    def test_sync_workers_use_the_shared_limiter(self):
+        limiter = RateLimiter(1000)
+        downloader = GermanJudgementDownloader(rate_limiter=limiter)
+
+        with patch.object(downloader, 'get_all_judgement_index_items', return_value=[MagicMock(link="x")] * 3), \
+             patch.object(downloader, 'download_judgement', return_value="ok"), \
+             patch.object(limiter, 'acquire', wraps=limiter.acquire) as acquire:
+            assert downloader.download_first_n_judgements(3, workers=2, max_per_second=0.001) == ["ok"] * 3
+
+        assert acquire.call_count == 3
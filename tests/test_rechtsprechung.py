@@ -1,3 +1,6 @@
+import io
+import zipfile
+
 import pytest
 from germanlegaltexts.model.Rechtsprechung import Rechtsprechung, RIIIndexItem
 
@@ -65,3 +68,36 @@ def test_rechtsprechung_metadata(sample_judgement_xml):
     assert rechtsprechung.language == "deutsch"
     assert rechtsprechung.publisher == "BMJV"
     assert rechtsprechung.access_rights == "public"
+
+
+@pytest.mark.parametrize("as_input", [
+    lambda xml: xml.encode('utf-8'),
+    lambda xml: memoryview(xml.encode('utf-8')),
+    lambda xml: io.BytesIO(xml.encode('utf-8')),
+])
+def test_rechtsprechung_from_binary_input(sample_judgement_xml, as_input):
+    """Test that bytes, memoryview and binary file objects parse like str."""
+    expected = Rechtsprechung.from_xml(sample_judgement_xml)
+
+    assert Rechtsprechung.from_xml(as_input(sample_judgement_xml)) == expected
+
+
+def test_rechtsprechung_from_zip_member(sample_judgement_xml):
+    """Test parsing straight from an open zipfile member."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr("JURE100055033.xml", sample_judgement_xml)
+
+    with zipfile.ZipFile(archive) as z, z.open("JURE100055033.xml") as member:
+        rechtsprechung = Rechtsprechung.from_xml(member)
+
+    assert rechtsprechung == Rechtsprechung.from_xml(sample_judgement_xml)
+
+
+def test_rechtsprechung_repeated_metadata_is_interned(sample_judgement_xml):
+    """Test that values repeating across judgements share one string object."""
+    first = Rechtsprechung.from_xml(sample_judgement_xml)
+    second = Rechtsprechung.from_xml(sample_judgement_xml.encode('utf-8'))
+
+    for name in ('gertyp', 'spruchkoerper', 'doktyp', 'language', 'publisher'):
+        assert getattr(first, name) is getattr(second, name), name
@@ -0,0 +1,266 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from germanlegaltexts.DownloadReport import DownloadReport
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+from germanlegaltexts.RetryPolicy import RetryPolicy
+
+from test_async_downloaders import JUDGEMENT_TOC_XML, JUDGEMENT_XML, LAW_XML, make_zip
+
+URL = "https://example.com/law/xml.zip"
+NO_WAIT = RetryPolicy(max_attempts=3, backoff=0)
+
+
+def response(status_code: int, content: bytes = b"", headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(status_code, content=content, headers=headers, request=httpx.Request('GET', URL))
+
+
+class TestRetryPolicy:
+    def test_retries_listed_statuses_until_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.should_retry(1, status_code=503)
+        assert policy.should_retry(2, status_code=429)
+        assert not policy.should_retry(3, status_code=503)
+        assert not policy.should_retry(1, status_code=404)
+        assert not policy.should_retry(1, status_code=200)
+
+    def test_retries_listed_exceptions(self):
+        policy = RetryPolicy()
+
+        assert policy.should_retry(1, error=httpx.ConnectError("refused"))
+        assert policy.should_retry(1, error=httpx.ReadTimeout("slow"))
+        assert not policy.should_retry(1, error=ValueError("bad zip"))
+
+    def test_exponential_backoff_with_full_jitter(self):
+        policy = RetryPolicy(backoff=1.0, max_backoff=5.0)
+
+        for attempt, cap in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+            delays = [policy.delay(attempt) for _ in range(50)]
+            assert all(0 <= d <= cap for d in delays)
+            assert max(delays) > cap / 2
+
+    def test_without_jitter(self):
+        policy = RetryPolicy(backoff=0.5, jitter=False)
+
+        assert [policy.delay(n) for n in (1, 2, 3)] == [0.5, 1.0, 2.0]
+
+    def test_retry_after_takes_precedence(self):
+        assert RetryPolicy(backoff=0.1).delay(1, retry_after=7.0) == 7.0
+
+    def test_invalid_policy_raises(self):
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
+
+
+class TestSyncRetries:
+    def test_transient_failures_are_retried(self):
+        downloader = GermanLawDownloader(retry=NO_WAIT)
+        answers = [response(503), httpx.ConnectError("reset"), response(200, make_zip(LAW_XML))]
+
+        with patch('httpx.get', side_effect=answers) as get:
+            assert downloader.download_law_xml(URL) == LAW_XML
+
+        assert get.call_count == 3
+
+    def test_retry_after_header_is_honoured(self):
+        downloader = GermanLawDownloader(retry=RetryPolicy(backoff=0))
+        answers = [response(429, headers={'Retry-After': '3'}), response(200, make_zip(LAW_XML))]
+
+        with patch('httpx.get', side_effect=answers), patch('time.sleep') as sleep:
+            downloader.download_law_xml(URL)
+
+        sleep.assert_called_once_with(3.0)
+
+    def test_permanent_errors_are_not_retried(self):
+        downloader = GermanLawDownloader(retry=NO_WAIT)
+
+        with patch('httpx.get', return_value=response(404)) as get:
+            with pytest.raises(ValueError, match="HTTP 404"):
+                downloader.download_law_xml(URL)
+
+        assert get.call_count == 1
+
+    def test_gives_up_after_max_attempts(self):
+        downloader = GermanLawDownloader(retry=NO_WAIT)
+
+        with patch('httpx.get', side_effect=httpx.ConnectError("down")) as get:
+            with pytest.raises(ValueError, match="down"):
+                downloader.download_law_xml(URL)
+
+        assert get.call_count == 3
+
+    def test_without_policy_requests_are_tried_once(self):
+        with patch('httpx.get', return_value=response(503)) as get:
+            with pytest.raises(ValueError, match="HTTP 503"):
+                GermanLawDownloader().download_law_xml(URL)
+
+        assert get.call_count == 1
+
+    def test_report_lists_permanently_failed_items(self):
+        downloader = GermanLawDownloader(retry=NO_WAIT)
+        urls = ["https://example.com/a/xml.zip", "https://example.com/b/xml.zip"]
+
+        def get(url, **kwargs):
+            return response(503) if '/b/' in url else response(200, make_zip(LAW_XML))
+
+        report = DownloadReport()
+        with patch.object(downloader, 'get_all_xml_paths', return_value=urls), patch('httpx.get', side_effect=get):
+            books = downloader.download_all_law_books(report=report)
+
+        assert len(books) == 1
+        assert report.succeeded == 1
+        assert report.failed_items == [urls[1]]
+        assert "HTTP 503" in report.failed[0].error
+
+
+def async_client(get):
+    client = AsyncMock()
+    client.get = get
+    client.stream = MagicMock(side_effect=AssertionError("unexpected stream"))
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=client)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return context
+
+
+class TestAsyncRetries:
+    async def test_failed_items_can_be_retried_in_a_follow_up_run(self):
+        toc = JUDGEMENT_TOC_XML.encode('utf-8')
+        healthy = False
+
+        async def get(url, **kwargs):
+            if url.endswith('j2.zip') and not healthy:
+                return response(500)
+            return response(200, make_zip(JUDGEMENT_XML))
+
+        downloader = GermanJudgementDownloader(retry=NO_WAIT)
+        items = [item for item in _index_items(downloader, toc)]
+        report = DownloadReport()
+        with patch('httpx.AsyncClient', return_value=async_client(get)):
+            first = [j async for j in downloader.iter_judgements(items, max_per_second=None, report=report)]
+        assert len(first) == 1
+        assert [item.link for item in report.failed_items] == ["https://example.com/j2.zip"]
+
+        healthy = True
+        retry_report = DownloadReport()
+        with patch('httpx.AsyncClient', return_value=async_client(get)):
+            second = [j async for j in downloader.iter_judgements(report.failed_items, max_per_second=None,
+                                                                  report=retry_report)]
+        assert len(second) == 1
+        assert retry_report.succeeded == 1 and retry_report.failed == []
+
+    async def test_transient_failure_is_retried(self):
+        answers = [httpx.ReadTimeout("slow"), response(502), response(200, make_zip(LAW_XML))]
+
+        async def get(url, **kwargs):
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        downloader = GermanLawDownloader(retry=NO_WAIT)
+        report = DownloadReport()
+        with patch('httpx.AsyncClient', return_value=async_client(get)):
+            books = [b async for b in downloader.iter_law_books([URL], max_per_second=None, report=report)]
+
+        assert len(books) == 1
+        assert answers == []
+        assert report.succeeded == 1
+
+    async def test_spooled_download_retries_a_broken_stream(self):
+        body = make_zip(LAW_XML)
+        attempts = []
+
+        def stream(method, url, **kwargs):
+            attempts.append(url)
+            broken = len(attempts) == 1
+
+            async def aiter_bytes():
+                yield body[:10]
+                if broken:
+                    raise httpx.ReadError("connection reset")
+                yield body[10:]
+
+            streamed = MagicMock(status_code=200, headers={})
+            streamed.aiter_bytes = aiter_bytes
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=streamed)
+            context.__aexit__ = AsyncMock(return_value=None)
+            return context
+
+        context = async_client(AsyncMock())
+        context.__aenter__.return_value.stream = MagicMock(side_effect=stream)
+        downloader = GermanLawDownloader(retry=NO_WAIT, spool_threshold=1024)
+        with patch('httpx.AsyncClient', return_value=context):
+            books = [b async for b in downloader.iter_law_books([URL], max_per_second=None)]
+
+        assert len(books) == 1
+        assert len(attempts) == 2
+
+
+def toc_stream(body: bytes, status_code: int = 200, fail_after: int | None = None):
+    """A streamed TOC response, as a context manager for both the sync and the async client."""
+    def iter_bytes():
+        for i in range(0, len(body), 16):
+            if fail_after is not None and i >= fail_after:
+                raise httpx.ReadError("connection reset")
+            yield body[i:i + 16]
+
+    async def aiter_bytes():
+        for chunk in iter_bytes():
+            yield chunk
+
+    streamed = MagicMock(status_code=status_code, headers={})
+    streamed.iter_bytes = iter_bytes
+    streamed.aiter_bytes = aiter_bytes
+    context = MagicMock()
+    context.__enter__.return_value = streamed
+    context.__aenter__ = AsyncMock(return_value=streamed)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return context
+
+
+class TestTocRetries:
+    def test_unavailable_index_is_retried(self):
+        toc = JUDGEMENT_TOC_XML.encode('utf-8')
+        answers = [toc_stream(b"", 503), toc_stream(toc, fail_after=16), toc_stream(toc)]
+        downloader = GermanJudgementDownloader(retry=NO_WAIT)
+
+        with patch('httpx.stream', side_effect=lambda *args, **kwargs: answers.pop(0)):
+            items = list(downloader.iter_judgement_index_items())
+
+        assert len(items) == 2
+        assert answers == []
+
+    def test_failure_after_the_first_item_is_not_retried(self):
+        toc = JUDGEMENT_TOC_XML.encode('utf-8')
+        fail_after = toc.index(b"</item>") + 16
+        downloader = GermanJudgementDownloader(retry=NO_WAIT)
+
+        with patch('httpx.stream', return_value=toc_stream(toc, fail_after=fail_after)) as stream:
+            with pytest.raises(ValueError, match="connection reset"):
+                list(downloader.iter_judgement_index_items())
+
+        assert stream.call_count == 1
+
+    async def test_async_index_is_retried(self):
+        toc = JUDGEMENT_TOC_XML.encode('utf-8')
+        answers = [toc_stream(b"", 503), toc_stream(toc)]
+        context = async_client(AsyncMock(return_value=response(200, make_zip(JUDGEMENT_XML))))
+        context.__aenter__.return_value.stream = MagicMock(side_effect=lambda *args, **kwargs: answers.pop(0))
+
+        downloader = GermanJudgementDownloader(retry=NO_WAIT)
+        with patch('httpx.AsyncClient', return_value=context):
+            judgements = [j async for j in downloader.iter_all_judgements(max_per_second=None)]
+
+        assert len(judgements) == 2
+        assert answers == []
+
+
+def _index_items(downloader: GermanJudgementDownloader, toc: bytes):
+    with patch('httpx.get', return_value=response(200, toc)):
+        return downloader.get_all_judgement_index_items()
@@ -0,0 +1,112 @@
+import pickle
+from dataclasses import asdict, dataclass, field
+
+import pytest
+
+from germanlegaltexts.model.Gesetzbuch import Gesetzbuch, Metadaten, Norm, Textdaten
+from germanlegaltexts.model.Normverweis import Normverweis
+from germanlegaltexts.model.Rechtsprechung import Rechtsprechung, RIIIndexItem
+from germanlegaltexts.model.Serializable import serializable
+
+RICH_LAW_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<dokumente builddate="20240101" doknr="BJNR0001">
+  <norm builddate="20240101" doknr="BJNR0001">
+    <metadaten>
+      <jurabk>TestG</jurabk>
+      <amtabk>TG</amtabk>
+      <ausfertigung-datum>2000-01-01</ausfertigung-datum>
+      <fundstelle typ="amtlich"><periodikum>BGBl I</periodikum><zitstelle>2000, 1</zitstelle></fundstelle>
+      <langue>Testgesetz</langue>
+      <standangabe checked="ja"><standtyp>Stand</standtyp><standkommentar>zuletzt geändert</standkommentar></standangabe>
+    </metadaten>
+    <textdaten><fussnoten><Content><P>Fußnote</P></Content></fussnoten></textdaten>
+  </norm>
+  <norm builddate="20240101" doknr="BJNR0002">
+    <metadaten>
+      <jurabk>TestG</jurabk>
+      <gliederungseinheit><gliederungskennzahl>010</gliederungskennzahl><gliederungsbez>Abschnitt 1</gliederungsbez></gliederungseinheit>
+    </metadaten>
+  </norm>
+  <norm builddate="20240101" doknr="BJNR0003">
+    <metadaten><jurabk>TestG</jurabk><enbez>§ 1</enbez><titel format="parat">Zweck</titel></metadaten>
+    <textdaten><text format="XML"><Content><P>(1) Text.</P></Content></text></textdaten>
+  </norm>
+</dokumente>"""
+
+
+@pytest.fixture
+def gesetzbuch():
+    return Gesetzbuch.from_xml(RICH_LAW_XML)
+
+
+class TestGesetzbuchCodecs:
+    def test_dict_round_trip(self, gesetzbuch):
+        assert Gesetzbuch.from_dict(gesetzbuch.to_dict()) == gesetzbuch
+
+    def test_tuple_round_trip(self, gesetzbuch):
+        assert Gesetzbuch.from_tuple(gesetzbuch.to_tuple()) == gesetzbuch
+
+    def test_dict_matches_asdict(self, gesetzbuch):
+        assert gesetzbuch.to_dict() == asdict(gesetzbuch)
+
+    def test_round_trip_survives_pickle(self, gesetzbuch):
+        assert Gesetzbuch.from_tuple(pickle.loads(pickle.dumps(gesetzbuch.to_tuple()))) == gesetzbuch
+
+    def test_output_does_not_share_mutable_state(self, gesetzbuch):
+        data = gesetzbuch.to_dict()
+        data['norms'][1]['metadaten']['gliederungseinheit']['gliederungsbez'] = "changed"
+
+        assert gesetzbuch.norms[1].metadaten.gliederungseinheit['gliederungsbez'] == "Abschnitt 1"
+
+    def test_from_dict_fills_in_defaults(self):
+        norm = Norm.from_dict({'builddate': "1", 'doknr': "2", 'metadaten': {'jurabk': "G"}, 'textdaten': {}})
+
+        assert norm == Norm("1", "2", Metadaten(jurabk="G"), Textdaten())
+        assert Gesetzbuch.from_dict({'builddate': "1", 'doknr': "2"}).norms == []
+
+    def test_corpus_round_trip(self, all_xml_contents):
+        for name, content in all_xml_contents.items():
+            gesetz = Gesetzbuch.from_xml(content)
+            assert Gesetzbuch.from_tuple(gesetz.to_tuple()) == gesetz, name
+            assert Gesetzbuch.from_dict(gesetz.to_dict()) == gesetz, name
+
+
+class TestRechtsprechungCodecs:
+    def test_round_trips(self, sample_judgement_xml):
+        judgement = Rechtsprechung.from_xml(sample_judgement_xml)
+
+        assert Rechtsprechung.from_dict(judgement.to_dict()) == judgement
+        assert Rechtsprechung.from_tuple(judgement.to_tuple()) == judgement
+        assert judgement.to_dict() == asdict(judgement)
+
+    def test_index_item(self):
+        item = RIIIndexItem("BGH", "20100114", "IX ZB 72/08", "https://example.com/j.zip", "2023-01-01")
+
+        assert RIIIndexItem.from_dict(item.to_dict()) == item
+        assert item.to_tuple() == ("BGH", "20100114", "IX ZB 72/08", "https://example.com/j.zip", "2023-01-01")
+
+
+def test_normverweis_round_trips():
+    verweis = Normverweis.from_string("§ 4 Nr 16 Buchst b UStG 1999")
+
+    assert Normverweis.from_dict(verweis.to_dict()) == verweis
+    assert Normverweis.from_tuple(verweis.to_tuple()) == verweis
+
+
+def test_fields_outside_init_are_not_serialized():
+    @serializable
+    @dataclass
+    class Unit:
+        bez: str
+        children: list[str] = field(default_factory=list)
+        _lookup: dict[str, str] = field(default_factory=dict, init=False, compare=False)
+
+        def __post_init__(self):
+            self._lookup = {child: child for child in self.children}
+
+    unit = Unit("Teil 1", ["a"])
+
+    assert unit.to_dict() == {'bez': "Teil 1", 'children': ["a"]}
+    assert unit.to_tuple() == ("Teil 1", ["a"])
+    assert Unit.from_dict(unit.to_dict())._lookup == {"a": "a"}
+    assert Unit.from_tuple(unit.to_tuple()) == unit
@@ -0,0 +1,136 @@
+import importlib.util
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+
+from test_async_downloaders import JUDGEMENT_TOC_XML, JUDGEMENT_XML, LAW_TOC_XML, LAW_XML, make_zip
+
+REAL_CLIENT = httpx.Client
+REAL_ASYNC_CLIENT = httpx.AsyncClient
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path == '/gii-toc.xml':
+        return httpx.Response(200, text=LAW_TOC_XML)
+    if path == '/rii-toc.xml':
+        return httpx.Response(200, text=JUDGEMENT_TOC_XML)
+    if path.endswith('xml.zip'):
+        return httpx.Response(200, content=make_zip(LAW_XML))
+    return httpx.Response(200, content=make_zip(JUDGEMENT_XML))
+
+
+def mock_transport_clients():
+    """Patches httpx.Client/AsyncClient so they answer from handler() and records their construction."""
+    clients = []
+
+    def client(**kwargs):
+        clients.append(REAL_CLIENT(transport=httpx.MockTransport(handler), **kwargs))
+        return clients[-1]
+
+    def async_client(**kwargs):
+        clients.append(REAL_ASYNC_CLIENT(transport=httpx.MockTransport(handler), **kwargs))
+        return clients[-1]
+
+    return clients, patch('httpx.Client', side_effect=client), patch('httpx.AsyncClient', side_effect=async_client)
+
+
+class TestSyncSession:
+    def test_sync_methods_share_one_client(self):
+        clients, client_patch, async_patch = mock_transport_clients()
+        downloader = GermanLawDownloader()
+
+        with client_patch as client_cls, async_patch, patch('httpx.get') as get, patch('httpx.stream') as stream:
+            with downloader:
+                paths = downloader.get_all_xml_paths()
+                assert list(downloader.iter_xml_paths()) == paths
+                books = [downloader.download_law_book(path) for path in paths]
+
+        assert len(books) == 2
+        client_cls.assert_called_once()
+        get.assert_not_called()
+        stream.assert_not_called()
+        assert clients[0].is_closed
+        assert downloader._client is None
+
+    def test_limits_and_timeout_are_passed_to_the_client(self):
+        clients, client_patch, async_patch = mock_transport_clients()
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=30.0)
+        timeout = httpx.Timeout(5.0)
+
+        with client_patch as client_cls, async_patch:
+            with GermanJudgementDownloader(limits=limits, timeout=timeout) as downloader:
+                assert downloader.get_judgement_count() == 2
+
+        kwargs = client_cls.call_args.kwargs
+        assert kwargs['limits'] is limits
+        assert kwargs['timeout'] is timeout
+        assert kwargs['http2'] is False
+
+    def test_nested_session_raises(self):
+        clients, client_patch, async_patch = mock_transport_clients()
+        downloader = GermanJudgementDownloader()
+
+        with client_patch, async_patch, downloader:
+            with pytest.raises(RuntimeError, match="already open"):
+                downloader.__enter__()
+
+    def test_without_session_uses_module_functions(self):
+        response = httpx.Response(200, content=make_zip(JUDGEMENT_XML))
+        with patch('httpx.Client') as client_cls, patch('httpx.get', return_value=response) as get:
+            GermanJudgementDownloader().download_judgement("https://example.com/j1.zip")
+
+        client_cls.assert_not_called()
+        get.assert_called_once()
+
+
+class TestAsyncSession:
+    async def test_iterators_share_one_async_client(self):
+        clients, client_patch, async_patch = mock_transport_clients()
+        downloader = GermanJudgementDownloader()
+
+        with client_patch, async_patch as async_client_cls:
+            async with downloader:
+                first = [j async for j in downloader.iter_all_judgements(max_per_second=None)]
+                second = [j async for j in downloader.iter_first_n_judgements(1, max_per_second=None)]
+                # Sync methods inside an async session use the session's pooled client
+                assert downloader.get_judgement_count() == 2
+
+        assert len(first) == 2 and len(second) == 1
+        async_client_cls.assert_called_once()
+        assert all(client.is_closed for client in clients)
+        assert downloader._client is None and downloader._async_client is None
+
+    async def test_async_session_keeps_an_open_sync_session(self):
+        clients, client_patch, async_patch = mock_transport_clients()
+        downloader = GermanLawDownloader()
+
+        with client_patch, async_patch:
+            with downloader:
+                async with downloader:
+                    assert len([b async for b in downloader.iter_all_law_books(max_per_second=None)]) == 2
+                assert downloader._client is not None
+                assert len(downloader.get_all_xml_paths()) == 2
+
+        assert clients[0].is_closed
+
+    async def test_without_session_each_call_gets_its_own_client(self):
+        clients, client_patch, async_patch = mock_transport_clients()
+        downloader = GermanLawDownloader()
+
+        with client_patch, async_patch as async_client_cls:
+            for _ in range(2):
+                assert len([b async for b in downloader.iter_all_law_books(max_per_second=None)]) == 2
+
+        assert async_client_cls.call_count == 2
+        assert all(client.is_closed for client in clients)
+
+
+@pytest.mark.skipif(importlib.util.find_spec('h2') is not None, reason="h2 is installed")
+def test_http2_without_h2_raises():
+    with pytest.raises(ImportError, match="http2 extra"):
+        GermanLawDownloader(http2=True)
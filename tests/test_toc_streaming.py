@@ -0,0 +1,172 @@
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from germanlegaltexts.BaseDownloader import TocItemParser
+from germanlegaltexts.GermanJudgementDownloader import GermanJudgementDownloader
+from germanlegaltexts.GermanLawDownloader import GermanLawDownloader
+
+from test_async_downloaders import JUDGEMENT_TOC_XML, JUDGEMENT_XML, LAW_TOC_XML, make_zip
+
+
+def chunks(data: bytes, size: int = 7) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@contextmanager
+def streamed(body: bytes, status_code: int = 200):
+    response = MagicMock(status_code=status_code)
+    response.iter_bytes = lambda: iter(chunks(body))
+    yield response
+
+
+class TestTocItemParser:
+    def test_yields_items_across_chunk_boundaries(self):
+        parser = TocItemParser()
+        links = []
+        for chunk in chunks(LAW_TOC_XML.encode('utf-8'), 5):
+            links.extend(item.findtext('link') for item in parser.feed(chunk))
+        links.extend(item.findtext('link') for item in parser.close())
+
+        assert links == ["http://example.com/lawa/xml.zip", "http://example.com/lawb/xml.zip"]
+
+    def test_processed_items_are_released(self):
+        parser = TocItemParser()
+        items = list(parser.feed(LAW_TOC_XML.encode('utf-8')))
+        list(parser.close())
+
+        assert len(items) == 2
+        assert all(len(item) == 0 for item in items)
+        assert len(parser._root) == 0
+
+    def test_malformed_xml_raises(self):
+        parser = TocItemParser()
+        with pytest.raises(Exception):
+            list(parser.feed(b"<items><item></items>"))
+
+
+class TestSyncStreaming:
+    def test_iter_judgement_index_items(self):
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.stream', return_value=streamed(JUDGEMENT_TOC_XML.encode('utf-8'))) as stream:
+            items = list(downloader.iter_judgement_index_items())
+
+        stream.assert_called_once_with('GET', 'https://www.rechtsprechung-im-internet.de/rii-toc.xml',
+                                       follow_redirects=True)
+        assert [item.aktenzeichen for item in items] == ["IX ZB 1/23", "1 BvR 100/23"]
+        assert items[0].link == "https://example.com/j1.zip"
+        assert items[0].modified == "2023-02-01"
+
+    def test_index_items_share_repeated_values(self):
+        downloader = GermanJudgementDownloader()
+        body = JUDGEMENT_TOC_XML.encode('utf-8')
+        with patch('httpx.stream', side_effect=lambda *args, **kwargs: streamed(body)):
+            first = list(downloader.iter_judgement_index_items())
+            second = list(downloader.iter_judgement_index_items())
+
+        assert first[0].gericht is second[0].gericht
+        assert first[0].modified is second[0].modified
+
+    def test_iter_xml_paths(self):
+        downloader = GermanLawDownloader()
+        with patch('httpx.stream', return_value=streamed(LAW_TOC_XML.encode('utf-8'))):
+            paths = list(downloader.iter_xml_paths())
+
+        assert paths == ["https://example.com/lawa/xml.zip", "https://example.com/lawb/xml.zip"]
+
+    def test_get_judgement_count_streams(self):
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.stream', return_value=streamed(JUDGEMENT_TOC_XML.encode('utf-8'))), \
+             patch.object(downloader, 'get_all_judgement_index_items') as get_all:
+            assert downloader.get_judgement_count() == 2
+
+        get_all.assert_not_called()
+
+    def test_http_error_raises_value_error(self):
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.stream', return_value=streamed(b"", status_code=500)):
+            with pytest.raises(ValueError, match="HTTP 500"):
+                list(downloader.iter_judgement_index_items())
+
+    def test_parse_error_raises_value_error(self):
+        downloader = GermanLawDownloader()
+        with patch('httpx.stream', return_value=streamed(b"<items><item>")):
+            with pytest.raises(ValueError, match="Failed to parse the TOC XML file"):
+                list(downloader.iter_xml_paths())
+
+
+class TestAsyncStreaming:
+    async def test_downloads_start_before_toc_is_complete(self):
+        """The second half of the TOC is only sent once the first judgement has been downloaded."""
+        toc = JUDGEMENT_TOC_XML.encode('utf-8')
+        split = toc.index(b"<item>", toc.index(b"</item>"))
+        first_download_done = asyncio.Event()
+
+        async def aiter_bytes():
+            yield toc[:split]
+            await first_download_done.wait()
+            yield toc[split:]
+
+        toc_response = MagicMock(status_code=200)
+        toc_response.aiter_bytes = aiter_bytes
+        stream_context = MagicMock()
+        stream_context.__aenter__ = AsyncMock(return_value=toc_response)
+        stream_context.__aexit__ = AsyncMock(return_value=None)
+
+        j_response = httpx.Response(200, content=make_zip(JUDGEMENT_XML))
+
+        async def get(url, **kwargs):
+            first_download_done.set()
+            return j_response
+
+        mock_client = AsyncMock()
+        mock_client.get = get
+        mock_client.stream = MagicMock(return_value=stream_context)
+        mock_ctx = MagicMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_ctx.__aexit__ = AsyncMock(return_value=None)
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            results = await asyncio.wait_for(
+                _collect(downloader.iter_all_judgements(max_per_second=None)), timeout=5)
+
+        assert len(results) == 2
+
+    async def test_first_n_stops_reading_the_index(self):
+        read_chunks = []
+        toc = JUDGEMENT_TOC_XML.encode('utf-8')
+
+        async def aiter_bytes():
+            for chunk in chunks(toc, 16):
+                read_chunks.append(chunk)
+                yield chunk
+
+        toc_response = MagicMock(status_code=200)
+        toc_response.aiter_bytes = aiter_bytes
+        stream_context = MagicMock()
+        stream_context.__aenter__ = AsyncMock(return_value=toc_response)
+        stream_context.__aexit__ = AsyncMock(return_value=None)
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=httpx.Response(200, content=make_zip(JUDGEMENT_XML)))
+        mock_client.stream = MagicMock(return_value=stream_context)
+        mock_ctx = MagicMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_ctx.__aexit__ = AsyncMock(return_value=None)
+
+        downloader = GermanJudgementDownloader()
+        with patch('httpx.AsyncClient', return_value=mock_ctx):
+            results = await _collect(downloader.iter_first_n_judgements(1, max_per_second=None))
+
+        assert len(results) == 1
+        assert mock_client.get.call_count == 1
+        assert len(b"".join(read_chunks)) < len(toc)
+        stream_context.__aexit__.assert_called_once()
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]